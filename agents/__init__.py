@@ -1,7 +1,28 @@
-from .news_agent import NewsAgent
-from .alert_agent import AlertAgent  
-from .chat_agent import ChatAgent
-from .alert_message_agent import AlertMessageAgent
+# Agents are imported on first access (PEP 562): "import agents" does not
+# load LangChain, requests or any agent module until one is actually used
+_EXPORTS = {
+    'NewsAgent': '.news_agent',
+    'AlertAgent': '.alert_agent',
+    'ChatAgent': '.chat_agent',
+    'AlertMessageAgent': '.alert_message_agent',
+    'BatchMonitor': '.batch_monitor',
+    'MonitorDaemon': '.monitor_daemon',
+    'CheckPipeline': '.check_pipeline',
+    'AgentRegistry': '.registry'
+}
 
 
-__all__ = ['NewsAgent', 'AlertAgent', 'ChatAgent', 'AlertMessageAgent']
\ No newline at end of file
+def __getattr__(name):
+    if name in _EXPORTS:
+        from importlib import import_module
+        value = getattr(import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
+
+
+__all__ = ['NewsAgent', 'AlertAgent', 'ChatAgent', 'AlertMessageAgent', 'BatchMonitor', 'MonitorDaemon', 'CheckPipeline', 'AgentRegistry']
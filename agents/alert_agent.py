@@ -1,11 +1,30 @@
-from langchain_groq import ChatGroq
-from langchain_core.runnables import RunnablePassthrough
-from langchain_core.output_parsers import StrOutputParser
-from utils.templates import NEWS_ANALYSIS_TEMPLATE
-from utils.parsers import parse_disaster_text
-from utils.alert_sender import AlertSender
+import hashlib
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+from utils.templates import NEWS_ANALYSIS_PROMPT, NEWS_ANALYSIS_PROMPT_VERSION, NEWS_BATCH_ANALYSIS_PROMPT
+from agents.alert_sender import AlertSender
+from utils.alert_queue import FAILED
+from utils.cache import TTLCache
+from utils.metrics import get_metrics
+from utils.tokens import estimate_tokens
+from utils.triage import KeywordTriage
 from agents.alert_message_agent import AlertMessageAgent
-from config import GROQ_API_KEY
+from agents.registry import create_llm
+from config import (
+    ANALYSIS_CACHE_ENABLED, ANALYSIS_CACHE_SIZE, ANALYSIS_CACHE_TTL, ANALYSIS_MAX_REPAIRS,
+    BATCH_ANALYSIS_TOKEN_BUDGET, BATCH_ANALYSIS_MAX_LOCATIONS,
+    DISASTER_KEYWORDS, TRIAGE_ENABLED, TRIAGE_THRESHOLD
+)
+
+class AnalysisParseError(ValueError):
+    """The analysis could not be validated, even after the repair requests"""
+    
+    def __init__(self, message: str, raw_analysis: str = ""):
+        super().__init__(message)
+        self.raw_analysis = raw_analysis
 
 class AlertAgent:
     """
@@ -13,90 +32,552 @@ class AlertAgent:
     This agent uses LangChain to process news and determine if alerts are needed
     """
     
-    def __init__(self):
-        # Initialize the Groq LLM (Large Language Model) with current supported model
-        self.llm = ChatGroq(
-            groq_api_key=GROQ_API_KEY,
-            model_name="llama-3.3-70b-versatile",  # Updated to current supported model
-            temperature=0.1  # Low temperature for consistent results
-        )
+    def __init__(self, llm_factory: Optional[Callable] = None,
+                 message_agent: Optional[AlertMessageAgent] = None,
+                 alert_sender: Optional[AlertSender] = None,
+                 cache_ttl: Optional[float] = None):
+        # Groq LLM (Large Language Model) settings; the client is created on first use
+        self.model_name = "llama-3.3-70b-versatile"  # Updated to current supported model
+        self.temperature = 0.1  # Low temperature for consistent results
+        self._llm_factory = llm_factory or create_llm
+        self._llm = None
+        self._analysis_chain = None
+        self._repair_chain = None
+        self._batch_analysis_chain = None
+        
+        # Structured output: analyses are validated against DisasterAnalysis,
+        # with a bounded number of repair requests when validation fails
+        self.max_repairs = ANALYSIS_MAX_REPAIRS
+        self.parse_stats = {'parsed': 0, 'repaired': 0, 'failed': 0, 'repair_calls': 0}
         
-        # Initialize alert sender and message generator
-        self.alert_sender = AlertSender()
-        self.message_agent = AlertMessageAgent()
+        # Keyword triage: news without any hazard mention never reaches the LLM
+        self.triage_enabled = TRIAGE_ENABLED
+        self.triage = KeywordTriage(DISASTER_KEYWORDS, threshold=TRIAGE_THRESHOLD)
+        self.triage_stats = {'checked': 0, 'llm_calls_avoided': 0}
+        self._stats_lock = threading.Lock()
         
-        # Create a CHAIN: Template → LLM → Parser
-        # This is like a pipeline that processes data step by step
-        self.analysis_chain = (
-            NEWS_ANALYSIS_TEMPLATE 
-            | self.llm 
-            | StrOutputParser()
+        # Batched analysis: several locations share one request, up to a
+        # prompt token budget and a maximum number of locations
+        self.batch_token_budget = BATCH_ANALYSIS_TOKEN_BUDGET
+        self.batch_max_locations = BATCH_ANALYSIS_MAX_LOCATIONS
+        self.batch_stats = {'requests': 0, 'locations': 0, 'fallbacks': 0}
+        
+        # Content-addressed cache of parsed analyses (identical news → no LLM call)
+        self.cache_enabled = ANALYSIS_CACHE_ENABLED
+        self.analysis_cache = TTLCache(
+            max_size=ANALYSIS_CACHE_SIZE,
+            ttl=ANALYSIS_CACHE_TTL if cache_ttl is None else cache_ttl
         )
+        
+        # Initialize alert sender and message generator (shared when provided)
+        self.alert_sender = alert_sender or AlertSender()
+        self.message_agent = message_agent or AlertMessageAgent(llm_factory=llm_factory)
+    
+    @property
+    def llm(self):
+        """Groq client, created on first use"""
+        if self._llm is None:
+            self._llm = self._llm_factory(self.model_name, self.temperature)
+        return self._llm
     
-    def analyze_and_alert(self, news_data: str, user_location: str) -> dict:
+    @property
+    def json_llm(self):
+        """The Groq client in JSON mode (the reply must be one JSON object)"""
+        from langchain_core.language_models import BaseChatModel
+        if isinstance(self.llm, BaseChatModel):
+            return self.llm.bind(response_format={"type": "json_object"})
+        return self.llm
+    
+    @property
+    def analysis_chain(self):
+        """
+        Create a CHAIN: Template → LLM → Parser
+        This is like a pipeline that processes data step by step
+        """
+        if self._analysis_chain is None:
+            from langchain_core.output_parsers import StrOutputParser
+            from utils.templates import NEWS_ANALYSIS_TEMPLATE
+            self._analysis_chain = (
+                NEWS_ANALYSIS_TEMPLATE 
+                | self.json_llm 
+                | StrOutputParser()
+            )
+        return self._analysis_chain
+    
+    @analysis_chain.setter
+    def analysis_chain(self, chain):
+        self._analysis_chain = chain
+    
+    @property
+    def repair_chain(self):
+        """Repair chain: asks the AI to rewrite an invalid analysis as JSON"""
+        if self._repair_chain is None:
+            from langchain_core.output_parsers import StrOutputParser
+            from utils.templates import NEWS_ANALYSIS_REPAIR_TEMPLATE
+            self._repair_chain = (
+                NEWS_ANALYSIS_REPAIR_TEMPLATE
+                | self.json_llm
+                | StrOutputParser()
+            )
+        return self._repair_chain
+    
+    @repair_chain.setter
+    def repair_chain(self, chain):
+        self._repair_chain = chain
+    
+    @property
+    def batch_analysis_chain(self):
+        """Batched chain: one request, one JSON verdict per location"""
+        if self._batch_analysis_chain is None:
+            from langchain_core.output_parsers import StrOutputParser
+            from utils.templates import NEWS_BATCH_ANALYSIS_TEMPLATE
+            self._batch_analysis_chain = (
+                NEWS_BATCH_ANALYSIS_TEMPLATE
+                | self.json_llm
+                | StrOutputParser()
+            )
+        return self._batch_analysis_chain
+    
+    @batch_analysis_chain.setter
+    def batch_analysis_chain(self, chain):
+        self._batch_analysis_chain = chain
+    
+    def analyze_and_alert(self, news_data: str, user_location: str, send_alert: bool = True,
+                          generate_message: bool = True) -> dict:
         """
         Main method: Analyze news and send professional alerts if needed
         
         Steps:
+        0. Keyword triage (no hazard mentioned → "no threat" without the LLM)
         1. Use AI to analyze news data
         2. Parse the results
         3. If disaster found, generate professional alert message
-        4. Send alert via configured platform
+        4. Queue alert for delivery (skipped when send_alert is False)
+        
+        With generate_message=False (and send_alert=False) step 3 is
+        skipped too and "alert_message" is empty, for callers that decide
+        themselves whether an alert is worth writing
         
         Returns:
-            Dictionary with analysis results and alert status
+            Dictionary with analysis results and alert status. "alert_sent"
+            means the alert was accepted by the delivery queue; follow
+            "alert_handle" for the actual Discord delivery. "timings" holds
+            the seconds spent in each step (triage, analysis, message,
+            dispatch) and "triage" the keyword score of the news.
         """
+        timings = {}
+        triage = None
         try:
-            # Step 1: Analyze news using AI
-            analysis_result = self.analysis_chain.invoke({
-                "news_data": news_data,
-                "user_location": user_location
-            })
+            # Step 0: Keyword triage
+            triage = self._run_triage(news_data, timings)
             
-            # Step 2: Parse the analysis result
-            parsed_result = parse_disaster_text(analysis_result)
+            # Step 1 + 2: Analyze news using AI and parse the result
+            # (served from the analysis cache when the news is unchanged)
+            started = time.perf_counter()
+            if triage and not triage["passed"]:
+                parsed_result, analysis_result, cached = self._triage_no_threat(), "", False
+            else:
+                parsed_result, analysis_result, cached = self._analyze(news_data, user_location)
+            timings["analysis"] = time.perf_counter() - started
             
-            # Step 3: Generate and send alert if disaster found
-            alert_sent = False
-            alert_message = ""
+            # Step 3 + 4: alert message and delivery
+            return self._finish(parsed_result, analysis_result, cached, user_location,
+                                send_alert, timings, triage, generate_message)
             
+        except Exception as e:
+            print(f"Error in analyze_and_alert: {e}")
+            return self._error_result(e, timings, triage)
+    
+    def _finish(self, parsed_result: dict, analysis_result: str, cached: bool, user_location: str,
+                send_alert: bool, timings: dict, triage: Optional[dict],
+                generate_message: bool = True) -> dict:
+        """Generate the alert message for an analysis and queue it (steps 3 and 4)"""
+        alert_sent = False
+        alert_handle = None
+        alert_message = ""
+        
+        # Step 3: Generate the alert message (professional alert or all clear)
+        if generate_message or send_alert:
+            started = time.perf_counter()
             if parsed_result["disaster_found"]:
                 # Generate professional alert message using dedicated agent
                 alert_message = self.message_agent.generate_professional_alert(
                     parsed_result, user_location
                 )
-                
-                # Send the professional alert
-                alert_sent = self.alert_sender.send_alert(alert_message)
             else:
-                # Send "all clear" message
+                # "All clear" message
                 alert_message = self.message_agent.generate_no_threat_message(user_location)
-                alert_sent = self.alert_sender.send_alert(alert_message)
-            
-            return {
-                "analysis": parsed_result,
-                "alert_sent": alert_sent,
-                "alert_message": alert_message,
-                "raw_analysis": analysis_result
-            }
-            
-        except Exception as e:
-            print(f"Error in analyze_and_alert: {e}")
-            return {
-                "analysis": {
-                    "disaster_found": False,
-                    "error": str(e)
-                },
-                "alert_sent": False,
-                "alert_message": "",
-                "raw_analysis": ""
-            }
-    
-    def send_test_alert(self) -> bool:
-        """Send a professional test alert to verify the system is working"""
+            timings["message"] = time.perf_counter() - started
+        
+        # Step 4: Queue the alert (delivered in the background)
+        if send_alert:
+            started = time.perf_counter()
+            severity = parsed_result.get("severity") if parsed_result["disaster_found"] else None
+            alert_handle = self.alert_sender.send_alert(alert_message, severity=severity)
+            alert_sent = alert_handle.status != FAILED
+            timings["dispatch"] = time.perf_counter() - started
+        
+        return {
+            "analysis": parsed_result,
+            "alert_sent": alert_sent,
+            "alert_handle": alert_handle,
+            "alert_message": alert_message,
+            "raw_analysis": analysis_result,
+            "cached": cached,
+            "timings": timings,
+            "triage": triage
+        }
+    
+    @staticmethod
+    def _error_result(error: Exception, timings: dict, triage: Optional[dict]) -> dict:
+        """
+        analyze_and_alert result for a check that raised (including an
+        unreadable analysis): no alert or all-clear is sent
+        """
+        return {
+            "analysis": {
+                "disaster_found": False,
+                "error": str(error)
+            },
+            "alert_sent": False,
+            "alert_handle": None,
+            "alert_message": "",
+            "raw_analysis": getattr(error, "raw_analysis", ""),
+            "cached": False,
+            "timings": timings,
+            "triage": triage
+        }
+    
+    def _run_triage(self, news_data: str, timings: dict) -> Optional[dict]:
+        """Keyword score of the news (None when triage is disabled)"""
+        if not self.triage_enabled:
+            return None
+        started = time.perf_counter()
+        triage = self.triage.score(news_data)
+        timings["triage"] = time.perf_counter() - started
+        self._count_triage(skipped=not triage["passed"])
+        if not triage["passed"]:
+            get_metrics().inc("llm_calls_avoided", reason="triage")
+        return triage
+    
+    @staticmethod
+    def _triage_no_threat() -> dict:
+        """Analysis result for news that mentions no hazard at all"""
+        return {
+            "disaster_found": False,
+            "disaster_type": "None",
+            "severity": "Low",
+            "description": "No disaster-related keywords found in recent news",
+            "actions": "Stay alert and follow local news"
+        }
+    
+    def _count_triage(self, skipped: bool):
+        with self._stats_lock:
+            self.triage_stats['checked'] += 1
+            self.triage_stats['llm_calls_avoided'] += skipped
+    
+    def get_triage_stats(self) -> dict:
+        """How many checks were triaged and how many LLM calls that avoided"""
+        with self._stats_lock:
+            return dict(self.triage_stats, threshold=self.triage.threshold)
+    
+    def _analysis_cache_key(self, news_data: str, user_location: str) -> str:
+        """
+        Hash of everything that determines the analysis: the formatted news,
+        the location, the model and the prompt (version + exact wording)
+        """
+        digest = hashlib.sha256()
+        for part in (
+            news_data,
+            " ".join(user_location.lower().split()),
+            self.model_name,
+            NEWS_ANALYSIS_PROMPT_VERSION,
+            NEWS_ANALYSIS_PROMPT
+        ):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\x00")
+        return digest.hexdigest()
+    
+    def _analyze(self, news_data: str, user_location: str) -> tuple:
+        """
+        Run the analysis chain, or reuse a cached result for identical input
+        
+        Returns:
+            (parsed_result, raw_analysis, cached)
+        """
+        cached = self._cached_analysis(news_data, user_location)
+        if cached is not None:
+            return cached
+        
+        with get_metrics().span("llm", chain="analysis"):
+            analysis_result = self.analysis_chain.invoke({
+                "news_data": news_data,
+                "user_location": user_location
+            })
+        parsed_result, analysis_result = self._parse_analysis(analysis_result)
+        self._store_analysis(news_data, user_location, parsed_result, analysis_result)
+        return parsed_result, analysis_result, False
+    
+    def _cached_analysis(self, news_data: str, user_location: str) -> Optional[tuple]:
+        """(parsed_result, raw_analysis, True) from the analysis cache, or None"""
+        if not self.cache_enabled:
+            return None
+        cached, _ = self.analysis_cache.get(self._analysis_cache_key(news_data, user_location))
+        if cached is None:
+            return None
+        parsed_result, analysis_result = cached
+        get_metrics().inc("llm_calls_avoided", reason="analysis_cache")
+        return dict(parsed_result), analysis_result, True
+    
+    def _store_analysis(self, news_data: str, user_location: str, parsed_result: dict, analysis_result: str):
+        if self.cache_enabled:
+            key = self._analysis_cache_key(news_data, user_location)
+            self.analysis_cache.set(key, (dict(parsed_result), analysis_result))
+    
+    def analyze_batch(self, checks: List[Tuple[str, str]], send_alert: bool = True,
+                      concurrency: int = 1, generate_message: bool = True) -> List[dict]:
+        """
+        Batched version of analyze_and_alert for many locations
+        
+        Triage and the analysis cache are applied per location. The rest
+        are packed into as few analysis requests as the token budget and
+        batch_max_locations allow, each returning one verdict per location.
+        A location whose verdict is missing or unreadable is analyzed on its
+        own. Alert messages and delivery are the same as analyze_and_alert.
+        
+        Args:
+            checks: (location, formatted news) pairs
+            send_alert: Whether to queue the alerts
+            concurrency: Batched requests sent at the same time
+            generate_message: Write alert messages even when not sending
+        
+        Returns:
+            One analyze_and_alert result per check, in order, each with
+            "batch_size" (locations in the request that analyzed it, 0 when
+            no request was needed)
+        """
+        timings = [{} for _ in checks]
+        triages = [None] * len(checks)
+        analyses: Dict[int, object] = {}
+        batch_sizes = [0] * len(checks)
+        pending = []
+        
+        for index, (location, news_data) in enumerate(checks):
+            triage = triages[index] = self._run_triage(news_data, timings[index])
+            if triage and not triage["passed"]:
+                analyses[index] = (self._triage_no_threat(), "", False)
+                continue
+            cached = self._cached_analysis(news_data, location)
+            if cached is not None:
+                analyses[index] = cached
+                continue
+            pending.append((index, location, news_data))
+        
+        def run(batch):
+            started = time.perf_counter()
+            try:
+                outcome = self._analyze_packed(batch)
+            except Exception as e:
+                print(f"Error in batched analysis: {e}")
+                outcome = {index: e for index, _, _ in batch}
+            elapsed = time.perf_counter() - started
+            for index, _, _ in batch:
+                timings[index]["analysis"] = elapsed
+                batch_sizes[index] = len(batch)
+            return outcome
+        
+        batches = self._pack_batches(pending)
+        if batches:
+            with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(batches))),
+                                    thread_name_prefix="batch-analyze") as executor:
+                for outcome in executor.map(run, batches):
+                    analyses.update(outcome)
+        
+        results = []
+        for index, (location, _) in enumerate(checks):
+            analysis = analyses[index]
+            try:
+                if isinstance(analysis, Exception):
+                    raise analysis
+                parsed_result, analysis_result, cached = analysis
+                result = self._finish(parsed_result, analysis_result, cached, location,
+                                      send_alert, timings[index], triages[index], generate_message)
+            except Exception as e:
+                result = self._error_result(e, timings[index], triages[index])
+            result["batch_size"] = batch_sizes[index]
+            results.append(result)
+        return results
+    
+    def _pack_batches(self, pending: List[tuple]) -> List[List[tuple]]:
+        """
+        Greedily fill requests in order while the packed news stays within
+        the token budget (a location larger than the budget goes alone)
+        """
+        budget = self.batch_token_budget - estimate_tokens(NEWS_BATCH_ANALYSIS_PROMPT)
+        batches, current, used = [], [], 0
+        for item in pending:
+            cost = estimate_tokens(self._format_batch([item]))
+            if current and (used + cost > budget or len(current) >= self.batch_max_locations):
+                batches.append(current)
+                current, used = [], 0
+            current.append(item)
+            used += cost
+        if current:
+            batches.append(current)
+        return batches
+    
+    @staticmethod
+    def _format_batch(batch: List[tuple]) -> str:
+        """The locations_news block of the batched prompt"""
+        return "\n\n".join(
+            f"=== Location {number}: {location} ===\n{news_data.strip()}"
+            for number, (_, location, news_data) in enumerate(batch, 1)
+        )
+    
+    def _analyze_packed(self, batch: List[tuple]) -> Dict[int, tuple]:
+        """
+        Analyze one packed request
+        
+        Returns:
+            {check index: (parsed_result, raw_analysis, cached), or the
+            exception when that location's own analysis failed}
+        """
+        if len(batch) == 1:
+            index, location, news_data = batch[0]
+            return {index: self._analyze(news_data, location)}
+        
+        from langchain_core.exceptions import OutputParserException
+        from utils.parsers import parse_batch_disaster_json
+        
+        metrics = get_metrics()
+        with metrics.span("llm", chain="batch_analysis"):
+            raw = self.batch_analysis_chain.invoke({"locations_news": self._format_batch(batch)})
+        try:
+            with metrics.span("parse"):
+                verdicts = parse_batch_disaster_json(raw)
+        except OutputParserException as e:
+            print(f"⚠️ Batched analysis did not match the JSON format: {str(e).splitlines()[0]}")
+            verdicts = []
+        matched = self._match_verdicts(batch, verdicts)
+        
+        results = {}
+        for index, location, news_data in batch:
+            verdict = matched.get(index)
+            if verdict is None:
+                # Missing or unreadable verdict: analyze this location on its own
+                self._count_batch(fallbacks=1)
+                metrics.inc("batch_fallbacks")
+                try:
+                    results[index] = self._analyze(news_data, location)
+                except Exception as e:
+                    results[index] = e  # reported as this location's error
+                continue
+            verdict_raw = json.dumps(dict(verdict, location=location))
+            self._store_analysis(news_data, location, verdict, verdict_raw)
+            results[index] = (verdict, verdict_raw, False)
+        # Only locations the request actually answered count as saved calls
+        self._count_batch(requests=1, locations=len(matched))
+        metrics.inc("llm_calls_avoided", max(0, len(matched) - 1), reason="batched")
+        return results
+    
+    @staticmethod
+    def _match_verdicts(batch: List[tuple], verdicts: List[dict]) -> Dict[int, dict]:
+        """
+        Map verdicts back to checks by location name, or by position when
+        the model renamed a location but returned exactly one verdict each
+        """
+        normalize = lambda text: " ".join(str(text).lower().split())
+        by_location = {}
+        for verdict in verdicts:
+            by_location.setdefault(normalize(verdict["location"]), verdict)
+        
+        matched = {}
+        for position, (index, location, _) in enumerate(batch):
+            verdict = by_location.get(normalize(location))
+            if verdict is None and len(verdicts) == len(batch):
+                verdict = verdicts[position]
+            if verdict is not None:
+                matched[index] = {key: value for key, value in verdict.items() if key != "location"}
+        return matched
+    
+    def _count_batch(self, **counts):
+        with self._stats_lock:
+            for stat, value in counts.items():
+                self.batch_stats[stat] += value
+    
+    def get_batch_stats(self) -> dict:
+        """Batched requests sent, locations they answered and per-location fallbacks"""
+        with self._stats_lock:
+            stats = dict(self.batch_stats)
+        stats['locations_per_request'] = round(stats['locations'] / stats['requests'], 2) if stats['requests'] else 0.0
+        return stats
+    
+    def _parse_analysis(self, analysis_result: str) -> tuple:
+        """
+        Validate the analysis against DisasterAnalysis, asking the AI to
+        repair it (at most max_repairs times) if it does not validate
+        
+        Returns:
+            (parsed_result, raw_analysis)
+        
+        Raises:
+            AnalysisParseError: every attempt failed. The check fails rather
+            than report "no disaster" for an analysis nobody could read
+        """
+        from langchain_core.exceptions import OutputParserException
+        from utils.parsers import parse_disaster_json
+        
+        metrics = get_metrics()
+        raw = analysis_result
+        for attempt in range(self.max_repairs + 1):
+            try:
+                with metrics.span("parse"):
+                    parsed_result = parse_disaster_json(raw)
+                self._count('repaired' if attempt else 'parsed')
+                return parsed_result, raw
+            except OutputParserException as e:
+                error = str(e).splitlines()[0]
+            if attempt == self.max_repairs:
+                break
+            self._count('repair_calls')
+            try:
+                with metrics.span("llm", chain="repair"):
+                    raw = self.repair_chain.invoke({"analysis": raw, "error": error})
+            except Exception as e:
+                error = f"repair request failed: {e}"
+                break
+        
+        self._count('failed')
+        print(f"⚠️ Analysis did not match the JSON format: {error}")
+        raise AnalysisParseError(f"Analysis could not be read: {error}", analysis_result)
+    
+    def _count(self, stat: str):
+        with self._stats_lock:
+            self.parse_stats[stat] += 1
+        if stat != 'repair_calls':
+            get_metrics().inc("parse_outcomes", outcome=stat)
+    
+    def get_parse_stats(self) -> dict:
+        """How many analyses validated first time, needed a repair, or failed"""
+        with self._stats_lock:
+            stats = dict(self.parse_stats)
+        total = stats['parsed'] + stats['repaired'] + stats['failed']
+        stats['failure_rate'] = round(stats['failed'] / total, 4) if total else 0.0
+        return stats
+    
+    def invalidate_analysis_cache(self):
+        """Drop every cached analysis (call after changing the analysis prompt or model)"""
+        self.analysis_cache.invalidate()
+    
+    def get_analysis_cache_stats(self) -> dict:
+        """Hit/miss statistics for the analysis cache"""
+        return self.analysis_cache.get_stats()
+    
+    def send_test_alert(self, timeout: float = 30) -> bool:
+        """Send a professional test alert and wait for Discord to confirm delivery"""
         test_message = self.message_agent.generate_test_alert()
-        return self.alert_sender.send_alert(test_message)
+        return self.alert_sender.send_alert(test_message).wait(timeout)
     
-    def send_custom_alert(self, message: str) -> bool:
-        """Send a custom alert message"""
-        return self.alert_sender.send_alert(message)
+    def send_custom_alert(self, message: str, severity: str = None):
+        """Queue a custom alert message and return its delivery handle"""
+        return self.alert_sender.send_alert(message, severity=severity)
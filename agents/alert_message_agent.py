@@ -1,8 +1,9 @@
-from langchain_groq import ChatGroq
-from langchain_core.output_parsers import StrOutputParser
-from langchain_core.prompts import PromptTemplate
-from config import GROQ_API_KEY
+from agents.registry import create_llm
+from utils.metrics import get_metrics
+from utils.severity import SEVERITY_RANK
+from config import ALERT_LLM_MIN_SEVERITY
 from datetime import datetime
+from typing import Callable, Optional
 
 class AlertMessageAgent:
     """
@@ -11,57 +12,85 @@ class AlertMessageAgent:
     that include all necessary information for disaster response
     """
     
-    def __init__(self):
-        # Initialize specialized LLM for alert message generation
-        self.llm = ChatGroq(
-            groq_api_key=GROQ_API_KEY,
-            model_name="llama-3.3-70b-versatile",
-            temperature=0.3  # Balanced temperature for professional but adaptive messaging
-        )
+    def __init__(self, llm_factory: Optional[Callable] = None,
+                 llm_min_severity: str = ALERT_LLM_MIN_SEVERITY):
+        # Specialized LLM settings for alert message generation (client created on first use)
+        self.model_name = "llama-3.3-70b-versatile"
+        self.temperature = 0.3  # Balanced temperature for professional but adaptive messaging
+        self._llm_factory = llm_factory or create_llm
+        self._llm = None
+        self._alert_chain = None
+        self._alert_template = None
         
-        # Professional alert message template
-        self.alert_template = PromptTemplate(
-            input_variables=[
-                "disaster_type", "location", "severity", "description", 
-                "timestamp", "recommended_actions", "emergency_contacts"
-            ],
-            template="""
-            You are a professional emergency alert system. Create a comprehensive, well-formatted disaster alert message.
-
-            DISASTER INFORMATION:
-            - Type: {disaster_type}
-            - Location: {location}  
-            - Severity Level: {severity}
-            - Description: {description}
-            - Time: {timestamp}
-            - Recommended Actions: {recommended_actions}
-
-            Create a professional emergency alert that includes:
-            1. Clear, attention-grabbing header with appropriate emoji
-            2. Essential disaster information in organized sections
-            3. Severity level with visual indicators
-            4. Specific location details
-            5. Immediate action steps
-            6. Safety recommendations
-            7. Professional closing with authority reference
-
-            Format the message to be:
-            - CLEAR and EASY TO READ
-            - PROFESSIONAL but URGENT in tone  
-            - COMPREHENSIVE with all critical details
-            - ACTION-ORIENTED with specific steps
-            - WELL-STRUCTURED with proper sections
-
-            Generate the complete alert message:
-            """
-        )
-        
-        # Create the alert generation chain
-        self.alert_chain = (
-            self.alert_template
-            | self.llm
-            | StrOutputParser()
-        )
+        # Severity policy: below this level the alert is rendered locally
+        # from the template (no Groq call); "off" disables LLM messages
+        self.llm_min_severity = llm_min_severity
+        self.stats = {'llm': 0, 'template': 0, 'llm_failures': 0}
+    
+    @property
+    def alert_template(self):
+        """Professional alert message template (built on first use)"""
+        if self._alert_template is None:
+            from langchain_core.prompts import PromptTemplate
+            self._alert_template = PromptTemplate(
+                input_variables=[
+                    "disaster_type", "location", "severity", "description", 
+                    "timestamp", "recommended_actions", "emergency_contacts"
+                ],
+                template="""
+                You are a professional emergency alert system. Create a comprehensive, well-formatted disaster alert message.
+
+                DISASTER INFORMATION:
+                - Type: {disaster_type}
+                - Location: {location}  
+                - Severity Level: {severity}
+                - Description: {description}
+                - Time: {timestamp}
+                - Recommended Actions: {recommended_actions}
+
+                Create a professional emergency alert that includes:
+                1. Clear, attention-grabbing header with appropriate emoji
+                2. Essential disaster information in organized sections
+                3. Severity level with visual indicators
+                4. Specific location details
+                5. Immediate action steps
+                6. Safety recommendations
+                7. Professional closing with authority reference
+
+                Format the message to be:
+                - CLEAR and EASY TO READ
+                - PROFESSIONAL but URGENT in tone  
+                - COMPREHENSIVE with all critical details
+                - ACTION-ORIENTED with specific steps
+                - WELL-STRUCTURED with proper sections
+
+                Generate the complete alert message:
+                """
+            )
+        return self._alert_template
+    
+    @property
+    def llm(self):
+        """Groq client, created on first use"""
+        if self._llm is None:
+            self._llm = self._llm_factory(self.model_name, self.temperature)
+        return self._llm
+    
+    @property
+    def alert_chain(self):
+        """The alert generation chain: Template → LLM → Parser"""
+        if self._alert_chain is None:
+            from langchain_core.output_parsers import StrOutputParser
+            self._alert_chain = (
+                self.alert_template
+                | self.llm
+                | StrOutputParser()
+            )
+        return self._alert_chain
+    
+    @alert_chain.setter
+    def alert_chain(self, chain):
+        self._alert_chain = chain
     
     def generate_professional_alert(self, disaster_info: dict, location: str) -> str:
         """
@@ -74,6 +103,11 @@ class AlertMessageAgent:
         Returns:
             Professional formatted alert message
         """
+        if not self.uses_llm(disaster_info.get('severity')):
+            self.stats['template'] += 1
+            get_metrics().inc("llm_calls_avoided", reason="alert_template")
+            return self._generate_fallback_alert(disaster_info, location)
+        
         try:
             # Get current timestamp
             current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S UTC")
@@ -85,31 +119,61 @@ class AlertMessageAgent:
             actions = disaster_info.get('actions', 'Follow local authority guidance')
             
             # Generate professional alert message
-            alert_message = self.alert_chain.invoke({
-                "disaster_type": disaster_type,
-                "location": location,
-                "severity": severity,
-                "description": description,
-                "timestamp": current_time,
-                "recommended_actions": actions,
-                "emergency_contacts": "Contact local emergency services: 911 (US), 112 (EU), 999 (UK)"
-            })
+            with get_metrics().span("llm", chain="alert_message"):
+                alert_message = self.alert_chain.invoke({
+                    "disaster_type": disaster_type,
+                    "location": location,
+                    "severity": severity,
+                    "description": description,
+                    "timestamp": current_time,
+                    "recommended_actions": actions,
+                    "emergency_contacts": "Contact local emergency services: 911 (US), 112 (EU), 999 (UK)"
+                })
             
+            self.stats['llm'] += 1
             return alert_message
             
         except Exception as e:
             # Fallback to basic alert if AI generation fails
+            self.stats['llm_failures'] += 1
             return self._generate_fallback_alert(disaster_info, location)
     
+    @staticmethod
+    def _severity_rank(severity: Optional[str]) -> Optional[int]:
+        """Highest severity level named in the text ("Medium-High" → High), None if unrecognized"""
+        text = str(severity or "").lower()
+        ranks = [rank for name, rank in SEVERITY_RANK.items() if name in text]
+        return max(ranks) if ranks else None
+    
+    def uses_llm(self, severity: Optional[str]) -> bool:
+        """
+        Whether an alert of this severity gets an LLM-written message.
+        Unrecognized severities go to the LLM rather than risk understating them
+        """
+        threshold = self._severity_rank(self.llm_min_severity)
+        if threshold is None:
+            return False
+        rank = self._severity_rank(severity)
+        return rank is None or rank >= threshold
+    
+    def get_stats(self) -> dict:
+        """How many alert messages were LLM-written vs rendered from the template"""
+        return dict(self.stats, llm_min_severity=self.llm_min_severity)
+    
     def _generate_fallback_alert(self, disaster_info: dict, location: str) -> str:
         """
-        Generate a basic alert if the AI system fails
+        Generate a structured alert locally: used below the LLM severity
+        threshold and whenever the AI system fails
         """
         disaster_type = disaster_info.get('disaster_type', 'Emergency')
         severity = disaster_info.get('severity', 'Unknown')
         description = disaster_info.get('description', 'Emergency situation detected')
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
+        # Put the analysis' own recommendation ahead of the standard steps
+        actions = str(disaster_info.get('actions') or '').strip()
+        recommended = f"• {actions}\n" if actions else ""
+        
         return f"""
 🚨 EMERGENCY ALERT 🚨
 
@@ -122,7 +186,7 @@ SITUATION:
 {description}
 
 IMMEDIATE ACTIONS:
-• Stay calm and alert
+{recommended}• Stay calm and alert
 • Follow local emergency guidance
 • Keep emergency supplies ready
 • Monitor official communications
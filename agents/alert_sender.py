@@ -1,20 +1,44 @@
 import requests
 import json
-import os
+import threading
 import time
-from dotenv import load_dotenv
+from typing import List, Optional
+from utils.http_pool import get_http_pool
+from utils.metrics import get_metrics
+from utils.rate_limiter import get_discord_rate_limiter
+from utils.severity import SEVERITY_RANK
+from utils.alert_queue import DeliveryHandle, get_alert_dispatcher, SENT, RETRY, FAILED
+from config import (
+    DISCORD_WEBHOOK_URL, DISCORD_WEBHOOK_PREFIX, ALERT_DIGEST_MODE, ALERT_DIGEST_WINDOW, ALERT_DIGEST_MAX_BUFFER, ALERT_DIGEST_BYPASS_SEVERITY
+)
+
+# Discord message limits (https://discord.com/developers/docs/resources/message#embed-object-embed-limits)
+DISCORD_MAX_EMBEDS = 10
+DISCORD_EMBED_TITLE_LIMIT = 256
+DISCORD_EMBED_DESCRIPTION_LIMIT = 4096
+DISCORD_EMBEDS_TOTAL_LIMIT = 6000
+
+SEVERITY_COLORS = {"low": 0xF1C40F, "medium": 0xE67E22, "high": 0xE74C3C, "critical": 0x8E0000}
+NO_SEVERITY_COLOR = 0x2ECC71
 
 class AlertSender:
     """
     ALERT SENDER: Sends alerts to Discord with improved reliability
-    Now includes better error handling, retry logic, and connection testing
+    Now includes better error handling, retry logic, and connection testing.
+    Alerts are delivered by a background queue so callers never block
     """
     
-    def __init__(self):
-        # Load environment variables
-        load_dotenv()
-        # Get Discord webhook URL from environment
-        self.discord_webhook = os.getenv("DISCORD_WEBHOOK_URL")
+    def __init__(self, digest: bool = ALERT_DIGEST_MODE):
+        # Digest mode: buffer alerts briefly and pack them into embed messages
+        self.digest = digest
+        self.digest_window = ALERT_DIGEST_WINDOW
+        self._digest_buffer = []  # (handle, message, severity)
+        self._digest_timer: Optional[threading.Timer] = None
+        self._digest_lock = threading.Lock()
+        
+        # Discord webhook URL (loaded from .env once, in config.py)
+        self.discord_webhook = DISCORD_WEBHOOK_URL
+        self.webhook_prefix = DISCORD_WEBHOOK_PREFIX
         
         # Validate webhook URL on initialization
         if self.discord_webhook:
@@ -30,52 +54,222 @@ class AlertSender:
         return (
             url and 
             url.strip() != "" and 
-            url.startswith("https://discord.com/api/webhooks/") and
+            url.startswith(self.webhook_prefix) and
             len(url.split('/')) >= 7  # Basic URL structure check
         )
     
-    def send_discord_alert(self, message: str) -> bool:
+    def send_discord_alert(self, message: str, timeout: float = None) -> bool:
         """
-        Send alert to Discord channel via webhook with retry logic
+        Send alert to Discord and wait for the delivery result
         
         Args:
             message: Alert message to send
+            timeout: Maximum seconds to wait (None waits for the final outcome)
             
         Returns:
             bool: True if message sent successfully, False otherwise
         """
+        return self.send_alert(message).wait(timeout)
+    
+    def send_alert(self, message: str, platform: str = "discord", severity: str = None) -> DeliveryHandle:
+        """
+        Main method to send alerts - queues the message and returns at once
+        
+        The background dispatcher retries with exponential backoff and jitter.
+        Use handle.status / handle.wait() / `await handle` to follow delivery.
+        In digest mode the alert is buffered for a short window and packed
+        with others, unless its severity is at or above the bypass level.
+        """
+        if platform.lower() != "discord":
+            print(f"Platform {platform} not supported yet")
+            return self._rejected(message, f"Platform {platform} not supported")
+        
         if not self._validate_webhook_url(self.discord_webhook):
             print("❌ Discord webhook URL is invalid or not configured")
-            return False
+            return self._rejected(message, "Discord webhook URL is invalid or not configured")
+        
+        if self.digest and not self._bypasses_digest(severity):
+            return self._buffer_for_digest(message, severity)
         
         payload = {
             "content": message,
             "username": "ReDAC • Critical Alert System",
             "avatar_url": "https://cdn-icons-png.flaticon.com/512/564/564619.png"
         }
+        return get_alert_dispatcher().submit(lambda: self._post_discord(payload), message)
+    
+    def _bypasses_digest(self, severity: Optional[str]) -> bool:
+        """Alerts at or above the bypass severity skip the digest buffer"""
+        rank = SEVERITY_RANK.get(str(severity or "").strip().lower(), 0)
+        return rank >= SEVERITY_RANK.get(ALERT_DIGEST_BYPASS_SEVERITY.lower(), 4)
+    
+    def _buffer_for_digest(self, message: str, severity: Optional[str]) -> DeliveryHandle:
+        """Add an alert to the digest buffer, starting the flush timer if needed"""
+        handle = DeliveryHandle(message)
+        with self._digest_lock:
+            self._digest_buffer.append((handle, message, severity))
+            if len(self._digest_buffer) >= ALERT_DIGEST_MAX_BUFFER:
+                flush_now = True
+            else:
+                flush_now = False
+                if self._digest_timer is None:
+                    self._digest_timer = threading.Timer(self.digest_window, self.flush_digest)
+                    self._digest_timer.start()
+        if flush_now:
+            self.flush_digest()
+        return handle
+    
+    def flush_digest(self) -> int:
+        """
+        Pack every buffered alert into as few webhook calls as possible
         
-        # Retry logic with exponential backoff
-        max_retries = 3
-        base_delay = 2
+        Returns:
+            Number of webhook messages queued
+        """
+        with self._digest_lock:
+            entries, self._digest_buffer = self._digest_buffer, []
+            if self._digest_timer is not None:
+                self._digest_timer.cancel()
+                self._digest_timer = None
+        if not entries:
+            return 0
         
-        for attempt in range(max_retries):
-            try:
-                response = requests.post(
-                    self.discord_webhook, 
-                    json=payload, 
-                    timeout=15,
-                    headers={
-                        'User-Agent': 'ReDAC-CriticalAlert-Bot/1.0',
-                        'Content-Type': 'application/json'
-                    }
-                )
-                
-                if response.status_code == 204:
-                    print(f"✅ Discord alert sent successfully on attempt {attempt + 1}")
-                    return True
-                elif response.status_code == 429:
-                    # Rate limited - wait longer
-                    retry_after = int(response.headers.get('Retry-After', 10))
-                    print(f"⚠️ Rate limited. Waiting {retry_after} seconds...")
-                    time.sleep(retry_after)
-                elif response.status
+        batches = self._pack_digest(entries)
+        for embeds, handles in batches:
+            payload = {
+                "content": f"📦 ReDAC digest: {len(handles)} alert(s)",
+                "username": "ReDAC • Critical Alert System",
+                "avatar_url": "https://cdn-icons-png.flaticon.com/512/564/564619.png",
+                "embeds": embeds
+            }
+            summary = "\n\n".join(handle.message for handle in handles)
+            group = get_alert_dispatcher().submit(lambda payload=payload: self._post_discord(payload), summary)
+            group.future.add_done_callback(self._resolve_members(group, handles))
+        print(f"📦 Packed {len(entries)} alert(s) into {len(batches)} Discord message(s)")
+        return len(batches)
+    
+    @staticmethod
+    def _resolve_members(group: DeliveryHandle, handles: List[DeliveryHandle]):
+        """Callback that settles each buffered alert when its digest message is done"""
+        def resolve(future):
+            for handle in handles:
+                handle.attempts = group.attempts
+                handle._resolve(future.result(), group.last_error)
+        return resolve
+    
+    def _pack_digest(self, entries: List[tuple]) -> List[tuple]:
+        """
+        Greedily fill messages with embeds while respecting Discord's
+        10-embed and 6000-character limits
+        """
+        batches = []
+        embeds, handles, size = [], [], 0
+        for handle, message, severity in entries:
+            embed = self._alert_embed(message, severity)
+            embed_size = len(embed["title"]) + len(embed["description"])
+            if embeds and (len(embeds) >= DISCORD_MAX_EMBEDS or size + embed_size > DISCORD_EMBEDS_TOTAL_LIMIT):
+                batches.append((embeds, handles))
+                embeds, handles, size = [], [], 0
+            embeds.append(embed)
+            handles.append(handle)
+            size += embed_size
+        if embeds:
+            batches.append((embeds, handles))
+        return batches
+    
+    def _alert_embed(self, message: str, severity: Optional[str]) -> dict:
+        """One alert as a Discord embed (first line becomes the title)"""
+        lines = [line.strip() for line in message.strip().splitlines()]
+        title = next((line for line in lines if line), "ReDAC Alert")[:DISCORD_EMBED_TITLE_LIMIT]
+        description = message.strip()
+        # Keep every embed small enough to share a message with others
+        limit = min(DISCORD_EMBED_DESCRIPTION_LIMIT, DISCORD_EMBEDS_TOTAL_LIMIT - len(title))
+        if len(description) > limit:
+            description = description[:limit - 1].rstrip() + "…"
+        return {
+            "title": title,
+            "description": description,
+            "color": SEVERITY_COLORS.get(str(severity or "").strip().lower(), NO_SEVERITY_COLOR)
+        }
+    
+    def _rejected(self, message: str, error: str) -> DeliveryHandle:
+        """Handle for a message that could not be queued at all"""
+        handle = DeliveryHandle(message)
+        handle._resolve(False, error)
+        return handle
+    
+    def _post_discord(self, payload: dict) -> tuple:
+        """
+        Make one delivery attempt (called by the dispatcher worker)
+        
+        Returns:
+            (outcome, retry_after, error) for the AlertDispatcher
+        """
+        limiter = get_discord_rate_limiter()
+        metrics = get_metrics()
+        # Wait for a free slot in this webhook's bucket instead of hitting 429
+        # (not counted as webhook latency)
+        try:
+            limiter.acquire(self.discord_webhook)
+        except Exception as e:
+            return FAILED, None, str(e)
+        
+        started = time.perf_counter()
+        outcome, retry_after, error = self._attempt_discord(payload, limiter)
+        metrics.observe("webhook", time.perf_counter() - started)
+        metrics.inc("webhook_outcomes", outcome=outcome)
+        return outcome, retry_after, error
+    
+    def _attempt_discord(self, payload: dict, limiter) -> tuple:
+        """POST the payload once and map the response to a dispatcher outcome"""
+        try:
+            response = get_http_pool().post(
+                self.discord_webhook, 
+                json=payload, 
+                timeout=15,
+                headers={
+                    'User-Agent': 'ReDAC-CriticalAlert-Bot/1.0',
+                    'Content-Type': 'application/json'
+                }
+            )
+        except requests.exceptions.ConnectionError as e:
+            return RETRY, None, f"Connection error: {e}"
+        except requests.exceptions.Timeout:
+            return RETRY, None, "Request timed out"
+        except Exception as e:
+            return FAILED, None, str(e)
+        
+        limiter.update(self.discord_webhook, response.headers, response.status_code)
+        if response.status_code in (200, 204):
+            print("✅ Discord alert sent successfully")
+            return SENT, None, ""
+        elif response.status_code == 429:
+            # Rate limited - the shared limiter now holds the bucket until reset
+            print("⚠️ Rate limited by Discord. Retrying after the bucket resets...")
+            return RETRY, 0, "Rate limited (429)"
+        elif response.status_code == 404:
+            print("❌ Discord webhook not found (404) - it may have been deleted")
+            return FAILED, None, "Webhook not found (404)"
+        elif response.status_code >= 500:
+            return RETRY, None, f"Discord server error {response.status_code}"
+        else:
+            print(f"❌ Discord webhook failed: Status {response.status_code}")
+            print(f"Response: {response.text}")
+            return FAILED, None, f"Status {response.status_code}: {response.text[:200]}"
+    
+    def test_connection(self) -> bool:
+        """Check that the webhook exists without posting a message"""
+        if not self._validate_webhook_url(self.discord_webhook):
+            print("❌ Discord webhook URL is invalid or not configured")
+            return False
+        
+        try:
+            response = get_http_pool().get(self.discord_webhook, timeout=10)
+            if response.status_code == 200:
+                print("✅ Discord webhook exists and is accessible")
+                return True
+            print(f"❌ Discord webhook check failed: Status {response.status_code}")
+            return False
+        except Exception as e:
+            print(f"❌ Error checking Discord webhook: {e}")
+            return False
\ No newline at end of file
@@ -0,0 +1,268 @@
+import hashlib
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional
+from agents.news_agent import NewsAgent
+from agents.alert_agent import AlertAgent
+from config import BATCH_FETCH_CONCURRENCY, BATCH_ANALYSIS_CONCURRENCY, BATCH_ANALYSIS_PACKED
+
+class BatchMonitor:
+    """
+    BATCH MONITOR: Runs the News → Alert pipeline for many locations at once
+    News is fetched concurrently, real articles returned for several
+    locations are kept only once, and analysis runs with its own (smaller)
+    concurrency limit because every analysis is a Groq call. In packed mode
+    several locations share one analysis request (AlertAgent.analyze_batch).
+    A location for which no provider returned anything gets an error row
+    instead of an analysis of placeholder news. With the article store
+    enabled, locations the caller already knows are only re-analyzed when
+    their fetch brought at least one unseen article
+    """
+
+    def __init__(self, news_agent: Optional[NewsAgent] = None, alert_agent: Optional[AlertAgent] = None,
+                 fetch_concurrency: int = BATCH_FETCH_CONCURRENCY,
+                 analysis_concurrency: int = BATCH_ANALYSIS_CONCURRENCY,
+                 packed: bool = BATCH_ANALYSIS_PACKED):
+        self.news_agent = news_agent or NewsAgent()
+        self.alert_agent = alert_agent or AlertAgent()
+        self.fetch_concurrency = fetch_concurrency
+        # Every concurrent check needs its own provider requests running,
+        # not queued behind another check's (the check deadline is running)
+        self.news_agent.reserve_workers(max(1, fetch_concurrency))
+        self.analysis_concurrency = analysis_concurrency
+        self.packed = packed
+
+    def run(self, locations: List[str], max_results: int = 5, send_alerts: bool = True,
+            known_locations: Iterable[str] = (), generate_messages: bool = True) -> Dict:
+        """
+        Monitor a list of locations
+
+        Args:
+            locations: Locations to check (duplicates are checked once)
+            max_results: Maximum news articles per location
+            send_alerts: Whether AlertAgent should dispatch alerts
+            known_locations: Locations whose last result the caller keeps;
+                they are skipped (row "skipped") when none of their
+                articles is new to the article store
+            generate_messages: Write alert messages when send_alerts is
+                False (row "alert_message"); each is an LLM call for High
+                severity
+
+        Returns:
+            {"results": [one row per location], "throughput": {...}}
+        """
+        started = time.perf_counter()
+
+        # Identical locations (ignoring case/whitespace) share one check
+        unique_locations = {}
+        for location in locations:
+            key = self._normalize(location)
+            if key and key not in unique_locations:
+                unique_locations[key] = location.strip()
+
+        # Stage 1: fetch news for every location concurrently
+        fetch_started = time.perf_counter()
+        fetched = self._fetch_all(list(unique_locations.values()), max_results)
+        fetch_seconds = time.perf_counter() - fetch_started
+
+        known = {self._normalize(location) for location in known_locations}
+        for key, item in fetched.items():
+            item["skipped"] = key in known and bool(item["articles"]) and item["new_articles"] == 0
+
+        # Articles returned for several locations are stored once and shared
+        shared_count, unique_count = self._share_articles(fetched)
+
+        # Stage 2: analyze with a bounded number of concurrent LLM calls
+        analysis_started = time.perf_counter()
+        if self.packed:
+            analyzed = self._analyze_packed(fetched, send_alerts, generate_messages)
+        else:
+            analyzed = self._analyze_all(fetched, send_alerts, generate_messages)
+        analysis_seconds = time.perf_counter() - analysis_started
+
+        rows = []
+        for location in locations:
+            key = self._normalize(location)
+            if key in analyzed:
+                rows.append(dict(analyzed[key], location=location.strip()))
+
+        total_seconds = time.perf_counter() - started
+        checked = len(unique_locations)
+        throughput = {
+            "locations": checked,
+            "total_seconds": round(total_seconds, 3),
+            "fetch_seconds": round(fetch_seconds, 3),
+            "analysis_seconds": round(analysis_seconds, 3),
+            "locations_per_second": round(checked / total_seconds, 2) if total_seconds > 0 else 0.0,
+            "unique_articles": unique_count,
+            "shared_articles": shared_count,
+            "disasters_found": sum(1 for row in analyzed.values() if row["disaster_found"]),
+            "skipped": sum(1 for row in analyzed.values() if row["skipped"]),
+            "errors": sum(1 for row in analyzed.values() if row["error"])
+        }
+
+        return {"results": rows, "throughput": throughput}
+
+    def _normalize(self, location: str) -> str:
+        return " ".join(location.lower().split())
+
+    def _fetch_all(self, locations: List[str], max_results: int) -> Dict[str, Dict]:
+        """Fetch news for every location with a bounded thread pool"""
+        def fetch(location):
+            fetch_started = time.perf_counter()
+            try:
+                articles = self.news_agent.search_disaster_news(location, max_results)
+                error = ""
+            except Exception as e:
+                articles, error = [], str(e)
+            if articles and all(self.news_agent.is_mock(article) for article in articles):
+                # Placeholder news must not be analyzed as if it were real
+                articles, error = [], "No news provider returned results"
+            return {
+                "location": location,
+                "articles": articles,
+                # Counted before sharing: "is_new" is per location
+                "new_articles": sum(1 for article in articles if article.get("is_new", True)),
+                "fetch_seconds": time.perf_counter() - fetch_started,
+                "error": error
+            }
+
+        with ThreadPoolExecutor(max_workers=max(1, self.fetch_concurrency),
+                                thread_name_prefix="batch-fetch") as executor:
+            results = list(executor.map(fetch, locations))
+
+        return {self._normalize(item["location"]): item for item in results}
+
+    def _share_articles(self, fetched: Dict[str, Dict]) -> tuple:
+        """
+        Replace repeated articles with one shared instance. Articles count
+        as the same when both the link and the content match, so a reused
+        link with a different story is not shared. This only saves memory
+        and analysis-side work: every location's queries name the location,
+        so no two checks send the same search request
+
+        Returns:
+            (number of articles that appeared for 2+ locations, unique article count)
+        """
+        canonical = {}
+        locations_per_article = {}
+        for key, item in fetched.items():
+            shared = []
+            for article in item["articles"]:
+                article_key = (article.get("link", ""), self._content_hash(article))
+                if article_key not in canonical:
+                    canonical[article_key] = article
+                    locations_per_article[article_key] = set()
+                locations_per_article[article_key].add(key)
+                shared.append(canonical[article_key])
+            item["articles"] = shared
+
+        shared_count = sum(1 for seen_in in locations_per_article.values() if len(seen_in) > 1)
+        return shared_count, len(canonical)
+
+    def _analyze_all(self, fetched: Dict[str, Dict], send_alerts: bool,
+                     generate_messages: bool = True) -> Dict[str, Dict]:
+        """Run AlertAgent on every location with the analysis concurrency limit"""
+        def analyze(item):
+            row = self._base_row(item)
+            if not item["articles"] or item["skipped"]:
+                return row
+
+            analysis_started = time.perf_counter()
+            news_data = self.news_agent.format_news_for_analysis(item["articles"], item["location"])
+            result = self.alert_agent.analyze_and_alert(news_data, item["location"], send_alert=send_alerts,
+                                                        generate_message=generate_messages)
+            self._apply_result(row, result, time.perf_counter() - analysis_started)
+            return row
+
+        with ThreadPoolExecutor(max_workers=max(1, self.analysis_concurrency),
+                                thread_name_prefix="batch-analysis") as executor:
+            rows = list(executor.map(analyze, fetched.values()))
+
+        return {self._normalize(row["location"]): row for row in rows}
+
+    def _analyze_packed(self, fetched: Dict[str, Dict], send_alerts: bool,
+                        generate_messages: bool = True) -> Dict[str, Dict]:
+        """Analyze every location through packed multi-location requests"""
+        rows = [self._base_row(item) for item in fetched.values()]
+        with_news = [
+            (row, item) for row, item in zip(rows, fetched.values())
+            if item["articles"] and not item["skipped"]
+        ]
+
+        checks = [
+            (item["location"], self.news_agent.format_news_for_analysis(item["articles"], item["location"]))
+            for _, item in with_news
+        ]
+        results = self.alert_agent.analyze_batch(checks, send_alert=send_alerts,
+                                                 concurrency=self.analysis_concurrency,
+                                                 generate_message=generate_messages)
+        for (row, _), result in zip(with_news, results):
+            # Locations packed together share the request time
+            seconds = sum(result["timings"].values())
+            self._apply_result(row, result, seconds)
+            row["batch_size"] = result["batch_size"]
+
+        return {self._normalize(row["location"]): row for row in rows}
+
+    def _base_row(self, item: Dict) -> Dict:
+        """Result row for a location before analysis"""
+        return {
+            "location": item["location"],
+            "article_count": len(item["articles"]),
+            "new_articles": item["new_articles"],
+            "skipped": item["skipped"],
+            "disaster_found": False,
+            "disaster_type": "",
+            "severity": "",
+            "alert_sent": False,
+            "cached": False,
+            "alert_message": "",
+            "analysis": {},
+            "fingerprint": self._fingerprint(item["articles"]),
+            "fetch_seconds": round(item["fetch_seconds"], 3),
+            "analysis_seconds": 0.0,
+            "error": item["error"]
+        }
+
+    @staticmethod
+    def _apply_result(row: Dict, result: Dict, analysis_seconds: float):
+        """Copy an AlertAgent result into a location row"""
+        analysis = result["analysis"]
+        row.update({
+            "disaster_found": analysis.get("disaster_found", False),
+            "disaster_type": analysis.get("disaster_type", ""),
+            "severity": analysis.get("severity", ""),
+            "alert_sent": result["alert_sent"],
+            "cached": result.get("cached", False),
+            "alert_message": result["alert_message"],
+            "analysis": analysis,
+            "analysis_seconds": round(analysis_seconds, 3),
+            "error": analysis.get("error", row["error"])
+        })
+
+    @staticmethod
+    def _content_hash(article: Dict) -> str:
+        text = f"{article.get('title', '')}\n{article.get('snippet', '')}"
+        return hashlib.sha1(" ".join(text.lower().split()).encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _fingerprint(articles: List[Dict]) -> str:
+        """Order-independent hash of an article set, used to detect changes"""
+        keys = sorted(article.get("link") or article.get("title", "") for article in articles)
+        return hashlib.sha1("\n".join(keys).encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def format_table(rows: List[Dict]) -> str:
+        """Render result rows as a fixed-width text table"""
+        columns = ["location", "article_count", "disaster_found", "disaster_type",
+                   "severity", "alert_sent", "fetch_seconds", "analysis_seconds"]
+        widths = {
+            column: max([len(column)] + [len(str(row.get(column, ""))) for row in rows])
+            for column in columns
+        }
+        lines = ["  ".join(column.ljust(widths[column]) for column in columns)]
+        lines.append("  ".join("-" * widths[column] for column in columns))
+        for row in rows:
+            lines.append("  ".join(str(row.get(column, "")).ljust(widths[column]) for column in columns))
+        return "\n".join(lines)
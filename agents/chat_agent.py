@@ -1,7 +1,9 @@
-from langchain_groq import ChatGroq
-from langchain_core.output_parsers import StrOutputParser
-from utils.templates import CHAT_TEMPLATE
-from config import GROQ_API_KEY
+import time
+from typing import Callable, Iterator, Optional
+from utils.chat_memory import ConversationMemory
+from utils.metrics import get_metrics
+from agents.registry import create_llm
+from config import CHAT_MEMORY_TOKEN_BUDGET, CHAT_SUMMARY_TOKEN_BUDGET
 
 class ChatAgent:
     """
@@ -9,53 +11,115 @@ class ChatAgent:
     This agent handles user questions about disasters, safety, and general help
     """
     
-    def __init__(self):
-        # Initialize the Groq LLM for chat with current supported model
-        self.llm = ChatGroq(
-            groq_api_key=GROQ_API_KEY,
-            model_name="llama-3.3-70b-versatile",  # Updated to current supported model
-            temperature=0.7  # Higher temperature for more conversational responses
-        )
+    def __init__(self, llm_factory: Optional[Callable] = None):
+        # Groq LLM settings for chat; the client is created on first use
+        self.model_name = "llama-3.3-70b-versatile"  # Updated to current supported model
+        self.temperature = 0.7  # Higher temperature for more conversational responses
+        self._llm_factory = llm_factory or create_llm
+        self._llm = None
+        self._chat_chain = None
         
-        # Create chat chain: Template → LLM → Parser
-        self.chat_chain = (
-            CHAT_TEMPLATE 
-            | self.llm 
-            | StrOutputParser()
+        # Store conversation context (token-budgeted, older turns summarized)
+        self.memory = ConversationMemory(
+            token_budget=CHAT_MEMORY_TOKEN_BUDGET,
+            summary_budget=CHAT_SUMMARY_TOKEN_BUDGET
         )
-        
-        # Store conversation context
-        self.context = ""
     
-    def chat(self, user_question: str, additional_context: str = "") -> str:
+    @property
+    def llm(self):
+        """Groq client, created on first use"""
+        if self._llm is None:
+            self._llm = self._llm_factory(self.model_name, self.temperature)
+        return self._llm
+    
+    @property
+    def chat_chain(self):
+        """Chat chain: Template → LLM → Parser"""
+        if self._chat_chain is None:
+            from langchain_core.output_parsers import StrOutputParser
+            from utils.templates import CHAT_TEMPLATE
+            self._chat_chain = (
+                CHAT_TEMPLATE 
+                | self.llm 
+                | StrOutputParser()
+            )
+        return self._chat_chain
+    
+    @chat_chain.setter
+    def chat_chain(self, chain):
+        self._chat_chain = chain
+    
+    @property
+    def context(self) -> str:
+        """Conversation context passed to the chat prompt"""
+        return self.memory.render()
+    
+    def chat(self, user_question: str, additional_context: str = "", history_question: str = None) -> str:
         """
         Handle user chat messages
         
         Args:
             user_question: What the user is asking
             additional_context: Any relevant context (e.g., recent disaster info)
+            history_question: Shorter text to remember instead of user_question
+                (used when the question is a long generated prompt)
         
         Returns:
             AI response to the user's question
         """
         try:
-            # Combine stored context with additional context
-            full_context = f"{self.context}\n{additional_context}".strip()
-            
             # Get response from AI
-            response = self.chat_chain.invoke({
-                "user_question": user_question,
-                "context": full_context
-            })
+            with get_metrics().span("llm", chain="chat"):
+                response = self.chat_chain.invoke(self._chat_inputs(user_question, additional_context))
             
             # Update context with this conversation
-            self.update_context(user_question, response)
+            self.update_context(history_question or user_question, response)
             
             return response
             
         except Exception as e:
             return f"I'm sorry, I encountered an error: {str(e)}. Please try again."
     
+    def stream_chat(self, user_question: str, additional_context: str = "") -> Iterator[str]:
+        """
+        Streaming version of chat(): yields response chunks as the model
+        produces them, so the first words show up without waiting for the
+        whole completion. The context is updated once the stream finishes.
+        
+        Args:
+            user_question: What the user is asking
+            additional_context: Any relevant context (e.g., recent disaster info)
+        
+        Yields:
+            Pieces of the AI response
+        """
+        metrics = get_metrics()
+        chunks = []
+        started = time.perf_counter()
+        try:
+            for chunk in self.chat_chain.stream(self._chat_inputs(user_question, additional_context)):
+                if not chunks:
+                    metrics.observe("llm_first_chunk", time.perf_counter() - started, chain="chat_stream")
+                chunks.append(chunk)
+                yield chunk
+        except Exception as e:
+            metrics.inc("llm_errors", chain="chat_stream")
+            yield f"I'm sorry, I encountered an error: {str(e)}. Please try again."
+            return
+        # Includes the time the caller spent rendering each chunk
+        metrics.observe("llm", time.perf_counter() - started, chain="chat_stream")
+        
+        # Update context with the complete response
+        self.update_context(user_question, "".join(chunks))
+    
+    def _chat_inputs(self, user_question: str, additional_context: str) -> dict:
+        """Prompt inputs: stored context combined with additional context"""
+        full_context = f"{self.context}\n{additional_context}".strip()
+        return {
+            "user_question": user_question,
+            "context": full_context
+        }
+    
     def emergency_chat(self, user_question: str, emergency_context: str = "") -> str:
         """
         Handle emergency chat messages - SIMPLIFIED VERSION
@@ -79,8 +143,13 @@ Please provide immediate emergency safety guidance with:
 Focus on life-saving information and be specific and actionable.
 """
             
-            # Use the regular chat method with emergency context
-            response = self.chat(emergency_question, "EMERGENCY MODE ACTIVATED")
+            # Use the regular chat method with emergency context; only the
+            # user's own question goes into the conversation memory
+            response = self.chat(
+                emergency_question,
+                "EMERGENCY MODE ACTIVATED",
+                history_question=f"[Emergency] {user_question}"
+            )
             
             # Add emergency formatting
             return f"🚨 **EMERGENCY RESPONSE** 🚨\n\n{response}"
@@ -163,8 +232,12 @@ Use clear formatting with numbers and bullet points.
 This could save lives - be thorough and specific.
 """
             
-            # Use regular chat method
-            response = self.chat(activation_prompt, "DISASTER EMERGENCY ACTIVATION")
+            # Use regular chat method (remember a short label, not the whole prompt)
+            response = self.chat(
+                activation_prompt,
+                "DISASTER EMERGENCY ACTIVATION",
+                history_question=f"[Emergency protocol] {disaster_type}"
+            )
             
             return f"🚨 **{disaster_type.upper()} EMERGENCY PROTOCOL ACTIVATED** 🚨\n\n{response}"
             
@@ -323,14 +396,8 @@ This could save lives - be thorough and specific.
         """
         Update conversation context for better continuity
         """
-        new_context = f"User: {user_question}\nAssistant: {ai_response}\n"
-        
-        # Keep context manageable (last 3 exchanges)
-        context_lines = self.context.split('\n')
-        if len(context_lines) > 12:  # 4 lines per exchange * 3 exchanges
-            context_lines = context_lines[-12:]
-        
-        self.context = '\n'.join(context_lines) + new_context
+        # Memory keeps the prompt under the token budget by summarizing old turns
+        self.memory.add(user_question, ai_response)
     
     def get_disaster_help(self, disaster_type: str) -> str:
         """
@@ -376,4 +443,4 @@ This could save lives - be thorough and specific.
     
     def clear_context(self):
         """Clear conversation context"""
-        self.context = ""
+        self.memory.clear()
@@ -0,0 +1,58 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from agents.news_agent import NewsAgent
+from agents.alert_agent import AlertAgent
+
+class CheckPipeline:
+    """
+    CHECK PIPELINE: The "Check for Disasters" flow as a set of stages
+    fetch → format → analyze → alert message → dispatch
+    run() yields each stage's output as soon as it exists: the articles are
+    handed to the caller (to render) while formatting and the analysis LLM
+    call run in the background, and the alert is only queued, so Discord
+    delivery overlaps with whatever the caller does next
+    """
+
+    def __init__(self, news_agent: Optional[NewsAgent] = None, alert_agent: Optional[AlertAgent] = None):
+        self.news_agent = news_agent or NewsAgent()
+        self.alert_agent = alert_agent or AlertAgent()
+
+    def run(self, location: str, max_results: int = 5, send_alert: bool = True) -> Iterator[Tuple[str, Any]]:
+        """
+        Run one check, yielding (stage, output) pairs:
+        - ("articles", list of articles) as soon as the news is fetched
+        - ("result", analyze_and_alert result) when the analysis is done,
+          with "timings" covering every stage (seconds) and "prompt" the
+          size of the packed news. Not yielded when no articles were found
+        """
+        started = time.perf_counter()
+        articles = self.news_agent.search_disaster_news(location, max_results)
+        fetch_seconds = time.perf_counter() - started
+
+        if not articles:
+            yield "articles", articles
+            return
+
+        # Start the analysis before handing the articles over for rendering.
+        # Each run gets its own worker: the pipeline is shared by every
+        # Streamlit session, and a shared pool would queue users' analyses
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="check-pipeline")
+        analysis = executor.submit(self._analyze, articles, location, send_alert)
+        executor.shutdown(wait=False)  # the worker exits once the analysis is done
+        yield "articles", articles
+
+        result = analysis.result()
+        result["timings"] = {"fetch": fetch_seconds, **result["timings"], "total": time.perf_counter() - started}
+        yield "result", result
+
+    def _analyze(self, articles: List[Dict], location: str, send_alert: bool) -> Dict:
+        started = time.perf_counter()
+        news_data, prompt = self.news_agent.pack_news_for_analysis(articles, location)
+        format_seconds = time.perf_counter() - started
+
+        result = self.alert_agent.analyze_and_alert(news_data, location, send_alert=send_alert)
+        result["timings"] = {"format": format_seconds, **result.get("timings", {})}
+        result["prompt"] = prompt
+        return result
+
@@ -0,0 +1,169 @@
+import heapq
+import random
+import threading
+import time
+from typing import Dict, List, Optional
+from agents.alert_agent import AlertAgent
+from agents.batch_monitor import BatchMonitor
+from agents.news_agent import NewsAgent
+from config import (
+    MONITOR_BASE_INTERVAL, MONITOR_MIN_INTERVAL, MONITOR_MAX_INTERVAL,
+    MONITOR_BACKOFF, MONITOR_JITTER, MONITOR_CACHE_TTL
+)
+
+class MonitorDaemon:
+    """
+    MONITOR DAEMON: Watches a set of locations without the Streamlit UI
+    Each location has its own polling interval:
+    - High severity → poll at the minimum interval
+    - Article set changed → poll twice as often
+    - Nothing new → back off towards the maximum interval
+    Locations with a known result are not re-analyzed while the article
+    store has already seen every article their fetch returned
+    Every scheduled time gets random jitter so checks do not line up and
+    hit Serper/Groq in bursts.
+    The default agents cache news and analyses for MONITOR_CACHE_TTL (at
+    most half the minimum interval) without stale entries; with the app's
+    longer cache TTLs a faster poll would just re-read the cache. A
+    batch_monitor passed in keeps its agents' caches as they are
+    """
+
+    def __init__(self, locations: List[str], batch_monitor: Optional[BatchMonitor] = None,
+                 base_interval: float = MONITOR_BASE_INTERVAL,
+                 min_interval: float = MONITOR_MIN_INTERVAL,
+                 max_interval: float = MONITOR_MAX_INTERVAL,
+                 backoff: float = MONITOR_BACKOFF,
+                 jitter: float = MONITOR_JITTER):
+        if batch_monitor is None:
+            cache_ttl = min(MONITOR_CACHE_TTL, min_interval / 2)
+            batch_monitor = BatchMonitor(news_agent=NewsAgent(cache_ttl=cache_ttl),
+                                         alert_agent=AlertAgent(cache_ttl=cache_ttl))
+        self.batch_monitor = batch_monitor
+        self.base_interval = base_interval
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.jitter = jitter
+
+        self._stop = threading.Event()
+        self._schedule = []  # heap of (due_time, location)
+        self.state: Dict[str, Dict] = {}
+
+        # Spread the first round of checks over the minimum interval
+        now = time.monotonic()
+        for location in dict.fromkeys(loc.strip() for loc in locations if loc.strip()):
+            self.state[location] = {
+                "interval": base_interval,
+                "fingerprint": None,
+                "severity": "",
+                "disaster_type": "",
+                "disaster_found": False,
+                "checks": 0,
+                "alerts": 0,
+                "last_checked": None
+            }
+            heapq.heappush(self._schedule, (now + random.uniform(0, min_interval * jitter), location))
+
+    def run_forever(self):
+        """Poll until stop() is called"""
+        print(f"🛰️ Monitoring {len(self.state)} location(s)...")
+        while not self._stop.is_set():
+            self.run_due()
+            if not self._schedule:
+                break
+            wait_seconds = max(0.0, self._schedule[0][0] - time.monotonic())
+            self._stop.wait(wait_seconds)
+        print("🛑 Monitor stopped")
+
+    def run_once(self) -> Dict:
+        """Check every location immediately (ignores the schedule)"""
+        return self._check(list(self.state))
+
+    def run_due(self) -> Optional[Dict]:
+        """Check every location whose next poll time has passed"""
+        now = time.monotonic()
+        due = []
+        while self._schedule and self._schedule[0][0] <= now:
+            due.append(heapq.heappop(self._schedule)[1])
+        if not due:
+            return None
+
+        result = self._check(due)
+        for location in due:
+            heapq.heappush(self._schedule, (self._next_due(location), location))
+        return result
+
+    def stop(self):
+        self._stop.set()
+
+    def _check(self, locations: List[str]) -> Dict:
+        """Run one batch and update each location's polling interval"""
+        # Alerts are dispatched here (not by AlertAgent) so an unchanged
+        # incident is not re-posted and quiet polls send no "all clear"
+        known = [location for location in locations if self.state[location]["fingerprint"] is not None]
+        # Alert messages are written below, only for new incidents
+        result = self.batch_monitor.run(locations, send_alerts=False, known_locations=known,
+                                        generate_messages=False)
+
+        for row in result["results"]:
+            state = self.state[row["location"]]
+            if row["skipped"]:
+                # No unseen articles: the last result still stands (and is reported)
+                row.update(fingerprint=state["fingerprint"], severity=state["severity"],
+                           disaster_type=state["disaster_type"], disaster_found=state["disaster_found"])
+            changed = state["fingerprint"] is not None and row["fingerprint"] != state["fingerprint"]
+            new_incident = row["disaster_found"] and (
+                changed
+                or not state["disaster_found"]
+                or row["severity"] != state["severity"]
+            )
+
+            state["interval"] = self._adapt_interval(state["interval"], row, changed)
+            if row["error"]:
+                # Failed check: keep the last known incident state
+                print(f"⚠️ {row['location']}: check failed ({row['error']}) → retry in ~{int(state['interval'])}s")
+                continue
+            state.update({
+                "fingerprint": row["fingerprint"],
+                "severity": row["severity"],
+                "disaster_type": row["disaster_type"],
+                "disaster_found": row["disaster_found"],
+                "last_checked": time.time()
+            })
+            state["checks"] += 1
+
+            if new_incident:
+                alert_agent = self.batch_monitor.alert_agent
+                message = alert_agent.message_agent.generate_professional_alert(row["analysis"], row["location"])
+                alert_agent.send_custom_alert(message, severity=row["severity"])
+                row["alert_message"] = message
+                state["alerts"] += 1
+
+            print(
+                f"📍 {row['location']}: "
+                f"{row['severity'] + ' ' + row['disaster_type'] if row['disaster_found'] else 'no threat'}"
+                f"{' (no new articles)' if row['skipped'] else ''}"
+                f" → next check in ~{int(state['interval'])}s"
+            )
+
+        return result
+
+    def _adapt_interval(self, interval: float, row: Dict, changed: bool) -> float:
+        """Pick the next polling interval from the latest result"""
+        if row["error"]:
+            # Upstream trouble: back off instead of retrying hot
+            interval = interval * self.backoff
+        elif row["disaster_found"] and str(row["severity"]).strip().lower() == "high":
+            interval = self.min_interval
+        elif changed:
+            interval = interval / 2
+        elif row["disaster_found"]:
+            interval = min(interval, self.base_interval)
+        else:
+            interval = interval * self.backoff
+        return min(self.max_interval, max(self.min_interval, interval))
+
+    def _next_due(self, location: str) -> float:
+        interval = self.state[location]["interval"]
+        spread = interval * self.jitter
+        return time.monotonic() + interval + random.uniform(-spread, spread)
@@ -1,8 +1,29 @@
-import requests
 import json
-from typing import List, Dict
-from config import SERPER_API_KEY, DISASTER_KEYWORDS
+import sqlite3
+import threading
 import time
+from typing import List, Dict, Optional
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from config import (
+    SERPER_API_KEY, DISASTER_KEYWORDS, NEWS_API_URL,
+    NEWS_CONCURRENT_FETCH, NEWS_CHECK_DEADLINE, NEWS_MAX_WORKERS,
+    NEWS_CACHE_ENABLED, NEWS_CACHE_SIZE, NEWS_CACHE_TTL, NEWS_CACHE_STALE_TTL,
+    NEWS_DEDUP_THRESHOLD, ARTICLE_STORE_ENABLED, NEWS_BREAKER_ENABLED,
+    NEWS_HEDGE_ENABLED, NEWS_HEDGE_PERCENTILE, NEWS_HEDGE_MIN_SAMPLES,
+    NEWS_HEDGE_DEFAULT_DELAY, NEWS_HEDGE_MIN_DELAY,
+    NEWS_PROMPT_TOKEN_BUDGET, NEWS_PROMPT_SNIPPET_TOKENS
+)
+from utils.article_store import ArticleStore, get_article_store
+from utils.cache import TTLCache, STALE
+from utils.circuit_breaker import CircuitBreaker, CircuitOpenError, get_circuit_breaker
+from utils.dedup import NearDuplicateDetector
+from utils.http_pool import get_http_pool
+from utils.metrics import get_metrics
+from utils.news_packer import NewsPacker
+from utils.tokens import estimate_tokens
+from utils.triage import KeywordTriage
+
+MOCK_SEARCH_ENGINE = 'Mock Data'
 
 class NewsAgent:
     """
@@ -11,59 +32,458 @@ class NewsAgent:
     Now includes DuckDuckGo backup when Serper fails!
     """
     
-    def __init__(self):
+    def __init__(self, concurrent: bool = NEWS_CONCURRENT_FETCH, store: Optional[ArticleStore] = None,
+                 hedge: bool = NEWS_HEDGE_ENABLED, cache_ttl: Optional[float] = None):
         self.serper_api_key = SERPER_API_KEY
-        self.serper_url = "https://google.serper.dev/news"
+        self.serper_url = NEWS_API_URL
+        
+        # Concurrent fan-out settings
+        self.concurrent = concurrent
+        self.check_deadline = NEWS_CHECK_DEADLINE
+        self.max_workers = NEWS_MAX_WORKERS
+        self._executor = None
+        self._executor_lock = threading.Lock()
+        
+        # Hedged requests: the backup provider races a slow primary
+        self.hedge = hedge
+        self.hedge_percentile = NEWS_HEDGE_PERCENTILE
+        self.hedge_stats = {'queries': 0, 'hedged': 0, 'hedge_wins': 0}
+        self.clock = time.monotonic  # hedge and deadline timing
+        
+        # Search result cache with stale-while-revalidate. A cache_ttl
+        # override also turns stale serving off (used by the monitor daemon)
+        self.cache_enabled = NEWS_CACHE_ENABLED
+        self.cache = TTLCache(
+            max_size=NEWS_CACHE_SIZE,
+            ttl=NEWS_CACHE_TTL if cache_ttl is None else cache_ttl,
+            stale_ttl=NEWS_CACHE_STALE_TTL if cache_ttl is None else 0
+        )
+        self._refreshing = set()
+        self._refresh_count = 0
+        
+        # Similarity-based deduplication of syndicated stories
+        self.deduplicator = NearDuplicateDetector(threshold=NEWS_DEDUP_THRESHOLD)
+        self.dedup_stats = {'articles_seen': 0, 'duplicates_merged': 0, 'last_merged': 0}
+        
+        # Per-provider circuit breakers (shared by every NewsAgent in the process)
+        self.breakers_enabled = NEWS_BREAKER_ENABLED
+        
+        # Analysis prompt packing: most relevant articles first, within a token budget
+        triage = KeywordTriage(DISASTER_KEYWORDS)
+        self.packer = NewsPacker(
+            token_budget=NEWS_PROMPT_TOKEN_BUDGET,
+            snippet_tokens=NEWS_PROMPT_SNIPPET_TOKENS,
+            relevance=lambda text: triage.score(text)["score"]
+        )
+        
+        # Persistent article history (opened on first use)
+        self.store_enabled = ARTICLE_STORE_ENABLED or store is not None
+        self._store = store
+    
+    @property
+    def store(self) -> Optional[ArticleStore]:
+        if self._store is None and self.store_enabled:
+            self._store = get_article_store()
+        return self._store
     
-    def search_disaster_news(self, location: str, max_results: int = 5) -> List[Dict]:
+    def search_disaster_news(self, location: str, max_results: int = 5, only_new: bool = False) -> List[Dict]:
         """
         Search for disaster news related to a specific location
-        Uses Serper API first, falls back to DuckDuckGo if needed
+        Uses Serper API first, falls back to DuckDuckGo if needed.
+        In concurrent mode both providers are queried at once; in hedge
+        mode DuckDuckGo is only asked when Serper is slow or fails.
         
         Args:
             location: User's location (e.g., "New York", "California")
             max_results: Maximum number of news articles to return
+            only_new: Return only articles the article store has never seen
+                (no filtering while the store is disabled)
         
         Returns:
-            List of news articles with title, snippet, and link
+            List of news articles with title, snippet, and link. With the
+            article store enabled each article also has "is_new"
         """
-        news_articles = []
+        search_queries = self._search_queries(location)
+        per_query = max_results//len(search_queries)
+        
+        if self.hedge:
+            news_articles = self._fetch_hedged(location, search_queries, per_query)
+        elif self.concurrent:
+            news_articles = self._fetch_concurrently(location, search_queries, per_query)
+        else:
+            news_articles = self._fetch_sequentially(location, search_queries, per_query)
+        
+        # If still no results, use mock data
+        using_mock = not news_articles
+        if using_mock:
+            print("📰 Using mock news data for testing...")
+            news_articles = self._get_mock_news(location)
         
-        # Create search queries combining location with disaster keywords
-        search_queries = [
+        # Remove duplicates and return top results
+        unique_articles = self._remove_duplicates(news_articles)
+        if not using_mock:
+            unique_articles = self._record_articles(unique_articles, location)
+            if only_new:
+                unique_articles = [article for article in unique_articles if article.get('is_new', True)]
+        return unique_articles[:max_results]
+    
+    def _search_queries(self, location: str) -> List[str]:
+        """Search queries combining location with disaster keywords"""
+        return [
             f"{location} disaster emergency alert",
             f"{location} earthquake flood hurricane",
             f"{location} weather warning evacuation"
         ]
+    
+    @staticmethod
+    def is_mock(article: Dict) -> bool:
+        """Whether an article is placeholder data rather than a search result"""
+        return article.get('search_engine') == MOCK_SEARCH_ENGINE
+    
+    def _record_articles(self, articles: List[Dict], location: str) -> List[Dict]:
+        """Upsert into the article store and flag the articles it had not seen"""
+        if not self.store_enabled:
+            return articles
+        try:
+            unseen = {id(article) for article in self.store.upsert(articles, location)}
+        except sqlite3.Error as e:
+            print(f"⚠️ Article store unavailable: {e}")
+            unseen = {id(article) for article in articles}
+        # Copies, so articles held by the search cache are not modified
+        return [dict(article, is_new=id(article) in unseen) for article in articles]
+    
+    def get_new_articles(self, location: str, since: float, limit: int = 50) -> List[Dict]:
+        """Stored articles first found for this location after `since` (epoch seconds)"""
+        return self.store.new_since(location, since, limit) if self.store_enabled else []
+    
+    def search_history(self, query: str, location: Optional[str] = None, limit: int = 20) -> List[Dict]:
+        """Full-text search over every article fetched so far"""
+        return self.store.search(query, location, limit) if self.store_enabled else []
+    
+    def get_store_stats(self) -> Dict:
+        """Article store counters (empty when the store is disabled)"""
+        return self.store.get_stats() if self.store_enabled else {}
+    
+    def _get_providers(self) -> List[tuple]:
+        """
+        Search providers in priority order as (name, fetch function) pairs,
+        without providers whose circuit is open
+        """
+        providers = []
+        if self.serper_api_key:
+            providers.append(('Serper', self._fetch_serper_news))
+        providers.append(('DuckDuckGo', self._fetch_duckduckgo_news))
+        return [(name, fetch) for name, fetch in providers if self._provider_available(name)]
+    
+    def _breaker(self, provider: str) -> Optional[CircuitBreaker]:
+        return get_circuit_breaker(provider) if self.breakers_enabled else None
+    
+    def _provider_available(self, provider: str) -> bool:
+        """False while the provider's circuit is open (skip it entirely)"""
+        breaker = self._breaker(provider)
+        if breaker is None or breaker.available():
+            return True
+        print(f"🔌 Skipping {provider}: circuit open")
+        return False
+    
+    def get_breaker_stats(self) -> Dict[str, Dict]:
+        """Circuit breaker state and counters for each provider"""
+        if not self.breakers_enabled:
+            return {}
+        providers = (['Serper'] if self.serper_api_key else []) + ['DuckDuckGo']
+        return {name: get_circuit_breaker(name).get_stats() for name in providers}
+    
+    def _fetch_sequentially(self, location: str, search_queries: List[str], per_query: int) -> List[Dict]:
+        """
+        Original one-after-another strategy: Serper first, DuckDuckGo only
+        when Serper returned nothing
+        """
+        news_articles = []
         
         # Try Serper API first
-        if self.serper_api_key:
+        if self.serper_api_key and self._provider_available('Serper'):
             print("🔍 Using Serper API for news search...")
             for query in search_queries:
                 try:
-                    articles = self._fetch_serper_news(query, max_results//len(search_queries))
+                    articles = self._fetch_cached('Serper', self._fetch_serper_news, location, query, per_query)
                     news_articles.extend(articles)
+                except CircuitOpenError:
+                    break  # Serper just tripped its breaker: stop waiting on it
                 except Exception as e:
                     print(f"Error fetching Serper news for query '{query}': {e}")
         
         # If no results from Serper or no API key, try DuckDuckGo
-        if not news_articles:
+        if not news_articles and self._provider_available('DuckDuckGo'):
             print("🦆 Falling back to DuckDuckGo search...")
             for query in search_queries:
                 try:
-                    articles = self._fetch_duckduckgo_news(query, max_results//len(search_queries))
+                    articles = self._fetch_cached('DuckDuckGo', self._fetch_duckduckgo_news, location, query, per_query)
                     news_articles.extend(articles)
+                except CircuitOpenError:
+                    break
                 except Exception as e:
                     print(f"Error fetching DuckDuckGo news for query '{query}': {e}")
         
-        # If still no results, use mock data
-        if not news_articles:
-            print("📰 Using mock news data for testing...")
-            news_articles = self._get_mock_news(location)
+        return news_articles
+    
+    def _fetch_concurrently(self, location: str, search_queries: List[str], per_query: int) -> List[Dict]:
+        """
+        Fan-out strategy: send every query to every provider at once and
+        merge whatever came back before the per-check deadline.
         
-        # Remove duplicates and return top results
-        unique_articles = self._remove_duplicates(news_articles)
-        return unique_articles[:max_results]
+        Results keep the sequential ordering (provider priority, then query
+        order), so Serper articles still come before DuckDuckGo ones.
+        """
+        providers = self._get_providers()
+        print(f"⚡ Searching {len(providers)} provider(s) concurrently...")
+        
+        executor = self._get_executor()
+        futures = {}
+        for p_index, (name, fetch) in enumerate(providers):
+            for q_index, query in enumerate(search_queries):
+                future = executor.submit(self._fetch_cached, name, fetch, location, query, per_query)
+                futures[future] = (p_index, q_index, name, query)
+        
+        done, not_done = wait(futures, timeout=self.check_deadline)
+        for future in not_done:
+            future.cancel()
+        if not_done:
+            print(f"⏱️ {len(not_done)} news request(s) missed the {self.check_deadline}s deadline")
+        
+        results = {}
+        for future in done:
+            p_index, q_index, name, query = futures[future]
+            try:
+                results[(p_index, q_index)] = future.result()
+            except CircuitOpenError:
+                pass  # the provider tripped during this check
+            except Exception as e:
+                print(f"Error fetching {name} news for query '{query}': {e}")
+        
+        news_articles = []
+        for key in sorted(results):
+            news_articles.extend(results[key])
+        return news_articles
+    
+    def _fetch_hedged(self, location: str, search_queries: List[str], per_query: int) -> List[Dict]:
+        """
+        Hedged strategy: every query goes to the primary provider. A query
+        the primary has not answered within the hedge delay (or that failed
+        or came back empty) is also sent to the backup provider, and the
+        first usable answer is kept. The slower request is ignored.
+        """
+        providers = self._get_providers()
+        if len(providers) < 2:
+            return self._fetch_concurrently(location, search_queries, per_query)
+        (primary, primary_fetch), (backup, backup_fetch) = providers[:2]
+        delay = self.hedge_delay(primary)
+        
+        executor = self._get_executor()
+        started = self.clock()
+        hedge_at = started + delay
+        deadline = started + self.check_deadline
+        primaries = {
+            query: executor.submit(self._fetch_cached, primary, primary_fetch, location, query, per_query)
+            for query in search_queries
+        }
+        hedges = {}
+        answers = {}
+        
+        def usable(future) -> bool:
+            return future.done() and not future.cancelled() and future.exception() is None and bool(future.result())
+        
+        def settled(query) -> bool:
+            """Whether the next pass can answer or hedge this query without waiting"""
+            primary_future, hedge_future = primaries[query], hedges.get(query)
+            if hedge_future is None:
+                return primary_future.done()
+            return usable(primary_future) or usable(hedge_future) or (
+                primary_future.done() and hedge_future.done()
+            )
+        
+        while len(answers) < len(search_queries):
+            now = self.clock()
+            for query in search_queries:
+                if query in answers:
+                    continue
+                primary_future, hedge_future = primaries[query], hedges.get(query)
+                if usable(primary_future):
+                    answers[query] = (primary, primary_future.result())
+                elif hedge_future is not None and usable(hedge_future):
+                    answers[query] = (backup, hedge_future.result())
+                elif hedge_future is None and (now >= hedge_at or primary_future.done()):
+                    # Primary is slow, failed or empty: race the backup
+                    hedges[query] = executor.submit(
+                        self._fetch_cached, backup, backup_fetch, location, query, per_query
+                    )
+                elif primary_future.done() and hedge_future is not None and hedge_future.done():
+                    answers[query] = (None, [])  # neither provider had anything
+            
+            pending = [
+                future for query in search_queries if query not in answers
+                for future in (primaries[query], hedges.get(query)) if future is not None and not future.done()
+            ]
+            if len(answers) == len(search_queries):
+                break
+            if now >= deadline:
+                print(f"⏱️ {len(search_queries) - len(answers)} hedged query(ies) missed the {self.check_deadline}s deadline")
+                break
+            next_event = deadline if hedges.keys() >= primaries.keys() else min(hedge_at, deadline)
+            if next_event <= now:
+                next_event = deadline
+            # A request that finished during this pass is handled straight away
+            ready = any(settled(query) for query in search_queries if query not in answers)
+            if pending and not ready:
+                wait(pending, timeout=max(0.0, next_event - now), return_when=FIRST_COMPLETED)
+        
+        # Losers (and anything past the deadline) are ignored
+        for future in list(primaries.values()) + list(hedges.values()):
+            future.cancel()
+        self._count_hedges(search_queries, hedges, answers, backup)
+        
+        news_articles = []
+        for query in search_queries:
+            news_articles.extend(answers.get(query, (None, []))[1])
+        return news_articles
+    
+    def hedge_delay(self, provider: str) -> float:
+        """
+        How long to wait for a provider before hedging: its recent latency
+        percentile from the search histogram, or the default until enough
+        requests have been timed
+        """
+        metrics = get_metrics()
+        if metrics.count("search", provider=provider) < NEWS_HEDGE_MIN_SAMPLES:
+            return NEWS_HEDGE_DEFAULT_DELAY
+        latency = metrics.percentile("search", self.hedge_percentile, provider=provider)
+        return max(NEWS_HEDGE_MIN_DELAY, latency or NEWS_HEDGE_DEFAULT_DELAY)
+    
+    def _count_hedges(self, search_queries: List[str], hedges: Dict, answers: Dict, backup: str):
+        hedge_wins = sum(1 for provider, _ in answers.values() if provider == backup)
+        with self._executor_lock:
+            self.hedge_stats['queries'] += len(search_queries)
+            self.hedge_stats['hedged'] += len(hedges)
+            self.hedge_stats['hedge_wins'] += hedge_wins
+        metrics = get_metrics()
+        metrics.inc("hedge_requests", len(hedges))
+        metrics.inc("hedge_wins", hedge_wins)
+    
+    def get_hedge_stats(self) -> Dict:
+        """Queries sent, how many were hedged and how many the backup won"""
+        with self._executor_lock:
+            stats = dict(self.hedge_stats)
+        primary = 'Serper' if self.serper_api_key else 'DuckDuckGo'
+        stats['delay'] = round(self.hedge_delay(primary), 3)
+        return stats
+    
+    def reserve_workers(self, checks: int):
+        """
+        Grow the fetch pool so `checks` concurrent checks can each run all
+        of their provider requests at once. Otherwise requests queue behind
+        other checks and the check deadline expires before they even start
+        """
+        providers = 2 if self.serper_api_key else 1
+        workers = checks * len(self._search_queries("")) * providers
+        with self._executor_lock:
+            if workers <= self.max_workers:
+                return
+            self.max_workers = workers
+            previous, self._executor = self._executor, None
+        if previous is not None:
+            previous.shutdown(wait=False)  # requests already running finish there
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Bounded thread pool shared by all checks of this agent"""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="news-fetch"
+                )
+        return self._executor
+    
+    def _cache_key(self, provider: str, location: str, query: str, num_results: int) -> tuple:
+        """Normalized cache key so "New York " and "new york" share entries"""
+        normalize = lambda text: " ".join(text.lower().split())
+        return (normalize(location), normalize(query), provider, num_results)
+    
+    def _fetch_cached(self, provider: str, fetch, location: str, query: str, num_results: int) -> List[Dict]:
+        """
+        Fetch through the search cache
+        
+        Fresh hits return immediately. Stale hits also return immediately
+        and schedule a background refresh. Misses call the provider and
+        store non-empty results.
+        """
+        if not self.cache_enabled:
+            return self._timed_fetch(provider, fetch, query, num_results)
+        
+        key = self._cache_key(provider, location, query, num_results)
+        articles, state = self.cache.get(key)
+        if articles is not None:
+            if state == STALE:
+                self._schedule_refresh(key, provider, fetch, query, num_results)
+            return [dict(article) for article in articles]
+        
+        articles = self._timed_fetch(provider, fetch, query, num_results)
+        if articles:
+            self.cache.set(key, articles)
+        return articles
+    
+    def _timed_fetch(self, provider: str, fetch, query: str, num_results: int) -> List[Dict]:
+        """
+        One provider request through the provider's circuit breaker,
+        recorded in the search latency histogram
+        
+        Raises:
+            CircuitOpenError: the circuit is open (the provider is not called)
+        """
+        breaker = self._breaker(provider)
+        if breaker is not None and not breaker.allow():
+            get_metrics().inc("breaker_rejections", provider=provider)
+            raise CircuitOpenError(f"{provider} circuit is open")
+        try:
+            with get_metrics().span("search", provider=provider):
+                articles = fetch(query, num_results)
+        except Exception:
+            if breaker is not None:
+                breaker.record_failure()
+            raise
+        if breaker is not None:
+            breaker.record_success()
+        return articles
+    
+    def _schedule_refresh(self, key: tuple, provider: str, fetch, query: str, num_results: int):
+        """Refresh a stale cache entry in the background (once per key)"""
+        with self._executor_lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+        
+        def refresh():
+            try:
+                articles = self._timed_fetch(provider, fetch, query, num_results)
+                if articles:
+                    self.cache.set(key, articles)
+                    with self._executor_lock:
+                        self._refresh_count += 1
+            except Exception as e:
+                print(f"Background refresh failed for '{query}': {e}")
+            finally:
+                with self._executor_lock:
+                    self._refreshing.discard(key)
+        
+        self._get_executor().submit(refresh)
+    
+    def get_cache_stats(self) -> Dict:
+        """Hit/miss statistics for the search result cache"""
+        stats = self.cache.get_stats()
+        stats['background_refreshes'] = self._refresh_count
+        return stats
+    
+    def clear_cache(self):
+        """Forget every cached search result"""
+        self.cache.invalidate()
     
     def _fetch_serper_news(self, query: str, num_results: int) -> List[Dict]:
         """
@@ -81,7 +501,7 @@ class NewsAgent:
             'gl': 'us'
         }
         
-        response = requests.post(self.serper_url, headers=headers, json=payload, timeout=10)
+        response = get_http_pool().post(self.serper_url, headers=headers, json=payload, timeout=10)
         response.raise_for_status()
         
         data = response.json()
@@ -131,8 +551,9 @@ class NewsAgent:
                 return articles
                 
         except Exception as e:
+            # Raised (not swallowed) so the DuckDuckGo circuit breaker sees the failure
             print(f"DuckDuckGo search failed: {e}")
-            return []
+            raise
     
     def _get_mock_news(self, location: str) -> List[Dict]:
         """
@@ -145,7 +566,7 @@ class NewsAgent:
                 'link': 'https://example.com/mock-news-1',
                 'source': 'Mock Emergency Services',
                 'date': '1 hour ago',
-                'search_engine': 'Mock Data'
+                'search_engine': MOCK_SEARCH_ENGINE
             },
             {
                 'title': f'Disaster Preparedness Reminder - {location} Area',
@@ -153,7 +574,7 @@ class NewsAgent:
                 'link': 'https://example.com/mock-news-2',
                 'source': 'Mock Local Authority',
                 'date': '3 hours ago',
-                'search_engine': 'Mock Data'
+                'search_engine': MOCK_SEARCH_ENGINE
             },
             {
                 'title': f'Infrastructure Status Report - {location}',
@@ -161,39 +582,50 @@ class NewsAgent:
                 'link': 'https://example.com/mock-news-3',
                 'source': 'Mock Infrastructure Dept',
                 'date': '5 hours ago',
-                'search_engine': 'Mock Data'
+                'search_engine': MOCK_SEARCH_ENGINE
             }
         ]
     
     def _remove_duplicates(self, articles: List[Dict]) -> List[Dict]:
-        """Remove duplicate articles based on title similarity"""
-        unique_articles = []
-        seen_titles = set()
-        
-        for article in articles:
-            # Create a normalized title for comparison
-            title_key = article['title'].lower().strip()[:50]  # First 50 chars
-            if title_key not in seen_titles:
-                seen_titles.add(title_key)
-                unique_articles.append(article)
-        
+        """Remove near-duplicate articles (similar title + snippet, via MinHash LSH)"""
+        unique_articles, merged = self.deduplicator.deduplicate(articles)
+        with self._executor_lock:
+            self.dedup_stats['articles_seen'] += len(articles)
+            self.dedup_stats['duplicates_merged'] += merged
+            self.dedup_stats['last_merged'] = merged
+        if merged:
+            print(f"🧹 Merged {merged} duplicate article(s)")
         return unique_articles
     
-    def format_news_for_analysis(self, articles: List[Dict]) -> str:
+    def get_dedup_stats(self) -> Dict:
+        """How many articles were seen and how many duplicates were merged"""
+        return dict(self.dedup_stats)
+    
+    def format_news_for_analysis(self, articles: List[Dict], location: Optional[str] = None) -> str:
         """
         Format news articles into a string for AI analysis
         """
-        if not articles:
-            return "No recent news articles found."
+        return self.pack_news_for_analysis(articles, location)[0]
+    
+    def pack_news_for_analysis(self, articles: List[Dict], location: Optional[str] = None) -> tuple:
+        """
+        Format news articles for AI analysis within the prompt token budget
         
-        formatted_news = "Recent News Articles:\n\n"
-        for i, article in enumerate(articles, 1):
-            formatted_news += f"{i}. {article['title']}\n"
-            formatted_news += f"   {article['snippet']}\n"
-            formatted_news += f"   Source: {article['source']} | {article['date']}\n"
-            formatted_news += f"   Search Engine: {article.get('search_engine', 'Unknown')}\n\n"
+        Returns:
+            (formatted news, {"articles", "packed", "dropped", "tokens", "budget"})
+        """
+        if not articles:
+            text = "No recent news articles found."
+            return text, {"articles": 0, "packed": 0, "dropped": 0,
+                          "tokens": estimate_tokens(text), "budget": self.packer.token_budget}
         
-        return formatted_news
+        with get_metrics().span("format"):
+            formatted_news, stats = self.packer.pack(articles, location)
+        metrics = get_metrics()
+        metrics.inc("prompt_tokens", stats["tokens"])
+        metrics.inc("prompt_articles", stats["packed"], outcome="packed")
+        metrics.inc("prompt_articles", stats["dropped"], outcome="dropped")
+        return formatted_news, stats
     
     def get_search_capabilities(self) -> Dict[str, bool]:
         """
@@ -0,0 +1,104 @@
+import threading
+import time
+from typing import Callable, Dict, Tuple
+
+
+def create_llm(model_name: str, temperature: float):
+    """Build a Groq chat model (default factory when no registry is used)"""
+    from langchain_groq import ChatGroq
+    from config import GROQ_API_KEY, GROQ_BASE_URL
+    return ChatGroq(
+        groq_api_key=GROQ_API_KEY,
+        groq_api_base=GROQ_BASE_URL,
+        model_name=model_name,
+        temperature=temperature
+    )
+
+
+class AgentRegistry:
+    """
+    AGENT REGISTRY: Builds agents lazily and shares what they have in common
+    Nothing is constructed until first use, and every agent asking for the
+    same (model, temperature) gets the same Groq client. AlertAgent reuses
+    the registry's AlertMessageAgent and AlertSender instead of building its own.
+    Access agents like a dict: registry['news'], registry['alert'], ...
+    """
+
+    def __init__(self):
+        self._instances: Dict[str, object] = {}
+        self._llms: Dict[Tuple[str, float], object] = {}
+        self._lock = threading.RLock()
+        self.build_times: Dict[str, float] = {}
+
+        self._builders: Dict[str, Callable[[], object]] = {
+            'news': self._build_news,
+            'alert': self._build_alert,
+            'chat': self._build_chat,
+            'message': self._build_message,
+            'sender': self._build_sender,
+            'pipeline': self._build_pipeline
+        }
+
+    def get_llm(self, model_name: str, temperature: float):
+        """One shared Groq client per model and settings"""
+        key = (model_name, temperature)
+        with self._lock:
+            if key not in self._llms:
+                started = time.perf_counter()
+                self._llms[key] = create_llm(model_name, temperature)
+                self.build_times[f"llm:{model_name}@{temperature}"] = time.perf_counter() - started
+            return self._llms[key]
+
+    def get(self, name: str):
+        """Return the named component, building it on first use"""
+        with self._lock:
+            if name not in self._instances:
+                if name not in self._builders:
+                    raise KeyError(f"Unknown agent: {name}")
+                started = time.perf_counter()
+                self._instances[name] = self._builders[name]()
+                self.build_times[name] = time.perf_counter() - started
+            return self._instances[name]
+
+    def __getitem__(self, name: str):
+        return self.get(name)
+
+    def is_built(self, name: str) -> bool:
+        return name in self._instances
+
+    def get_stats(self) -> Dict:
+        """What has been built so far and how long each build took (seconds)"""
+        with self._lock:
+            return {
+                'built': sorted(self._instances),
+                'llm_clients': len(self._llms),
+                'build_times': {name: round(seconds, 4) for name, seconds in self.build_times.items()}
+            }
+
+    def _build_news(self):
+        from agents.news_agent import NewsAgent
+        return NewsAgent()
+
+    def _build_sender(self):
+        from agents.alert_sender import AlertSender
+        return AlertSender()
+
+    def _build_message(self):
+        from agents.alert_message_agent import AlertMessageAgent
+        return AlertMessageAgent(llm_factory=self.get_llm)
+
+    def _build_alert(self):
+        from agents.alert_agent import AlertAgent
+        return AlertAgent(
+            llm_factory=self.get_llm,
+            message_agent=self.get('message'),
+            alert_sender=self.get('sender')
+        )
+
+    def _build_chat(self):
+        from agents.chat_agent import ChatAgent
+        return ChatAgent(llm_factory=self.get_llm)
+
+    def _build_pipeline(self):
+        from agents.check_pipeline import CheckPipeline
+        return CheckPipeline(news_agent=self.get('news'), alert_agent=self.get('alert'))
@@ -1,10 +1,10 @@
 import streamlit as st
 import time
 import os
-from agents.news_agent import NewsAgent
-from agents.alert_agent import AlertAgent
-from agents.chat_agent import ChatAgent
-from agents.alert_message_agent import AlertMessageAgent
+from agents.registry import AgentRegistry
+from config import print_config_status
+from utils.metrics import get_metrics
+from utils.circuit_breaker import get_breaker_states
 
 # Configure Streamlit page
 st.set_page_config(
@@ -221,16 +221,28 @@ initialize_session_state()
 # Initialize agents
 @st.cache_resource
 def initialize_agents():
-    """Initialize all agents (cached to avoid reinitializing)"""
-    return {
-        'news': NewsAgent(),
-        'alert': AlertAgent(),
-        'chat': ChatAgent(),
-        'message': AlertMessageAgent()
-    }
+    """
+    Agent registry (cached to avoid reinitializing). Each agent is built on
+    first use, e.g. agents['alert'], and agents share one Groq client per
+    model and temperature
+    """
+    print_config_status()
+    return AgentRegistry()
 
 agents = initialize_agents()
 
+# Seconds the Disaster Monitor waits (after rendering) for the Discord delivery result
+ALERT_STATUS_WAIT = 5
+
+def alert_status_label(result: dict) -> str:
+    """Discord delivery status for a pipeline result"""
+    handle = result.get('alert_handle')
+    if handle and handle.delivered:
+        return "✅ Sent"
+    if result['alert_sent'] and not (handle and handle.done()):
+        return "📤 Queued"
+    return "❌ Failed"
+
 # Main UI
 st.markdown("""
 <div class="main-title">
@@ -259,7 +271,7 @@ if st.sidebar.button("🔔Trigger Discord Alert"):
                 if success:
                     st.success("✅ Discord alert system working!")
                 else:
-                    st.error("❌ Discord webhook not configured.")
+                    st.error("❌ Discord alert not delivered. Check the webhook configuration.")
     else:
         st.sidebar.error("Please enter your location first.")
 
@@ -417,15 +429,40 @@ with tab1:
         if not user_location:
             st.error("Please enter your location in the sidebar first.")
         else:
+            # Staged pipeline: articles render as soon as they are fetched while
+            # the analysis runs; the Discord alert is delivered in the background
+            result_area = st.container()
+            news_articles = []
+            result = None
             with st.spinner(f"Searching for disasters near {user_location}..."):
-                news_articles = agents['news'].search_disaster_news(user_location)
+                for stage, output in agents['pipeline'].run(user_location):
+                    if stage == "articles":
+                        news_articles = output
+                        if news_articles:
+                            with st.expander("📰 View News Articles"):
+                                for i, article in enumerate(news_articles, 1):
+                                    new_tag = "🆕 " if article.get('is_new') else ""
+                                    st.write(f"**{i}. {new_tag}{article['title']}**")
+                                    st.write(article['snippet'])
+                                    st.write(f"*Source: {article['source']} | {article['date']}*")
+                                    if article['link'] and not article['link'].startswith('https://example.com'):
+                                        st.write(f"[Read more]({article['link']})")
+                                    st.divider()
+                    elif stage == "result":
+                        result = output
+            
+            if not news_articles:
+                st.info("No recent news found for your location. This might be good news!")
+            elif result:
+                st.session_state.last_analysis = result
+                handle = result.get('alert_handle')
+                discord_status = None
                 
-                if news_articles:
-                    news_data = agents['news'].format_news_for_analysis(news_articles)
-                    result = agents['alert'].analyze_and_alert(news_data, user_location)
-                    st.session_state.last_analysis = result
-                    
-                    if result['analysis']['disaster_found']:
+                with result_area:
+                    if result['analysis'].get('error'):
+                        st.warning(f"⚠️ The analysis failed: {result['analysis']['error']}. "
+                                   "No alert was sent. Please try again.")
+                    elif result['analysis']['disaster_found']:
                         st.error("🚨 **DISASTER ALERT!**")
                         
                         col_a, col_b = st.columns(2)
@@ -433,7 +470,8 @@ with tab1:
                             st.metric("Disaster Type", result['analysis']['disaster_type'])
                             st.metric("Severity", result['analysis']['severity'])
                         with col_b:
-                            st.metric("Discord Alert", "✅ Sent" if result['alert_sent'] else "❌ Failed")
+                            discord_status = st.empty()
+                            discord_status.metric("Discord Alert", alert_status_label(result))
                             st.metric("Location", f"📍 {user_location}")
                         
                         st.write("**Description:**", result['analysis']['description'])
@@ -446,16 +484,16 @@ with tab1:
                         st.success("✅ No immediate disasters detected in your area.")
                         st.info("Stay alert and check back regularly for updates.")
                     
-                    with st.expander("📰 View News Articles"):
-                        for i, article in enumerate(news_articles, 1):
-                            st.write(f"**{i}. {article['title']}**")
-                            st.write(article['snippet'])
-                            st.write(f"*Source: {article['source']} | {article['date']}*")
-                            if article['link'] and not article['link'].startswith('https://example.com'):
-                                st.write(f"[Read more]({article['link']})")
-                            st.divider()
-                else:
-                    st.info("No recent news found for your location. This might be good news!")
+                    caption = "⏱️ " + " · ".join(f"{stage} {seconds:.2f}s" for stage, seconds in result['timings'].items())
+                    if result.get('prompt'):
+                        prompt = result['prompt']
+                        caption += f" · 📝 prompt ~{prompt['tokens']} tokens ({prompt['packed']}/{prompt['articles']} articles)"
+                    st.caption(caption)
+                
+                # Everything is on screen; now give the delivery a moment to land
+                if discord_status is not None and handle and not handle.done():
+                    handle.wait(ALERT_STATUS_WAIT)
+                    discord_status.metric("Discord Alert", alert_status_label(result))
 
 with tab2:
     st.header("💬 AI Disaster Assistant")
@@ -516,23 +554,23 @@ with tab2:
                         Description: {analysis.get('description', 'No description')}
                         """
                 
-                # Get AI response using regular chat method
-                with st.spinner("🤔 Preparing response..."):
-                    try:
-                        response = agents['chat'].chat(user_message, context)
-                        
-                        # Add AI response
-                        st.session_state.chat_history.append({
-                            'role': 'assistant',
-                            'content': response
-                        })
-                    except Exception as e:
-                        error_msg = "I apologize, but I'm having trouble processing your request right now. Please try again."
-                        st.error(f"Sorry, I encountered an error: {str(e)}")
-                        st.session_state.chat_history.append({
-                            'role': 'assistant',
-                            'content': error_msg
-                        })
+                # Stream the AI response so tokens render as they arrive
+                try:
+                    st.markdown("**🤖 ReDAC:**")
+                    response = st.write_stream(agents['chat'].stream_chat(user_message, context))
+                    
+                    # Add AI response
+                    st.session_state.chat_history.append({
+                        'role': 'assistant',
+                        'content': response
+                    })
+                except Exception as e:
+                    error_msg = "I apologize, but I'm having trouble processing your request right now. Please try again."
+                    st.error(f"Sorry, I encountered an error: {str(e)}")
+                    st.session_state.chat_history.append({
+                        'role': 'assistant',
+                        'content': error_msg
+                    })
                 
                 # Reset processing flag and increment key
                 st.session_state.processing_chat = False
@@ -840,12 +878,37 @@ if os.getenv("SERPER_API_KEY"):
 else:
     st.sidebar.markdown('<div class="status-badge" style="background: rgba(254, 202, 87, 0.8);">⚠️ Using Mock News Data</div>', unsafe_allow_html=True)
 
+# News provider circuit breakers (only providers used so far are listed)
+breaker_icons = {"closed": "🟢", "half_open": "🟡", "open": "🔴"}
+breaker_states = get_breaker_states()
+if breaker_states:
+    st.sidebar.caption("🔌 Circuits: " + " · ".join(
+        f"{breaker_icons.get(stats['state'], '⚪')} {name} {stats['state'].replace('_', '-')}"
+        + (f" (retry in {stats['retry_in']:.0f}s)" if stats['state'] == "open" else "")
+        for name, stats in breaker_states.items()
+    ))
+
 # Discord status indicator
 if os.getenv("DISCORD_WEBHOOK_URL"):
     st.sidebar.markdown('<div class="status-badge" style="background: rgba(0, 210, 211, 0.8);">✅ Discord Ready</div>', unsafe_allow_html=True)
 else:
     st.sidebar.markdown('<div class="status-badge" style="background: rgba(255, 107, 107, 0.8);">❌ Discord Not Configured</div>', unsafe_allow_html=True)
 
+# Per-stage latency (recent p50 / p95 of every timed stage)
+metrics = get_metrics()
+latency_rows = metrics.summary()
+with st.sidebar.expander("⏱️ Latency (p50 / p95)", expanded=False):
+    if latency_rows:
+        for row in latency_rows:
+            label = row["name"] + "".join(f" · {value}" for value in row["labels"].values())
+            st.caption(f"**{label}**: {row['p50'] * 1000:.0f} / {row['p95'] * 1000:.0f} ms ({row['count']}×)")
+    else:
+        st.caption("No timings recorded yet")
+    st.download_button("Prometheus metrics", metrics.to_prometheus(), file_name="redac_metrics.prom",
+                       mime="text/plain")
+    st.download_button("JSON snapshot", metrics.to_json(), file_name="redac_metrics.json",
+                       mime="application/json")
+
 st.sidebar.info(f"📍 **Current Location:** {user_location if user_location else 'Not set'}")
 st.sidebar.info("📢 🔔Powered by **Discord** for Instant Alerts")
 
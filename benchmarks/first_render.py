@@ -0,0 +1,45 @@
+"""
+First-render benchmark for the Streamlit page
+
+Runs app.py headless with Streamlit's AppTest and reports how long the
+first (cold) render takes, plus a few warm reruns. Run each measurement in
+a fresh process so imports and cached resources start cold:
+
+    python benchmarks/first_render.py --runs 3
+"""
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Measure Streamlit first-render time")
+    parser.add_argument("--runs", type=int, default=3, help="Renders in this process (first one is cold)")
+    args = parser.parse_args(argv)
+
+    # Agents must be constructible without real keys; no network is used on first render
+    os.environ.setdefault("GROQ_API_KEY", "benchmark")
+    sys.path.insert(0, ROOT)
+    from streamlit.testing.v1 import AppTest
+
+    timings = []
+    for _ in range(args.runs):
+        started = time.perf_counter()
+        app = AppTest.from_file(os.path.join(ROOT, "app.py"), default_timeout=60)
+        app.run()
+        timings.append(time.perf_counter() - started)
+        if app.exception:
+            print(f"❌ App raised: {app.exception}")
+            return 1
+
+    print(f"⏱️ First render: {timings[0]:.3f}s")
+    if len(timings) > 1:
+        print(f"⏱️ Warm reruns: {', '.join(f'{t:.3f}s' for t in timings[1:])}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
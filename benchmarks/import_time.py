@@ -0,0 +1,103 @@
+"""
+Import-time budget for the package
+
+Imports each module in a fresh interpreter with `python -X importtime`
+and fails (exit code 1) when its cumulative import time goes over the
+budget, or imports LangChain/pydantic at all. Those only load when a chain
+or parser is first used:
+
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --budget agents=50 --runs 5
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Cumulative import time budgets in milliseconds. The agent modules pay for
+# requests/urllib3 and for loading .env (their settings are read when they
+# are imported); nothing here may import LangChain or pydantic
+DEFAULT_BUDGETS_MS = {
+    "config": 20,
+    "utils": 20,
+    "agents": 20,
+    "agents.registry": 30,
+    "agents.news_agent": 250,
+    "agents.alert_agent": 300,
+    "agents.chat_agent": 100
+}
+FORBIDDEN_PREFIXES = ("langchain", "langchain_core", "langchain_groq", "langsmith", "pydantic")
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)$")
+
+
+def measure(module: str) -> tuple:
+    """
+    Import `module` in a fresh interpreter
+
+    Returns:
+        (cumulative milliseconds, names of every module it imported)
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, capture_output=True, text=True
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{completed.stderr[-2000:]}")
+
+    cumulative_us = 0
+    imported = []
+    for line in completed.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        imported.append(match.group(4))
+        if match.group(4) == module and not match.group(3).strip(" "):
+            cumulative_us = int(match.group(2))
+    return cumulative_us / 1000, imported
+
+
+def parse_budgets(overrides) -> dict:
+    budgets = dict(DEFAULT_BUDGETS_MS)
+    for item in overrides or []:
+        module, _, value = item.partition("=")
+        budgets[module.strip()] = float(value)
+    return budgets
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Check import-time budgets")
+    parser.add_argument("--runs", type=int, default=3, help="Fresh imports per module (best run counts)")
+    parser.add_argument(
+        "--budget", action="append", metavar="MODULE=MS",
+        help="Override or add a budget, e.g. --budget agents=15"
+    )
+    args = parser.parse_args(argv)
+
+    failures = 0
+    for module, budget in parse_budgets(args.budget).items():
+        runs = [measure(module) for _ in range(max(1, args.runs))]
+        best_ms = min(ms for ms, _ in runs)
+        heavy = sorted({
+            name for name in runs[0][1]
+            if name.split(".")[0] in FORBIDDEN_PREFIXES
+        })
+
+        ok = best_ms <= budget and not heavy
+        failures += not ok
+        print(f"{'✅' if ok else '❌'} {module:<22} {best_ms:8.1f} ms  (budget {budget:.0f} ms)")
+        if heavy:
+            print(f"   imports heavy dependencies at import time: {', '.join(heavy[:5])}")
+
+    if failures:
+        print(f"❌ {failures} module(s) over the import-time budget")
+        return 1
+    print("✅ All modules within the import-time budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
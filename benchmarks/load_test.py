@@ -0,0 +1,268 @@
+"""
+End-to-end load benchmark against local stub services
+
+Starts benchmarks/stubs.py (Serper, DuckDuckGo, Groq, Discord), points the
+agents at it and drives NewsAgent, AlertAgent and ChatAgent from several
+threads. Reports p50/p95/p99 latency and throughput per scenario, plus
+what each stub saw and the per-stage timings. No network access or real API keys are needed:
+
+    python benchmarks/load_test.py
+    python benchmarks/load_test.py --requests 200 --concurrency 16 --groq-latency-ms 800
+    python benchmarks/load_test.py --error-rate 0.05 --rate-limit-rate 0.05 --json results.json
+    python benchmarks/load_test.py --scenarios fleet --fleet-size 12 --packed
+    python benchmarks/load_test.py --scenarios news --hedge --serper-latency-ms 600
+
+The DuckDuckGo library talks to duckduckgo.com directly and cannot be
+redirected, so NewsAgent's DuckDuckGo fetch is swapped for one that calls
+the stub (same article mapping); everything else runs unmodified.
+"""
+import argparse
+import json
+import math
+import os
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks.stubs import SERVICES, StubBehavior, StubServer, fake_articles  # noqa: E402
+
+SCENARIOS = ("news", "alert", "chat", "fleet")
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, math.ceil(pct / 100 * len(sorted_values)) - 1)
+    return sorted_values[rank]
+
+
+def run_load(operation: Callable[[int], None], requests: int, concurrency: int) -> Dict:
+    """Call operation(i) `requests` times from `concurrency` threads"""
+    latencies: List[float] = []
+    errors: List[str] = []
+    lock = threading.Lock()
+
+    def timed(index: int):
+        started = time.perf_counter()
+        try:
+            operation(index)
+        except Exception as e:
+            with lock:
+                errors.append(f"{type(e).__name__}: {e}")
+        finally:
+            elapsed = time.perf_counter() - started
+            with lock:
+                latencies.append(elapsed)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(timed, range(requests)))
+    wall = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests": requests,
+        "errors": len(errors),
+        "first_error": errors[0] if errors else "",
+        "p50_ms": round(percentile(latencies, 50) * 1000, 1),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 1),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 1),
+        "max_ms": round(latencies[-1] * 1000, 1) if latencies else 0.0,
+        "throughput_rps": round(requests / wall, 2) if wall else 0.0,
+        "wall_seconds": round(wall, 3)
+    }
+
+
+def configure_environment(stubs: StubServer, data_dir: str):
+    """Point every agent at the stubs; must run before config settings are first read"""
+    os.environ.update({
+        "GROQ_API_KEY": "stub-key",
+        "GROQ_BASE_URL": stubs.url,
+        "SERPER_API_KEY": "stub-key",
+        "NEWS_API_URL": f"{stubs.url}/news",
+        "DISCORD_WEBHOOK_URL": stubs.discord_webhook_url,
+        "DISCORD_WEBHOOK_PREFIX": f"{stubs.url}/api/webhooks/",
+        "ARTICLE_STORE_PATH": os.path.join(data_dir, "articles.db"),
+        # Measure the work itself, not the caches
+        "NEWS_CACHE_ENABLED": "false",
+        "ANALYSIS_CACHE_ENABLED": "false",
+        "ALERT_DIGEST_MODE": "false"
+    })
+
+
+def patch_duckduckgo(stubs: StubServer):
+    """Send NewsAgent's DuckDuckGo fetch to the stub instead of duckduckgo.com"""
+    from agents.news_agent import NewsAgent
+    from utils.http_pool import get_http_pool
+
+    def fetch_stub_duckduckgo(self, query: str, num_results: int) -> List[Dict]:
+        response = get_http_pool().get(
+            f"{stubs.url}/ddg/news", params={"q": query, "max_results": num_results}, timeout=10
+        )
+        response.raise_for_status()
+        return [{
+            'title': item.get('title', ''),
+            'snippet': item.get('body', ''),
+            'link': item.get('url', ''),
+            'source': item.get('source', 'DuckDuckGo'),
+            'date': item.get('date', 'Recent'),
+            'search_engine': 'DuckDuckGo'
+        } for item in response.json().get('results', [])]
+
+    NewsAgent._fetch_duckduckgo_news = fetch_stub_duckduckgo
+
+
+def build_scenarios(args, alert_handles: List) -> Dict[str, Callable[[int], None]]:
+    """One operation per scenario; alert delivery handles are collected in alert_handles"""
+    from agents.registry import AgentRegistry
+    from agents.batch_monitor import BatchMonitor
+    from agents.chat_agent import ChatAgent
+
+    registry = AgentRegistry()
+    news_agent = registry['news']
+    alert_agent = registry['alert']
+    batch_monitor = BatchMonitor(news_agent=news_agent, alert_agent=alert_agent, packed=args.packed)
+    handles_lock = threading.Lock()
+    chat_agents = threading.local()
+
+    def news(index: int):
+        news_agent.search_disaster_news(f"City{index}", max_results=args.articles)
+
+    def alert(index: int):
+        articles = fake_articles(f"City{index} disaster", args.articles)
+        news_data = news_agent.format_news_for_analysis(articles, f"City{index}")
+        result = alert_agent.analyze_and_alert(news_data, f"City{index}")
+        if "error" in result["analysis"]:
+            raise RuntimeError(result["analysis"]["error"])
+        with handles_lock:
+            alert_handles.append(result["alert_handle"])
+
+    def chat(index: int):
+        # Conversation memory is per user, so each load thread is its own user
+        agent = getattr(chat_agents, "agent", None)
+        if agent is None:
+            agent = chat_agents.agent = ChatAgent(llm_factory=registry.get_llm)
+        if args.stream_chat:
+            "".join(agent.stream_chat(f"How do I prepare for a flood? ({index})"))
+        else:
+            agent.chat(f"How do I prepare for a flood? ({index})")
+
+    def fleet(index: int):
+        # One fleet-wide scan (BatchMonitor) per operation; alerts are not sent
+        locations = [f"Fleet{index}-{number}" for number in range(args.fleet_size)]
+        result = batch_monitor.run(locations, max_results=args.articles, send_alerts=False)
+        if result["throughput"]["errors"]:
+            raise RuntimeError(next(row["error"] for row in result["results"] if row["error"]))
+
+    return {"news": news, "alert": alert, "chat": chat, "fleet": fleet}
+
+
+def format_table(results: Dict[str, Dict]) -> str:
+    header = f"{'scenario':<8} {'reqs':>5} {'errors':>6} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8} {'req/s':>8}"
+    lines = [header, "-" * len(header)]
+    for name, row in results.items():
+        lines.append(
+            f"{name:<8} {row['requests']:>5} {row['errors']:>6} {row['p50_ms']:>8} {row['p95_ms']:>8} "
+            f"{row['p99_ms']:>8} {row['max_ms']:>8} {row['throughput_rps']:>8}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Load-test the agents against local stub services")
+    parser.add_argument("--scenarios", default="news,alert,chat", help="Comma-separated: news,alert,chat,fleet")
+    parser.add_argument("--requests", type=int, default=50, help="Operations per scenario")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent callers")
+    parser.add_argument("--articles", type=int, default=5, help="Articles per search / analysis")
+    parser.add_argument("--latency-ms", type=float, default=80, help="Serper/DDG/Discord stub latency")
+    parser.add_argument("--serper-latency-ms", type=float, help="Serper stub latency (default: --latency-ms)")
+    parser.add_argument("--groq-latency-ms", type=float, default=400, help="Groq stub latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of 500 responses (every stub)")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Share of 429 responses (every stub)")
+    parser.add_argument("--severity", default="Medium", help="Severity the stub analysis reports")
+    parser.add_argument("--discord-limit", type=int, default=5, help="Discord stub bucket size")
+    parser.add_argument("--discord-window", type=float, default=2.0, help="Discord stub bucket window (s)")
+    parser.add_argument("--stream-chat", action="store_true", help="Use stream_chat instead of chat")
+    parser.add_argument("--fleet-size", type=int, default=8, help="Locations per fleet scan")
+    parser.add_argument("--packed", action="store_true", help="Fleet scans pack locations into batched analyses")
+    parser.add_argument("--hedge", action="store_true", help="Hedged news requests instead of the fan-out")
+    parser.add_argument("--flush-timeout", type=float, default=60, help="Seconds to wait for queued alerts")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", metavar="PATH", help="Also write the results as JSON")
+    args = parser.parse_args(argv)
+
+    def behavior(latency_ms: float, offset: int) -> StubBehavior:
+        return StubBehavior(latency=latency_ms / 1000, error_rate=args.error_rate,
+                            rate_limit_rate=args.rate_limit_rate, seed=args.seed + offset)
+
+    behaviors = {service: behavior(args.latency_ms, offset) for offset, service in enumerate(SERVICES)}
+    behaviors["groq"] = behavior(args.groq_latency_ms, len(SERVICES))
+    if args.serper_latency_ms is not None:
+        behaviors["serper"] = behavior(args.serper_latency_ms, len(SERVICES) + 1)
+
+    with StubServer(behaviors, analysis_severity=args.severity, discord_limit=args.discord_limit,
+                    discord_window=args.discord_window) as stubs, tempfile.TemporaryDirectory() as data_dir:
+        configure_environment(stubs, data_dir)
+        if args.hedge:
+            os.environ["NEWS_HEDGE_ENABLED"] = "true"
+        patch_duckduckgo(stubs)
+        alert_handles = []
+        operations = build_scenarios(args, alert_handles)
+
+        results = {}
+        for name in [s.strip() for s in args.scenarios.split(",") if s.strip()]:
+            if name not in SCENARIOS:
+                print(f"❌ Unknown scenario: {name}")
+                return 2
+            print(f"⏱️ Running {name}: {args.requests} requests, concurrency {args.concurrency}...")
+            results[name] = run_load(operations[name], args.requests, args.concurrency)
+
+        # Alerts are delivered in the background: report how long the queue took to drain
+        delivery = {}
+        if alert_handles:
+            from utils.alert_queue import get_alert_dispatcher
+            started = time.perf_counter()
+            get_alert_dispatcher().flush(args.flush_timeout)
+            delivery = {
+                "queued": len(alert_handles),
+                "delivered": sum(1 for handle in alert_handles if handle and handle.delivered),
+                "drain_seconds": round(time.perf_counter() - started, 3)
+            }
+
+        print()
+        print(format_table(results))
+        for name, row in results.items():
+            if row["first_error"]:
+                print(f"⚠️ {name}: first error: {row['first_error'][:200]}")
+        if delivery:
+            print(f"📤 Alerts: {delivery['delivered']}/{delivery['queued']} delivered, "
+                  f"queue drained in {delivery['drain_seconds']}s")
+        print("🛰️ Stub requests: " + ", ".join(
+            f"{service} {counts['requests']} ({counts['errors']} errors, {counts['rate_limited']} 429s)"
+            for service, counts in stubs.counters.items()
+        ))
+
+        from utils.metrics import get_metrics
+        metrics = get_metrics()
+        print("🔬 Stages: " + ", ".join(
+            f"{row['name']}{''.join('/' + value for value in row['labels'].values())} "
+            f"p50 {row['p50'] * 1000:.0f} ms p95 {row['p95'] * 1000:.0f} ms"
+            for row in metrics.summary()
+        ))
+
+        if args.json:
+            with open(args.json, "w") as handle:
+                json.dump({"results": results, "delivery": delivery, "stubs": stubs.counters,
+                           "stages": metrics.snapshot(), "settings": vars(args)}, handle, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,328 @@
+"""
+Local stand-ins for the services ReDAC talks to
+
+One threaded HTTP server answers like:
+- Serper news      POST /news
+- DuckDuckGo news  GET  /ddg/news?q=...&max_results=...
+- Groq             POST /openai/v1/chat/completions (OpenAI format, streaming and
+                   batched multi-location analyses too)
+- Discord webhook  POST /api/webhooks/<id>/<token> (with X-RateLimit-* headers)
+
+Each service has its own StubBehavior: latency (with jitter), a share of
+500 errors and a share of 429s. Used by benchmarks/load_test.py; nothing
+here needs network access.
+"""
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+from urllib.parse import parse_qs, urlsplit
+
+HAZARDS = ["flood", "earthquake", "wildfire", "hurricane", "landslide", "tornado", "cyclone", "tsunami"]
+
+SERVICES = ("serper", "ddg", "groq", "discord")
+
+# Location headers of a batched analysis prompt
+_BATCH_LOCATION = re.compile(r"=== Location \d+: (.+?) ===")
+
+
+class StubBehavior:
+    """How one stub service responds: latency, errors and rate limiting"""
+
+    def __init__(self, latency: float = 0.05, jitter: float = 0.2, error_rate: float = 0.0,
+                 rate_limit_rate: float = 0.0, retry_after: float = 0.1, seed: Optional[int] = None):
+        self.latency = latency  # seconds
+        self.jitter = jitter  # ± share of the latency
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def outcome(self) -> str:
+        """"ok", "error" or "rate_limited" for the next request"""
+        with self._lock:
+            roll = self._random.random()
+        if roll < self.rate_limit_rate:
+            return "rate_limited"
+        if roll < self.rate_limit_rate + self.error_rate:
+            return "error"
+        return "ok"
+
+    def wait(self):
+        with self._lock:
+            factor = 1 + self._random.uniform(-self.jitter, self.jitter)
+        time.sleep(max(0.0, self.latency * factor))
+
+
+class _DiscordBucket:
+    """Fixed-window bucket that answers like Discord's webhook rate limit"""
+
+    def __init__(self, limit: int, window: float):
+        self.limit = limit
+        self.window = window
+        self.remaining = limit
+        self.reset_at = time.monotonic() + window
+        self._lock = threading.Lock()
+
+    def take(self):
+        """(allowed, remaining, reset_after)"""
+        with self._lock:
+            now = time.monotonic()
+            if now >= self.reset_at:
+                self.remaining = self.limit
+                self.reset_at = now + self.window
+            allowed = self.remaining > 0
+            if allowed:
+                self.remaining -= 1
+            return allowed, self.remaining, max(0.0, self.reset_at - now)
+
+
+def fake_articles(query: str, count: int) -> list:
+    """Deterministic articles for a query (same query → same articles)"""
+    seed = int(hashlib.sha1(query.encode("utf-8")).hexdigest()[:8], 16)
+    place = query.split(" ")[0] or "Somewhere"
+    articles = []
+    for index in range(count):
+        hazard = HAZARDS[(seed + index) % len(HAZARDS)]
+        articles.append({
+            "title": f"{hazard.title()} reported near {place} ({seed % 997}-{index})",
+            "snippet": f"Officials say a {hazard} affected parts of {place}. "
+                       f"Residents are advised to follow emergency guidance. Update {index}.",
+            "link": f"https://news.example.org/{seed}/{index}",
+            "source": "Stub News",
+            "date": f"{index + 1} hours ago"
+        })
+    return articles
+
+
+class StubServer:
+    """
+    Runs every stub service on one local port
+
+        with StubServer(behaviors) as stubs:
+            stubs.url  # http://127.0.0.1:<port>
+    """
+
+    def __init__(self, behaviors: Optional[Dict[str, StubBehavior]] = None, analysis_severity: str = "Medium",
+                 discord_limit: int = 5, discord_window: float = 2.0, host: str = "127.0.0.1", port: int = 0):
+        self.behaviors = {service: StubBehavior() for service in SERVICES}
+        self.behaviors.update(behaviors or {})
+        self.analysis_severity = analysis_severity
+        self.discord_bucket = _DiscordBucket(discord_limit, discord_window)
+        self.counters = {service: {"requests": 0, "errors": 0, "rate_limited": 0} for service in SERVICES}
+        self._counter_lock = threading.Lock()
+
+        stub = self
+
+        class Handler(_StubHandler):
+            server_stub = stub
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def discord_webhook_url(self) -> str:
+        return f"{self.url}/api/webhooks/123456789/stub-token"
+
+    def start(self) -> "StubServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="stub-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "StubServer":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def count(self, service: str, outcome: str):
+        with self._counter_lock:
+            self.counters[service]["requests"] += 1
+            if outcome == "error":
+                self.counters[service]["errors"] += 1
+            elif outcome == "rate_limited":
+                self.counters[service]["rate_limited"] += 1
+
+    def count_bucket_limited(self, service: str):
+        """A request that passed the random outcome but hit the rate-limit bucket"""
+        with self._counter_lock:
+            self.counters[service]["rate_limited"] += 1
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, like the real services
+    server_stub: StubServer = None
+
+    def log_message(self, format, *args):
+        pass  # keep benchmark output clean
+
+    # Routing
+
+    def do_GET(self):
+        path = urlsplit(self.path).path
+        if path == "/ddg/news":
+            self._handle("ddg", self._ddg)
+        elif path.startswith("/api/webhooks/"):
+            self._send_json(200, {"id": "123456789", "name": "stub"})
+        else:
+            self._send_json(404, {"error": "not found"})
+
+    def do_POST(self):
+        path = urlsplit(self.path).path
+        if path == "/news":
+            self._handle("serper", self._serper)
+        elif path.endswith("/chat/completions"):
+            self._handle("groq", self._groq)
+        elif path.startswith("/api/webhooks/"):
+            self._handle("discord", self._discord)
+        else:
+            self._send_json(404, {"error": "not found"})
+
+    def _handle(self, service: str, respond):
+        body = self._read_body()
+        behavior = self.server_stub.behaviors[service]
+        behavior.wait()
+        outcome = behavior.outcome()
+        self.server_stub.count(service, outcome)
+
+        if outcome == "error":
+            self._send_json(500, {"error": "stub internal error"})
+        elif outcome == "rate_limited":
+            retry_after = behavior.retry_after
+            self._send_json(429, {
+                "message": "You are being rate limited.",
+                "retry_after": retry_after,
+                "global": False,
+                "error": {"message": "Rate limit reached", "code": "rate_limit_exceeded"}
+            }, headers={"Retry-After": f"{retry_after:g}", "retry-after-ms": str(int(retry_after * 1000))})
+        else:
+            respond(body)
+
+    # Services
+
+    def _serper(self, body: Dict):
+        articles = fake_articles(body.get("q", ""), int(body.get("num", 5)) or 5)
+        self._send_json(200, {"news": articles})
+
+    def _ddg(self, body: Dict):
+        query = parse_qs(urlsplit(self.path).query)
+        articles = fake_articles(query.get("q", [""])[0] + " ddg", int(query.get("max_results", ["5"])[0]) or 5)
+        self._send_json(200, {"results": [
+            {"title": a["title"], "body": a["snippet"], "url": a["link"] + "?ddg",
+             "source": "Stub DDG", "date": a["date"]}
+            for a in articles
+        ]})
+
+    def _groq(self, body: Dict):
+        messages = body.get("messages", [])
+        prompt = " ".join(str(message.get("content", "")) for message in messages)
+        if body.get("response_format", {}).get("type") == "json_object" or "JSON object" in prompt:
+            verdict = {
+                "disaster_found": True,
+                "disaster_type": "Flood",
+                "severity": self.server_stub.analysis_severity,
+                "description": "Stub analysis: flooding reported in the area.",
+                "actions": "Move to higher ground and follow official guidance."
+            }
+            locations = _BATCH_LOCATION.findall(prompt)
+            if '"verdicts"' in prompt:
+                content = json.dumps({"verdicts": [dict(verdict, location=location) for location in locations]})
+            else:
+                content = json.dumps(verdict)
+        else:
+            content = ("Stay calm and follow official guidance. Keep an emergency kit ready, "
+                       "know your evacuation route and check on neighbours who may need help.")
+
+        model = body.get("model", "stub-model")
+        usage = {"prompt_tokens": len(prompt) // 4, "completion_tokens": len(content) // 4,
+                 "total_tokens": (len(prompt) + len(content)) // 4}
+        if body.get("stream"):
+            self._stream_completion(model, content, usage)
+            return
+        self._send_json(200, {
+            "id": "chatcmpl-stub",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+            "usage": usage
+        })
+
+    def _stream_completion(self, model: str, content: str, usage: Dict):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        words = content.split(" ")
+        for index, word in enumerate(words):
+            chunk = {
+                "id": "chatcmpl-stub", "object": "chat.completion.chunk", "created": int(time.time()),
+                "model": model,
+                "choices": [{"index": 0, "delta": {"content": word + (" " if index < len(words) - 1 else "")},
+                             "finish_reason": None}]
+            }
+            self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode("utf-8"))
+        final = {
+            "id": "chatcmpl-stub", "object": "chat.completion.chunk", "created": int(time.time()), "model": model,
+            "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}], "x_groq": {"usage": usage}
+        }
+        self.wfile.write(f"data: {json.dumps(final)}\n\ndata: [DONE]\n\n".encode("utf-8"))
+        self.wfile.flush()
+        self.close_connection = True
+
+    def _discord(self, body: Dict):
+        allowed, remaining, reset_after = self.server_stub.discord_bucket.take()
+        headers = {
+            "X-RateLimit-Limit": str(self.server_stub.discord_bucket.limit),
+            "X-RateLimit-Remaining": str(remaining),
+            "X-RateLimit-Reset-After": f"{reset_after:.3f}",
+            "X-RateLimit-Bucket": "stub-webhook"
+        }
+        if not allowed:
+            # Over the bucket: the same 429 Discord sends
+            self.server_stub.count_bucket_limited("discord")
+            headers["Retry-After"] = f"{reset_after:.3f}"
+            self._send_json(429, {"message": "You are being rate limited.", "retry_after": reset_after,
+                                  "global": False}, headers=headers)
+            return
+        self.send_response(204)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    # Helpers
+
+    def _read_body(self) -> Dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        try:
+            return json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            return {}
+
+    def _send_json(self, status: int, payload: Dict, headers: Optional[Dict[str, str]] = None):
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
@@ -1,18 +1,61 @@
 import os
-from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
+# Settings are read from the environment (and the .env file) the first time
+# they are used, not when this module is imported: importing config has no
+# side effects and does not even load python-dotenv. `from config import X`
+# works as before (PEP 562 module __getattr__)
+_SETTINGS = {}
+_env_loaded = False
+
+
+def _setting(name, default=None, cast=None):
+    _SETTINGS[name] = (default, cast)
+
+
+def _flag(value: str) -> bool:
+    return value.lower() == "true"
+
+
+def _csv(value: str) -> list:
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def load_env():
+    """Load environment variables from the .env file (once)"""
+    global _env_loaded
+    if not _env_loaded:
+        from dotenv import load_dotenv
+        load_dotenv()
+        _env_loaded = True
+
+
+def _resolve(name):
+    """Read one setting and keep it as a plain module attribute"""
+    load_env()
+    default, cast = _SETTINGS[name]
+    value = os.getenv(name, default)
+    if cast is not None and value is not None:
+        value = cast(value)
+    globals()[name] = value
+    return value
+
+
+def print_config_status():
+    """Print which API keys were found (called by the app on startup)"""
+    print(f"🔑 Groq API Key loaded: {'✅ Yes' if _resolve('GROQ_API_KEY') else '❌ No'}")
+    print(f"🔑 Serper API Key loaded: {'✅ Yes' if _resolve('SERPER_API_KEY') else '❌ No'}")
+    print(f"🔑 Discord Webhook loaded: {'✅ Yes' if _resolve('DISCORD_WEBHOOK_URL') else '❌ No'}")
+
 
 # API Keys (you need to set these in your .env file)
-GROQ_API_KEY = os.getenv("GROQ_API_KEY")
-SERPER_API_KEY = os.getenv("SERPER_API_KEY")  # Optional: for enhanced search
-DISCORD_WEBHOOK_URL = os.getenv("DISCORD_WEBHOOK_URL")  # For Discord alerts
+_setting("GROQ_API_KEY")
+_setting("SERPER_API_KEY")  # Optional: for enhanced search
+_setting("DISCORD_WEBHOOK_URL")  # For Discord alerts
 
-# Debug prints (remove these after testing)
-print(f"🔑 Groq API Key loaded: {'✅ Yes' if GROQ_API_KEY else '❌ No'}")
-print(f"🔑 Serper API Key loaded: {'✅ Yes' if SERPER_API_KEY else '❌ No'}")  
-print(f"🔑 Discord Webhook loaded: {'✅ Yes' if DISCORD_WEBHOOK_URL else '❌ No'}")
+# Service endpoints. Defaults are the real services; override them to point
+# the agents at a proxy or at the local stubs in benchmarks/stubs.py
+_setting("GROQ_BASE_URL")  # None → the Groq client's default
+_setting("DISCORD_WEBHOOK_PREFIX", "https://discord.com/api/webhooks/")
 
 # Disaster keywords to search for
 DISASTER_KEYWORDS = [
@@ -22,4 +65,125 @@ DISASTER_KEYWORDS = [
 ]
 
 # News API endpoint (using free Serper API)
-NEWS_API_URL = "https://google.serper.dev/news"
\ No newline at end of file
+_setting("NEWS_API_URL", "https://google.serper.dev/news")
+
+# News fetch tuning: run all queries for all providers at once and stop
+# waiting after a per-check deadline (seconds)
+_setting("NEWS_CONCURRENT_FETCH", "true", _flag)
+_setting("NEWS_CHECK_DEADLINE", "12", float)
+_setting("NEWS_MAX_WORKERS", "6", int)
+
+# Hedged news requests (opt-in, replaces the fan-out): each query goes to
+# the primary provider, and to the backup too if the primary has not
+# answered within its NEWS_HEDGE_PERCENTILE latency. The first usable answer
+# wins. Until NEWS_HEDGE_MIN_SAMPLES latencies are recorded the delay is
+# NEWS_HEDGE_DEFAULT_DELAY; it never drops below NEWS_HEDGE_MIN_DELAY (seconds)
+_setting("NEWS_HEDGE_ENABLED", "false", _flag)
+_setting("NEWS_HEDGE_PERCENTILE", "90", float)
+_setting("NEWS_HEDGE_MIN_SAMPLES", "20", int)
+_setting("NEWS_HEDGE_DEFAULT_DELAY", "1.0", float)
+_setting("NEWS_HEDGE_MIN_DELAY", "0.1", float)
+
+# Analysis prompt packing: the formatted news is kept within this many
+# (estimated) tokens, and each snippet within NEWS_PROMPT_SNIPPET_TOKENS
+_setting("NEWS_PROMPT_TOKEN_BUDGET", "1200", int)
+_setting("NEWS_PROMPT_SNIPPET_TOKENS", "80", int)
+
+# Shared HTTP connection pool (one keep-alive session per host)
+_setting("HTTP_POOL_SIZE", "10", int)
+_setting("HTTP_MAX_RETRIES", "2", int)
+_setting("HTTP_RETRY_BACKOFF", "0.5", float)
+_setting("HTTP_KEEP_ALIVE", "true", _flag)
+
+# News search cache (seconds). Entries older than the TTL are served stale
+# and refreshed in the background until NEWS_CACHE_STALE_TTL expires
+_setting("NEWS_CACHE_ENABLED", "true", _flag)
+_setting("NEWS_CACHE_SIZE", "256", int)
+_setting("NEWS_CACHE_TTL", "300", float)
+_setting("NEWS_CACHE_STALE_TTL", "1800", float)
+
+# Circuit breakers: a news provider that fails this many times in a row is
+# skipped for the cool-down (seconds), then probed with a single request
+_setting("NEWS_BREAKER_ENABLED", "true", _flag)
+_setting("NEWS_BREAKER_FAILURES", "3", int)
+_setting("NEWS_BREAKER_COOLDOWN", "60", float)
+
+# Article store: every fetched article is kept in SQLite (WAL + FTS5) so
+# refreshes can tell new articles from ones already processed
+_setting("ARTICLE_STORE_ENABLED", "true", _flag)
+_setting("ARTICLE_STORE_PATH", "data/articles.db")
+
+# Analysis cache: identical news + location + model + prompt skips the LLM
+_setting("ANALYSIS_CACHE_ENABLED", "true", _flag)
+_setting("ANALYSIS_CACHE_SIZE", "128", int)
+_setting("ANALYSIS_CACHE_TTL", "900", float)
+
+# Keyword triage: news whose hazard score (1 per hazard mention, 0.5 for
+# generic words like "emergency") stays below the threshold skips the LLM
+_setting("TRIAGE_ENABLED", "true", _flag)
+_setting("TRIAGE_THRESHOLD", "1.0", float)
+
+# Structured analysis: how many times the AI is asked to fix an analysis
+# that does not validate against the DisasterAnalysis JSON model
+_setting("ANALYSIS_MAX_REPAIRS", "1", int)
+
+# Batch monitoring: concurrent news fetches and concurrent LLM analyses
+_setting("BATCH_FETCH_CONCURRENCY", "8", int)
+_setting("BATCH_ANALYSIS_CONCURRENCY", "4", int)
+
+# Batched analysis: pack several locations into one analysis request, up to
+# a prompt token budget and a maximum number of locations per request
+_setting("BATCH_ANALYSIS_PACKED", "false", _flag)
+_setting("BATCH_ANALYSIS_TOKEN_BUDGET", "6000", int)
+_setting("BATCH_ANALYSIS_MAX_LOCATIONS", "8", int)
+
+# Headless monitoring daemon (monitor.py). Intervals are in seconds
+_setting("MONITOR_LOCATIONS", "", _csv)
+_setting("MONITOR_BASE_INTERVAL", "900", float)
+_setting("MONITOR_MIN_INTERVAL", "120", float)
+_setting("MONITOR_MAX_INTERVAL", "3600", float)
+_setting("MONITOR_BACKOFF", "1.5", float)
+_setting("MONITOR_JITTER", "0.15", float)
+# The daemon's news and analysis caches expire after this (capped at half
+# of MONITOR_MIN_INTERVAL) and never serve stale entries, so every poll
+# sees news at most this old
+_setting("MONITOR_CACHE_TTL", "60", float)
+
+# Background alert delivery: attempts per alert, backoff bounds (seconds)
+# and how long to wait for queued alerts when the process exits
+_setting("ALERT_MAX_ATTEMPTS", "5", int)
+_setting("ALERT_RETRY_BASE_DELAY", "2", float)
+_setting("ALERT_RETRY_MAX_DELAY", "60", float)
+_setting("ALERT_FLUSH_TIMEOUT", "10", float)
+
+# Alert digest mode: buffer alerts for a short window (seconds) and pack them
+# into Discord embed messages. Alerts at or above the bypass severity are sent
+# immediately (High is the top level the analysis prompt produces)
+_setting("ALERT_DIGEST_MODE", "false", _flag)
+_setting("ALERT_DIGEST_WINDOW", "5", float)
+_setting("ALERT_DIGEST_MAX_BUFFER", "50", int)
+_setting("ALERT_DIGEST_BYPASS_SEVERITY", "High")
+
+# Alert messages for disasters below this severity are rendered locally from
+# a template; only this level and above get an LLM-written message. Use "Low"
+# to always call the LLM, or "off" to never call it
+_setting("ALERT_LLM_MIN_SEVERITY", "High")
+
+# Near-duplicate article detection: Jaccard similarity of title + snippet
+# word-pair shingles at or above this value counts as the same story
+_setting("NEWS_DEDUP_THRESHOLD", "0.65", float)
+
+# Chat memory: token budget for the conversation context, of which up to
+# CHAT_SUMMARY_TOKEN_BUDGET holds the rolling summary of older turns
+_setting("CHAT_MEMORY_TOKEN_BUDGET", "1200", int)
+_setting("CHAT_SUMMARY_TOKEN_BUDGET", "300", int)
+
+
+def __getattr__(name):
+    if name not in _SETTINGS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return _resolve(name)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_SETTINGS))
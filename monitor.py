@@ -0,0 +1,71 @@
+"""
+ReDAC headless monitor
+
+Runs the News → Alert pipeline on a schedule for configured locations,
+without the Streamlit UI.
+
+Usage:
+    python monitor.py --locations "Tokyo, Manila, Los Angeles"
+    python monitor.py --once          # single pass over MONITOR_LOCATIONS
+    python monitor.py --metrics-port 9108   # also serve Prometheus metrics
+"""
+import argparse
+import signal
+import sys
+from agents.monitor_daemon import MonitorDaemon
+from agents.batch_monitor import BatchMonitor
+from utils.alert_queue import get_alert_dispatcher
+from utils.metrics import start_metrics_server
+from config import MONITOR_LOCATIONS, ALERT_FLUSH_TIMEOUT, print_config_status
+
+
+def flush_alerts(daemon: MonitorDaemon):
+    """Send any digest-buffered alerts and wait for queued deliveries"""
+    daemon.batch_monitor.alert_agent.alert_sender.flush_digest()
+    get_alert_dispatcher().flush(ALERT_FLUSH_TIMEOUT)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="ReDAC headless disaster monitor")
+    parser.add_argument(
+        "--locations",
+        help="Comma-separated locations (default: MONITOR_LOCATIONS from .env)"
+    )
+    parser.add_argument("--once", action="store_true", help="Check every location once and exit")
+    parser.add_argument(
+        "--metrics-port", type=int,
+        help="Serve Prometheus metrics on this port (/metrics, /metrics.json)"
+    )
+    args = parser.parse_args(argv)
+    print_config_status()
+
+    if args.metrics_port:
+        start_metrics_server(args.metrics_port)
+        print(f"📈 Metrics on http://0.0.0.0:{args.metrics_port}/metrics")
+
+    locations = MONITOR_LOCATIONS
+    if args.locations:
+        locations = [loc.strip() for loc in args.locations.split(",") if loc.strip()]
+    if not locations:
+        print("❌ No locations configured. Use --locations or set MONITOR_LOCATIONS in .env")
+        return 1
+
+    daemon = MonitorDaemon(locations)
+
+    if args.once:
+        result = daemon.run_once()
+        print(BatchMonitor.format_table(result["results"]))
+        print(result["throughput"])
+        flush_alerts(daemon)
+        return 0
+
+    # Stop cleanly on Ctrl+C / SIGTERM
+    signal.signal(signal.SIGINT, lambda *_: daemon.stop())
+    signal.signal(signal.SIGTERM, lambda *_: daemon.stop())
+    daemon.run_forever()
+    flush_alerts(daemon)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+import asyncio
+import time
+
+import pytest
+
+import utils.alert_queue as alert_queue
+from utils.alert_queue import FAILED, RETRY, SENT, AlertDispatcher
+
+
+class StubSender:
+    """Plays back a list of attempt outcomes and records when each attempt ran"""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.attempted_at = []
+
+    def __call__(self):
+        self.attempted_at.append(time.monotonic())
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+@pytest.fixture
+def dispatcher():
+    dispatcher = AlertDispatcher(max_attempts=4, base_delay=0.01, max_delay=0.05)
+    yield dispatcher
+    assert dispatcher.flush(timeout=5)
+
+
+def test_retries_until_delivered(dispatcher):
+    sender = StubSender((RETRY, None, "500"), ConnectionError("reset"), (SENT, None, ""))
+    handle = dispatcher.submit(sender, "Flood alert")
+
+    assert handle.wait(timeout=5)
+    assert handle.status == SENT and handle.delivered
+    assert handle.attempts == 3
+    assert handle.delivered_at is not None
+
+
+def test_rate_limited_attempt_waits_for_retry_after(dispatcher):
+    sender = StubSender((RETRY, 0.2, "429 Too Many Requests"), (SENT, None, ""))
+    handle = dispatcher.submit(sender, "Flood alert")
+
+    assert handle.wait(timeout=5)
+    first, second = sender.attempted_at
+    assert second - first >= 0.2
+    assert handle.attempts == 2
+
+
+def test_permanent_failure_is_not_retried(dispatcher):
+    sender = StubSender((FAILED, None, "404 Unknown Webhook"))
+    handle = dispatcher.submit(sender, "Flood alert")
+
+    assert not handle.wait(timeout=5)
+    assert handle.status == FAILED
+    assert handle.attempts == 1
+    assert handle.last_error == "404 Unknown Webhook"
+
+
+def test_gives_up_after_max_attempts(dispatcher):
+    sender = StubSender(*[(RETRY, None, "503")] * 4)
+    handle = dispatcher.submit(sender, "Flood alert")
+
+    assert not handle.wait(timeout=5)
+    assert handle.status == FAILED
+    assert handle.attempts == 4
+    assert sender.outcomes == []
+
+
+def test_backoff_doubles_up_to_the_maximum(dispatcher, monkeypatch):
+    ceilings = []
+    monkeypatch.setattr(alert_queue.random, "uniform", lambda low, high: ceilings.append(high) or 0.0)
+    sender = StubSender(*[(RETRY, None, "503")] * 3, (SENT, None, ""))
+
+    assert dispatcher.submit(sender, "Flood alert").wait(timeout=5)
+    assert ceilings == pytest.approx([0.01, 0.02, 0.04])
+
+    ceilings.clear()
+    sender = StubSender(*[(RETRY, None, "503")] * 3, (SENT, None, ""))
+    dispatcher.max_attempts = 5
+    dispatcher.base_delay = 0.02
+    assert dispatcher.submit(sender, "Flood alert").wait(timeout=5)
+    assert ceilings == pytest.approx([0.02, 0.04, 0.05])
+
+
+def test_handle_can_be_awaited(dispatcher):
+    handle = dispatcher.submit(StubSender((SENT, None, "")), "Flood alert")
+
+    async def deliver():
+        return await handle
+
+    assert asyncio.run(deliver()) is True
+    assert dispatcher.flush(timeout=5)
+    assert dispatcher.pending() == 0
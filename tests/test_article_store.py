@@ -0,0 +1,43 @@
+import pytest
+
+from utils.article_store import ArticleStore
+
+FLOOD = {"title": "Flooding closes river roads", "snippet": "Heavy rain flooded the valley overnight.",
+         "link": "https://news.example/flood", "source": "Example News"}
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ArticleStore(str(tmp_path / "articles.db"))
+    yield store
+    store.close()
+
+
+def test_only_unseen_articles_are_returned(store):
+    assert store.upsert([FLOOD], "Valley") == [FLOOD]
+    assert store.upsert([FLOOD], "Valley") == []
+
+
+def test_same_story_under_a_new_link_is_stored_once(store):
+    store.upsert([FLOOD], "Valley")
+    syndicated = dict(FLOOD, link="https://mirror.example/flood")
+
+    assert store.upsert([syndicated], "Valley") == []
+    assert len(store.search("flooding")) == 1
+    assert len(store.new_since("Valley", 0)) == 1
+    assert store.get_stats()["articles"] == 1
+
+
+def test_same_story_found_for_another_location_is_linked_to_it(store):
+    store.upsert([FLOOD], "Valley")
+    store.upsert([dict(FLOOD, link="https://mirror.example/flood")], "Riverside")
+
+    assert [article["link"] for article in store.new_since("Riverside", 0)] == [FLOOD["link"]]
+    assert len(store.search("flooding", location="Riverside")) == 1
+
+
+def test_changed_content_under_a_known_link_is_unseen(store):
+    store.upsert([FLOOD], "Valley")
+    updated = dict(FLOOD, snippet="Evacuations ordered as the river keeps rising.")
+    assert store.upsert([updated], "Valley") == [updated]
+    assert store.search("evacuations")[0]["link"] == FLOOD["link"]
@@ -0,0 +1,97 @@
+import pytest
+
+from utils.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def breaker(clock):
+    return CircuitBreaker("Serper", failure_threshold=3, cool_down=60, clock=clock)
+
+
+def trip(breaker):
+    for _ in range(breaker.failure_threshold):
+        assert breaker.allow()
+        breaker.record_failure()
+
+
+def test_opens_after_consecutive_failures(breaker):
+    for _ in range(2):
+        breaker.allow()
+        breaker.record_failure()
+    assert breaker.state == CLOSED
+
+    breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == OPEN
+    assert breaker.get_stats()["trips"] == 1
+
+
+def test_success_resets_the_failure_count(breaker):
+    for _ in range(2):
+        breaker.allow()
+        breaker.record_failure()
+    breaker.allow()
+    breaker.record_success()
+    breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == CLOSED
+    assert breaker.get_stats()["consecutive_failures"] == 1
+
+
+def test_open_circuit_rejects_calls_until_the_cool_down(breaker, clock):
+    trip(breaker)
+
+    clock.now += 59
+    assert not breaker.available()
+    assert not breaker.allow()
+    assert breaker.get_stats()["rejected"] == 1
+    assert breaker.get_stats()["retry_in"] == 1.0
+
+
+def test_half_open_lets_one_probe_through(breaker, clock):
+    trip(breaker)
+    clock.now += 60
+
+    assert breaker.state == HALF_OPEN
+    assert breaker.available()
+    assert breaker.allow()
+    # Everyone else waits for the probe's outcome
+    assert not breaker.available()
+    assert not breaker.allow()
+
+
+def test_successful_probe_closes_the_circuit(breaker, clock):
+    trip(breaker)
+    clock.now += 60
+    breaker.allow()
+    breaker.record_success()
+
+    assert breaker.state == CLOSED
+    assert breaker.allow()
+
+
+def test_failed_probe_reopens_for_another_cool_down(breaker, clock):
+    trip(breaker)
+    clock.now += 60
+    breaker.allow()
+    breaker.record_failure()
+
+    assert breaker.state == OPEN
+    assert breaker.get_stats()["trips"] == 2
+    clock.now += 59
+    assert not breaker.allow()
+    clock.now += 1
+    assert breaker.state == HALF_OPEN
@@ -0,0 +1,48 @@
+import pytest
+
+from utils.dedup import NearDuplicateDetector
+
+SNIPPET = ("A magnitude 6.8 earthquake struck off the coast of northern Japan on Tuesday, "
+           "the meteorological agency said.")
+
+
+@pytest.fixture
+def detector():
+    return NearDuplicateDetector()
+
+
+def article(title, snippet=""):
+    return {"title": title, "snippet": snippet}
+
+
+@pytest.mark.parametrize("first, second", [
+    # Syndicated copy with another source suffix
+    (article("Strong earthquake hits northern Japan - Reuters", SNIPPET),
+     article("Strong earthquake hits northern Japan | AP News", SNIPPET)),
+    # Reworded headline, near-identical body
+    (article("Strong earthquake hits northern Japan", SNIPPET),
+     article("Strong quake hits northern Japan",
+             SNIPPET.replace("the meteorological", "the country's meteorological"))),
+])
+def test_copies_of_one_story_are_merged(detector, first, second):
+    unique, merged = detector.deduplicate([first, second])
+    assert unique == [first]
+    assert merged == 1
+
+
+@pytest.mark.parametrize("first, second", [
+    (article("Tokyo weather: heavy rain expected"), article("Osaka weather: heavy rain expected")),
+    (article("Magnitude 5.1 earthquake strikes off Japan coast"),
+     article("Magnitude 6.8 earthquake strikes off Japan coast")),
+    (article("Strong earthquake hits northern Japan", SNIPPET),
+     article("Strong earthquake hits northern Japan again", SNIPPET.replace("6.8", "5.9"))),
+])
+def test_separate_events_are_kept(detector, first, second):
+    unique, merged = detector.deduplicate([first, second])
+    assert unique == [first, second]
+    assert merged == 0
+
+
+def test_exact_title_repeats_are_merged(detector):
+    unique, merged = detector.deduplicate([article("Flood warning issued"), article("Flood Warning Issued!")])
+    assert len(unique) == 1 and merged == 1
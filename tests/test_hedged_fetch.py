@@ -0,0 +1,130 @@
+import threading
+from concurrent.futures import FIRST_COMPLETED, wait as real_wait
+
+import pytest
+
+import agents.news_agent as news_agent_module
+from agents.news_agent import NewsAgent
+
+QUERIES = ["q1", "q2", "q3"]
+HEDGE_DELAY = 1.0
+DEADLINE = 5.0
+
+
+class FakeClock:
+    """Time only moves when the hedge loop waits without anything finishing"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def wait(self, futures, timeout=None, return_when=FIRST_COMPLETED):
+        done, not_done = real_wait(futures, timeout=0.5, return_when=return_when)
+        if not done and timeout:
+            self.now += timeout
+        return done, not_done
+
+
+class FakeProvider:
+    """Answers immediately, raises, or blocks until released"""
+
+    def __init__(self, name, mode):
+        self.name = name
+        self.mode = mode
+        self.calls = []
+        self.release = threading.Event()
+
+    def __call__(self, query, num_results):
+        self.calls.append(query)
+        if self.mode == "block":
+            self.release.wait(10)
+            return []
+        if self.mode == "fail":
+            raise ConnectionError(f"{self.name} is down")
+        return [{"title": f"{self.name} {query}", "snippet": "", "link": f"https://{self.name}/{query}"}]
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(news_agent_module, "wait", clock.wait)
+    return clock
+
+
+@pytest.fixture
+def providers():
+    created = []
+
+    def make(primary_mode, backup_mode):
+        pair = (FakeProvider("primary", primary_mode), FakeProvider("backup", backup_mode))
+        created.extend(pair)
+        return pair
+
+    yield make
+    for provider in created:
+        provider.release.set()
+
+
+def hedged_agent(clock, primary, backup):
+    agent = NewsAgent(concurrent=False, hedge=True)
+    agent.cache_enabled = False
+    agent.breakers_enabled = False
+    agent.check_deadline = DEADLINE
+    agent.clock = clock
+    agent.hedge_delay = lambda provider: HEDGE_DELAY
+    agent._get_providers = lambda: [(primary.name, primary), (backup.name, backup)]
+    return agent
+
+
+def test_primary_answers_before_the_hedge_delay(clock, providers):
+    primary, backup = providers("ok", "ok")
+    agent = hedged_agent(clock, primary, backup)
+
+    articles = agent._fetch_hedged("Tokyo", QUERIES, 1)
+
+    assert [article["title"] for article in articles] == ["primary q1", "primary q2", "primary q3"]
+    assert backup.calls == []
+    assert agent.hedge_stats == {"queries": 3, "hedged": 0, "hedge_wins": 0}
+    assert clock.now < HEDGE_DELAY
+
+
+def test_backup_wins_when_the_primary_is_slow(clock, providers):
+    primary, backup = providers("block", "ok")
+    agent = hedged_agent(clock, primary, backup)
+
+    articles = agent._fetch_hedged("Tokyo", QUERIES, 1)
+
+    assert [article["title"] for article in articles] == ["backup q1", "backup q2", "backup q3"]
+    assert agent.hedge_stats == {"queries": 3, "hedged": 3, "hedge_wins": 3}
+    assert HEDGE_DELAY <= clock.now < DEADLINE
+
+
+def test_failed_primary_is_hedged_without_waiting(clock, providers):
+    primary, backup = providers("fail", "ok")
+    agent = hedged_agent(clock, primary, backup)
+
+    articles = agent._fetch_hedged("Tokyo", QUERIES, 1)
+
+    assert len(articles) == 3
+    assert agent.hedge_stats["hedge_wins"] == 3
+    assert clock.now < HEDGE_DELAY
+
+
+def test_both_providers_failing_returns_nothing(clock, providers):
+    primary, backup = providers("fail", "fail")
+    agent = hedged_agent(clock, primary, backup)
+
+    assert agent._fetch_hedged("Tokyo", QUERIES, 1) == []
+    assert agent.hedge_stats == {"queries": 3, "hedged": 3, "hedge_wins": 0}
+    assert clock.now < HEDGE_DELAY
+
+
+def test_deadline_stops_waiting_for_both_providers(clock, providers):
+    primary, backup = providers("block", "block")
+    agent = hedged_agent(clock, primary, backup)
+
+    assert agent._fetch_hedged("Tokyo", QUERIES, 1) == []
+    assert clock.now >= DEADLINE
+    assert agent.hedge_stats == {"queries": 3, "hedged": 3, "hedge_wins": 0}
@@ -0,0 +1,31 @@
+import pytest
+from langchain_core.exceptions import OutputParserException
+
+from utils.parsers import parse_batch_disaster_json, parse_disaster_json
+
+
+def test_minimal_reply_gets_defaults():
+    assert parse_disaster_json('{"disaster_found": false}') == {
+        "disaster_found": False,
+        "disaster_type": "Unknown",
+        "severity": "Low",
+        "description": "No specific information available",
+        "actions": "Stay alert and follow local news"
+    }
+
+
+def test_partial_reply_keeps_given_fields():
+    result = parse_disaster_json('{"disaster_found": true, "disaster_type": "Flood", "severity": "Medium"}')
+    assert (result["disaster_found"], result["disaster_type"], result["severity"]) == (True, "Flood", "Medium")
+    assert result["description"] == "No specific information available"
+
+
+def test_batch_verdicts_only_need_location_and_disaster_found():
+    verdicts = parse_batch_disaster_json('{"verdicts": [{"location": "Tokyo", "disaster_found": false}]}')
+    assert verdicts[0]["location"] == "Tokyo"
+    assert verdicts[0]["severity"] == "Low"
+
+
+def test_disaster_found_is_still_required():
+    with pytest.raises(OutputParserException):
+        parse_disaster_json('{"disaster_type": "Flood"}')
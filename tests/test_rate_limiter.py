@@ -0,0 +1,31 @@
+from utils.rate_limiter import DiscordRateLimiter
+
+FIRST = "https://discord.com/api/webhooks/1/token-a"
+SECOND = "https://discord.com/api/webhooks/2/token-b"
+
+
+def exhausted(bucket="shared-hash"):
+    return {"X-RateLimit-Bucket": bucket, "X-RateLimit-Limit": "5",
+            "X-RateLimit-Remaining": "0", "X-RateLimit-Reset-After": "30"}
+
+
+def test_webhooks_with_the_same_bucket_hash_do_not_share_limits():
+    limiter = DiscordRateLimiter()
+    limiter.update(SECOND, {"X-RateLimit-Bucket": "shared-hash", "X-RateLimit-Limit": "5",
+                            "X-RateLimit-Remaining": "4", "X-RateLimit-Reset-After": "2"}, 200)
+    limiter.update(FIRST, exhausted(), 200)
+
+    # Exhausting the first webhook leaves the second one's tokens alone
+    assert limiter._bucket_for(SECOND).remaining == 4
+    assert limiter.acquire(SECOND) == 0.0
+    assert limiter.get_stats()["buckets"] == 2
+
+
+def test_state_before_the_bucket_id_is_known_is_kept():
+    limiter = DiscordRateLimiter()
+    limiter.update(FIRST, {"X-RateLimit-Limit": "5", "X-RateLimit-Remaining": "3",
+                           "X-RateLimit-Reset-After": "30"}, 200)
+    limiter.update(FIRST, {"X-RateLimit-Bucket": "hash-a"}, 200)
+
+    assert limiter.get_stats()["buckets"] == 1
+    assert limiter.acquire(FIRST) == 0.0
@@ -0,0 +1,62 @@
+import pytest
+
+from config import DISASTER_KEYWORDS
+from utils.triage import KeywordTriage
+
+
+@pytest.fixture
+def triage():
+    return KeywordTriage(DISASTER_KEYWORDS, threshold=1.0)
+
+
+# Real hazards that a sentence-wide negation used to cancel: triage must
+# pass them on to the LLM
+@pytest.mark.parametrize("headline", [
+    "Flood warning lifted upstream, but thousands evacuate as river bursts banks downstream",
+    "Residents urged to prepare as Hurricane Milton nears; preparedness kits sold out",
+    "Wildfire forces evacuations on anniversary of 2018 Camp Fire",
+    "No power, no water: earthquake survivors wait for aid",
+    # Hazards outside the search keywords
+    "Governor declares state of emergency in Miami-Dade",
+    "Severe weather warning issued for Tokyo",
+    "Volcano erupts, ash cloud grounds flights",
+    "Heatwave grips southern Europe",
+    "Blizzard shuts highways across the Midwest",
+    "Chemical plant explosion injures workers",
+    "Dam collapse forces villagers to higher ground",
+    "Cholera outbreak spreads in refugee camp",
+    "Drought threatens harvest across the region",
+])
+def test_active_hazards_reach_the_llm(triage, headline):
+    assert triage.score(headline)["passed"]
+
+
+@pytest.mark.parametrize("headline", [
+    "No tsunami threat for the coast, officials say",
+    "Authorities ruled out a tsunami",
+    "Earthquake drill held at schools",
+    "City council approves new park budget",
+])
+def test_negated_or_unrelated_news_is_skipped(triage, headline):
+    assert not triage.score(headline)["passed"]
+
+
+def test_negation_cue_only_applies_directly_before_the_hazard(triage):
+    result = triage.score("No tsunami threat")
+    assert result["negated"] == 1
+    assert result["score"] == 0
+
+    result = triage.score("No power after the earthquake")
+    assert result["negated"] == 0
+    assert result["matches"] == {"earthquake": 1}
+
+
+def test_dampening_context_lowers_weight_within_its_clause(triage):
+    assert triage.score("Earthquake drill held at schools")["score"] == 0.5
+    # The drill is in another clause, so the flood counts in full
+    assert triage.score("Earthquake drill postponed, flash flood hits valley")["score"] == 1.5
+
+
+def test_metadata_lines_are_ignored(triage):
+    news = "1. City marathon results\n   Source: Flood Daily | 1 hour ago\n   Search Engine: Serper/Google\n"
+    assert triage.score(news)["score"] == 0
@@ -5,12 +5,67 @@ This package contains utility modules for:
 - templates.py: LangChain prompt templates
 - parsers.py: Output parsers for structuring AI responses  
 - alert_sender.py: Alert delivery system for multiple platforms
+- http_pool.py: Shared keep-alive HTTP sessions for all agents
+- cache.py: TTL + LRU cache used for search and analysis results
+- alert_queue.py: Background alert delivery queue with retries
+- rate_limiter.py: Discord rate-limit buckets shared by all alert senders
+- dedup.py: MinHash/LSH near-duplicate article detection
+- tokens.py: Token estimates for prompt budgeting
+- chat_memory.py: Token-budgeted conversation memory with rolling summary
+- triage.py: Keyword triage that decides whether news needs the analysis LLM
+- article_store.py: SQLite (WAL + FTS5) history of every fetched article
+- metrics.py: Latency histograms and counters with Prometheus/JSON export
+- circuit_breaker.py: Per-provider circuit breakers for news search
+- news_packer.py: Token-budgeted packing of articles into the analysis prompt
+- severity.py: Severity levels shared by alert messages and delivery
 """
 
-# Import key components to make them easily accessible
-from .templates import NEWS_ANALYSIS_TEMPLATE, ALERT_TEMPLATE, CHAT_TEMPLATE
-from .parsers import disaster_parser, chat_parser, parse_disaster_text
-from .alert_sender import AlertSender
+# Key components are imported on first access (PEP 562), so "import utils"
+# stays cheap and LangChain/pydantic only load when something needs them
+_EXPORTS = {
+    "NEWS_ANALYSIS_TEMPLATE": ".templates",
+    "ALERT_TEMPLATE": ".templates",
+    "CHAT_TEMPLATE": ".templates",
+    "disaster_parser": ".parsers",
+    "chat_parser": ".parsers",
+    "parse_disaster_text": ".parsers",
+    "parse_disaster_json": ".parsers",
+    "parse_batch_disaster_json": ".parsers",
+    "AlertSender": ".alert_sender",
+    "HTTPSessionPool": ".http_pool",
+    "get_http_pool": ".http_pool",
+    "TTLCache": ".cache",
+    "AlertDispatcher": ".alert_queue",
+    "DeliveryHandle": ".alert_queue",
+    "get_alert_dispatcher": ".alert_queue",
+    "DiscordRateLimiter": ".rate_limiter",
+    "get_discord_rate_limiter": ".rate_limiter",
+    "NearDuplicateDetector": ".dedup",
+    "estimate_tokens": ".tokens",
+    "ConversationMemory": ".chat_memory",
+    "KeywordTriage": ".triage",
+    "ArticleStore": ".article_store",
+    "get_article_store": ".article_store",
+    "MetricsRegistry": ".metrics",
+    "get_metrics": ".metrics",
+    "CircuitBreaker": ".circuit_breaker",
+    "get_circuit_breaker": ".circuit_breaker",
+    "NewsPacker": ".news_packer",
+    "SEVERITY_RANK": ".severity"
+}
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        from importlib import import_module
+        value = getattr(import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
 
 # Make key components available when importing the package
 __all__ = [
@@ -20,5 +75,27 @@ __all__ = [
     "disaster_parser",
     "chat_parser",
     "parse_disaster_text",
-    "AlertSender"
-]
\ No newline at end of file
+    "parse_disaster_json",
+    "parse_batch_disaster_json",
+    "AlertSender",
+    "HTTPSessionPool",
+    "get_http_pool",
+    "TTLCache",
+    "AlertDispatcher",
+    "DeliveryHandle",
+    "get_alert_dispatcher",
+    "DiscordRateLimiter",
+    "get_discord_rate_limiter",
+    "NearDuplicateDetector",
+    "estimate_tokens",
+    "ConversationMemory",
+    "KeywordTriage",
+    "ArticleStore",
+    "get_article_store",
+    "MetricsRegistry",
+    "get_metrics",
+    "CircuitBreaker",
+    "get_circuit_breaker",
+    "NewsPacker",
+    "SEVERITY_RANK"
+]
@@ -0,0 +1,178 @@
+import asyncio
+import atexit
+import heapq
+import itertools
+import random
+import threading
+import time
+import uuid
+from concurrent.futures import Future
+from typing import Callable, Optional, Tuple
+
+from config import ALERT_MAX_ATTEMPTS, ALERT_RETRY_BASE_DELAY, ALERT_RETRY_MAX_DELAY, ALERT_FLUSH_TIMEOUT
+
+# Outcomes returned by a single delivery attempt
+SENT = "sent"
+RETRY = "retry"
+FAILED = "failed"
+
+# Statuses reported by a DeliveryHandle
+QUEUED = "queued"
+RETRYING = "retrying"
+
+
+class DeliveryHandle:
+    """
+    Tracks one queued alert. Poll `status`, block with `wait()`,
+    or `await handle` from asyncio code.
+    """
+
+    def __init__(self, message: str):
+        self.id = uuid.uuid4().hex[:12]
+        self.message = message
+        self.status = QUEUED
+        self.attempts = 0
+        self.last_error = ""
+        self.created_at = time.time()
+        self.delivered_at: Optional[float] = None
+        self.future: Future = Future()
+
+    @property
+    def delivered(self) -> bool:
+        return self.status == SENT
+
+    def done(self) -> bool:
+        return self.future.done()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until delivered or failed; returns True if delivered"""
+        try:
+            return self.future.result(timeout=timeout)
+        except Exception:
+            return False
+
+    def __await__(self):
+        return asyncio.wrap_future(self.future).__await__()
+
+    def _resolve(self, delivered: bool, error: str = ""):
+        self.status = SENT if delivered else FAILED
+        self.last_error = error
+        if delivered:
+            self.delivered_at = time.time()
+        if not self.future.done():
+            self.future.set_result(delivered)
+
+    def __repr__(self) -> str:
+        return f"DeliveryHandle(id={self.id}, status={self.status}, attempts={self.attempts})"
+
+
+class AlertDispatcher:
+    """
+    ALERT DISPATCHER: Background delivery queue for alerts
+    Callers enqueue and return immediately; one worker thread delivers in
+    order, retrying with exponential backoff + full jitter (or the
+    server's Retry-After) without blocking anyone
+    """
+
+    def __init__(self, max_attempts: int = ALERT_MAX_ATTEMPTS,
+                 base_delay: float = ALERT_RETRY_BASE_DELAY,
+                 max_delay: float = ALERT_RETRY_MAX_DELAY):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+        self._heap = []  # (ready_time, seq, handle, send_once)
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._in_flight = 0
+        self._worker: Optional[threading.Thread] = None
+
+    def submit(self, send_once: Callable[[], Tuple[str, Optional[float], str]], message: str) -> DeliveryHandle:
+        """
+        Queue a delivery
+
+        Args:
+            send_once: Makes one attempt and returns (SENT | RETRY | FAILED, retry_after, error)
+            message: The alert text (kept on the handle for reference)
+        """
+        handle = DeliveryHandle(message)
+        self._push(time.monotonic(), handle, send_once)
+        return handle
+
+    def pending(self) -> int:
+        with self._cond:
+            return len(self._heap) + self._in_flight
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued alert has been delivered or given up"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self._heap or self._in_flight:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def _push(self, ready_time: float, handle: DeliveryHandle, send_once):
+        with self._cond:
+            heapq.heappush(self._heap, (ready_time, next(self._seq), handle, send_once))
+            self._ensure_worker()
+            self._cond.notify_all()
+
+    def _ensure_worker(self):
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._run, name="alert-dispatcher", daemon=True)
+            self._worker.start()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._heap or self._heap[0][0] > time.monotonic():
+                    timeout = self._heap[0][0] - time.monotonic() if self._heap else None
+                    self._cond.wait(timeout)
+                _, _, handle, send_once = heapq.heappop(self._heap)
+                self._in_flight += 1
+
+            try:
+                self._attempt(handle, send_once)
+            finally:
+                with self._cond:
+                    self._in_flight -= 1
+                    self._cond.notify_all()
+
+    def _attempt(self, handle: DeliveryHandle, send_once):
+        handle.attempts += 1
+        try:
+            outcome, retry_after, error = send_once()
+        except Exception as e:
+            outcome, retry_after, error = RETRY, None, str(e)
+
+        if outcome == SENT:
+            handle._resolve(True)
+        elif outcome == FAILED or handle.attempts >= self.max_attempts:
+            print(f"❌ Alert {handle.id} failed after {handle.attempts} attempt(s): {error}")
+            handle._resolve(False, error)
+        else:
+            handle.status = RETRYING
+            handle.last_error = error
+            if retry_after is None:
+                # Exponential backoff with full jitter
+                retry_after = random.uniform(0, min(self.max_delay, self.base_delay * (2 ** (handle.attempts - 1))))
+            print(f"🔄 Alert {handle.id} retry {handle.attempts}/{self.max_attempts - 1} in {retry_after:.1f}s")
+            self._push(time.monotonic() + retry_after, handle, send_once)
+
+
+_dispatcher: Optional[AlertDispatcher] = None
+_dispatcher_lock = threading.Lock()
+
+
+def get_alert_dispatcher() -> AlertDispatcher:
+    """Process-wide alert dispatcher (flushed briefly at interpreter exit)"""
+    global _dispatcher
+    if _dispatcher is None:
+        with _dispatcher_lock:
+            if _dispatcher is None:
+                _dispatcher = AlertDispatcher()
+                atexit.register(_dispatcher.flush, ALERT_FLUSH_TIMEOUT)
+    return _dispatcher
@@ -1,7 +1,7 @@
-import requests
 import json
-import os
-from dotenv import load_dotenv
+from utils.http_pool import get_http_pool
+from utils.rate_limiter import get_discord_rate_limiter
+from config import DISCORD_WEBHOOK_URL
 
 class AlertSender:
     """
@@ -10,10 +10,8 @@ class AlertSender:
     """
     
     def __init__(self):
-        # Load environment variables
-        load_dotenv()
-        # Get Discord webhook URL from environment
-        self.discord_webhook = os.getenv("DISCORD_WEBHOOK_URL")
+        # Discord webhook URL (loaded from .env once, in config.py)
+        self.discord_webhook = DISCORD_WEBHOOK_URL
         
         # Debug print to check if webhook is loaded
         if self.discord_webhook:
@@ -47,7 +45,10 @@ class AlertSender:
                 "avatar_url": "https://cdn-icons-png.flaticon.com/512/564/564619.png"
             }
             
-            response = requests.post(self.discord_webhook, json=payload, timeout=10)
+            limiter = get_discord_rate_limiter()
+            limiter.acquire(self.discord_webhook)
+            response = get_http_pool().post(self.discord_webhook, json=payload, timeout=10)
+            limiter.update(self.discord_webhook, response.headers, response.status_code)
             
             if response.status_code == 204:
                 print("✅ Discord alert sent successfully!")
@@ -0,0 +1,232 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional
+
+from config import ARTICLE_STORE_PATH
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    id INTEGER PRIMARY KEY,
+    link TEXT NOT NULL UNIQUE,
+    content_hash TEXT NOT NULL,
+    title TEXT NOT NULL,
+    snippet TEXT NOT NULL,
+    source TEXT,
+    date TEXT,
+    search_engine TEXT,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_articles_hash ON articles(content_hash);
+
+CREATE TABLE IF NOT EXISTS article_locations (
+    location TEXT NOT NULL,
+    article_id INTEGER NOT NULL REFERENCES articles(id) ON DELETE CASCADE,
+    first_seen REAL NOT NULL,
+    PRIMARY KEY (location, article_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS ix_locations_seen ON article_locations(location, first_seen);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+    title, snippet, content='articles', content_rowid='id', tokenize='porter unicode61'
+);
+CREATE TRIGGER IF NOT EXISTS articles_ai AFTER INSERT ON articles BEGIN
+    INSERT INTO articles_fts(rowid, title, snippet) VALUES (new.id, new.title, new.snippet);
+END;
+CREATE TRIGGER IF NOT EXISTS articles_ad AFTER DELETE ON articles BEGIN
+    INSERT INTO articles_fts(articles_fts, rowid, title, snippet) VALUES ('delete', old.id, old.title, old.snippet);
+END;
+CREATE TRIGGER IF NOT EXISTS articles_au AFTER UPDATE OF title, snippet ON articles BEGIN
+    INSERT INTO articles_fts(articles_fts, rowid, title, snippet) VALUES ('delete', old.id, old.title, old.snippet);
+    INSERT INTO articles_fts(rowid, title, snippet) VALUES (new.id, new.title, new.snippet);
+END;
+"""
+
+_COLUMNS = "a.link, a.title, a.snippet, a.source, a.date, a.search_engine, a.first_seen"
+
+
+def normalize_location(location: str) -> str:
+    return " ".join(location.lower().split())
+
+
+def content_hash(article: Dict) -> str:
+    """Hash of the normalized title + snippet (same story, same hash)"""
+    text = " ".join(f"{article.get('title', '')} {article.get('snippet', '')}".lower().split())
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class ArticleStore:
+    """
+    ARTICLE STORE: Every fetched article, kept in SQLite across runs
+    Articles are upserted by link and content hash, so a refresh can tell
+    which articles it has never seen (a known link, or the same story under
+    a new link, is not new). The database runs in WAL mode so readers never
+    block the writer, and an FTS5 index over title + snippet serves
+    full-text search over the whole history.
+    """
+
+    def __init__(self, path: str = ARTICLE_STORE_PATH):
+        self.path = path
+        self._local = threading.local()
+        self._write_lock = threading.Lock()  # one writer at a time inside this process
+        self._stats = {'upserted': 0, 'new': 0, 'updated': 0}
+
+        with self._write_lock:
+            connection = self._connection()
+            connection.executescript(_SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        """One connection per thread (sqlite3 connections are not thread-safe)"""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            connection.row_factory = sqlite3.Row
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute("PRAGMA foreign_keys=ON")
+            self._local.connection = connection
+        return connection
+
+    def upsert(self, articles: List[Dict], location: Optional[str] = None) -> List[Dict]:
+        """
+        Store articles (and which location they were found for)
+
+        Returns:
+            The articles not seen before: new link and new content, or a
+            known link whose title/snippet changed
+        """
+        now = time.time()
+        unseen = []
+        with self._write_lock:
+            connection = self._connection()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                for article in articles:
+                    digest = content_hash(article)
+                    link = article.get('link') or f"hash:{digest}"
+                    row = connection.execute(
+                        "SELECT id, content_hash FROM articles WHERE link = ?", (link,)
+                    ).fetchone()
+
+                    if row is None:
+                        same_story = connection.execute(
+                            "SELECT id FROM articles WHERE content_hash = ? LIMIT 1", (digest,)
+                        ).fetchone()
+                        if same_story is not None:
+                            # Same story under another link: reuse its row so
+                            # search and new_since list the story once
+                            article_id = same_story['id']
+                            connection.execute("UPDATE articles SET last_seen = ? WHERE id = ?", (now, article_id))
+                        else:
+                            article_id = connection.execute(
+                                "INSERT INTO articles (link, content_hash, title, snippet, source, date, "
+                                "search_engine, first_seen, last_seen) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                                (link, digest, article.get('title', ''), article.get('snippet', ''),
+                                 article.get('source'), article.get('date'), article.get('search_engine'),
+                                 now, now)
+                            ).lastrowid
+                            unseen.append(article)
+                            self._stats['new'] += 1
+                    else:
+                        article_id = row['id']
+                        if row['content_hash'] != digest:
+                            connection.execute(
+                                "UPDATE articles SET content_hash = ?, title = ?, snippet = ?, "
+                                "last_seen = ? WHERE id = ?",
+                                (digest, article.get('title', ''), article.get('snippet', ''), now, article_id)
+                            )
+                            unseen.append(article)
+                            self._stats['updated'] += 1
+                        else:
+                            connection.execute("UPDATE articles SET last_seen = ? WHERE id = ?", (now, article_id))
+
+                    if location:
+                        connection.execute(
+                            "INSERT OR IGNORE INTO article_locations (location, article_id, first_seen) "
+                            "VALUES (?, ?, ?)",
+                            (normalize_location(location), article_id, now)
+                        )
+                    self._stats['upserted'] += 1
+                connection.execute("COMMIT")
+            except Exception:
+                connection.execute("ROLLBACK")
+                raise
+        return unseen
+
+    def new_since(self, location: str, since: float, limit: int = 50) -> List[Dict]:
+        """Articles first found for this location after `since` (epoch seconds), newest first"""
+        rows = self._connection().execute(
+            f"SELECT {_COLUMNS} FROM article_locations l JOIN articles a ON a.id = l.article_id "
+            "WHERE l.location = ? AND l.first_seen > ? ORDER BY l.first_seen DESC LIMIT ?",
+            (normalize_location(location), since, limit)
+        ).fetchall()
+        return [dict(row) for row in rows]
+
+    def search(self, query: str, location: Optional[str] = None, limit: int = 20) -> List[Dict]:
+        """
+        Full-text search over every stored title and snippet (best match
+        first). Each word of the query must appear; quotes are allowed for
+        phrases, e.g. '"flash flood" warning'
+        """
+        terms = self._fts_query(query)
+        if not terms:
+            return []
+        sql = (
+            f"SELECT {_COLUMNS} FROM articles_fts f JOIN articles a ON a.id = f.rowid "
+            "WHERE articles_fts MATCH ?"
+        )
+        params: list = [terms]
+        if location:
+            sql += " AND a.id IN (SELECT article_id FROM article_locations WHERE location = ?)"
+            params.append(normalize_location(location))
+        sql += " ORDER BY bm25(articles_fts) LIMIT ?"
+        params.append(limit)
+        return [dict(row) for row in self._connection().execute(sql, params).fetchall()]
+
+    @staticmethod
+    def _fts_query(query: str) -> str:
+        """Quote user words so FTS5 operators and punctuation cannot break the query"""
+        phrases = query.split('"')
+        terms = []
+        for index, part in enumerate(phrases):
+            if index % 2:  # inside quotes: keep as a phrase
+                if part.strip():
+                    terms.append('"' + part.strip() + '"')
+            else:
+                terms.extend('"' + word + '"' for word in part.split() if word)
+        return " ".join(terms)
+
+    def get_stats(self) -> Dict:
+        connection = self._connection()
+        return dict(
+            self._stats,
+            articles=connection.execute("SELECT COUNT(*) FROM articles").fetchone()[0],
+            locations=connection.execute("SELECT COUNT(DISTINCT location) FROM article_locations").fetchone()[0],
+            path=self.path
+        )
+
+    def close(self):
+        """Close this thread's connection"""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+
+_store: Optional[ArticleStore] = None
+_store_lock = threading.Lock()
+
+
+def get_article_store() -> ArticleStore:
+    """Process-wide article store"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                directory = os.path.dirname(os.path.abspath(ARTICLE_STORE_PATH))
+                os.makedirs(directory, exist_ok=True)
+                _store = ArticleStore(ARTICLE_STORE_PATH)
+    return _store
@@ -0,0 +1,86 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+FRESH = "fresh"
+STALE = "stale"
+
+
+class TTLCache:
+    """
+    TTL CACHE: Bounded, thread-safe LRU cache with expiring entries
+    Entries are fresh for `ttl` seconds, then stale (still returned so the
+    caller can serve them while refreshing) until `stale_ttl` has passed
+    """
+
+    def __init__(self, max_size: int = 256, ttl: float = 300, stale_ttl: float = 0):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.stale_ttl = max(stale_ttl, ttl)
+
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {
+            'hits': 0,
+            'stale_hits': 0,
+            'misses': 0,
+            'evictions': 0
+        }
+
+    def get(self, key: Hashable) -> Tuple[Optional[Any], Optional[str]]:
+        """
+        Look up a key
+
+        Returns:
+            (value, FRESH) or (value, STALE) on a hit, (None, None) on a miss
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self._stats['misses'] += 1
+                return None, None
+
+            stored_at, value = entry
+            age = now - stored_at
+            if age > self.stale_ttl:
+                del self._data[key]
+                self._stats['misses'] += 1
+                return None, None
+
+            self._data.move_to_end(key)
+            if age > self.ttl:
+                self._stats['stale_hits'] += 1
+                return value, STALE
+            self._stats['hits'] += 1
+            return value, FRESH
+
+    def set(self, key: Hashable, value: Any):
+        """Store a value, evicting the least recently used entries if full"""
+        with self._lock:
+            self._data[key] = (time.monotonic(), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+                self._stats['evictions'] += 1
+
+    def invalidate(self, key: Optional[Hashable] = None):
+        """Drop one key, or everything when no key is given"""
+        with self._lock:
+            if key is None:
+                self._data.clear()
+            else:
+                self._data.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters plus the current size and hit ratio"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['size'] = len(self._data)
+        lookups = stats['hits'] + stats['stale_hits'] + stats['misses']
+        stats['hit_ratio'] = round((stats['hits'] + stats['stale_hits']) / lookups, 3) if lookups else 0.0
+        return stats
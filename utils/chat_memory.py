@@ -0,0 +1,98 @@
+import re
+from collections import deque
+from typing import Callable, Optional
+
+from utils.tokens import estimate_tokens, truncate_to_tokens
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+def extractive_summary(question: str, answer: str, max_words: int = 30) -> str:
+    """
+    Compress one exchange locally: the question plus the first sentence of
+    the answer, both capped (no extra LLM round trip)
+    """
+    def clip(text: str) -> str:
+        words = " ".join(text.split()).split(" ")
+        return " ".join(words[:max_words]) + ("…" if len(words) > max_words else "")
+
+    first_sentence = _SENTENCE_END.split(" ".join(answer.split()), maxsplit=1)[0]
+    return f"- User asked: {clip(question)} → Assistant: {clip(first_sentence)}"
+
+
+class ConversationMemory:
+    """
+    CONVERSATION MEMORY: Token-budgeted chat history with a rolling summary
+    Recent exchanges are kept verbatim; when the total goes over the budget
+    the oldest exchanges are folded into a running summary, which is itself
+    trimmed to its own budget. Prompt size stays flat over long sessions.
+    """
+
+    def __init__(self, token_budget: int = 1200, summary_budget: int = 300,
+                 summarizer: Optional[Callable[[str, str], str]] = None):
+        self.token_budget = token_budget
+        self.summary_budget = summary_budget
+        self.summarizer = summarizer or extractive_summary
+
+        self.turns = deque()  # (question, answer, tokens)
+        self.summary_lines = deque()  # (line, tokens)
+        self.turn_tokens = 0
+        self.summary_tokens = 0
+        self.turns_summarized = 0
+
+    def add(self, question: str, answer: str):
+        """Store an exchange, compressing older ones if over budget"""
+        # A single oversized answer is clipped so it cannot blow the budget alone
+        answer_budget = max(self.token_budget - estimate_tokens(question), self.token_budget // 2)
+        answer = truncate_to_tokens(answer, answer_budget)
+        tokens = estimate_tokens(question) + estimate_tokens(answer)
+        self.turns.append((question, answer, tokens))
+        self.turn_tokens += tokens
+        self._enforce_budget()
+
+    def _enforce_budget(self):
+        # Always keep the latest exchange verbatim
+        while len(self.turns) > 1 and self.token_count > self.token_budget:
+            question, answer, tokens = self.turns.popleft()
+            self.turn_tokens -= tokens
+            line = self.summarizer(question, answer)
+            line_tokens = estimate_tokens(line)
+            self.summary_lines.append((line, line_tokens))
+            self.summary_tokens += line_tokens
+            self.turns_summarized += 1
+
+            # The oldest summary lines go first when the summary is full
+            while len(self.summary_lines) > 1 and self.summary_tokens > self.summary_budget:
+                _, dropped = self.summary_lines.popleft()
+                self.summary_tokens -= dropped
+
+    @property
+    def token_count(self) -> int:
+        return self.turn_tokens + self.summary_tokens
+
+    def render(self) -> str:
+        """Context string for the chat prompt"""
+        parts = []
+        if self.summary_lines:
+            parts.append("Summary of earlier conversation:")
+            parts.extend(line for line, _ in self.summary_lines)
+            parts.append("")
+        for question, answer, _ in self.turns:
+            parts.append(f"User: {question}\nAssistant: {answer}")
+        return "\n".join(parts).strip()
+
+    def clear(self):
+        self.turns.clear()
+        self.summary_lines.clear()
+        self.turn_tokens = 0
+        self.summary_tokens = 0
+        self.turns_summarized = 0
+
+    def get_stats(self) -> dict:
+        return {
+            "turns": len(self.turns),
+            "turns_summarized": self.turns_summarized,
+            "tokens": self.token_count,
+            "summary_tokens": self.summary_tokens,
+            "token_budget": self.token_budget
+        }
@@ -0,0 +1,133 @@
+import threading
+import time
+from typing import Callable, Dict
+
+from config import NEWS_BREAKER_FAILURES, NEWS_BREAKER_COOLDOWN
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a provider whose circuit is open"""
+
+
+class CircuitBreaker:
+    """
+    CIRCUIT BREAKER: Stops calling a provider that keeps failing
+    After `failure_threshold` consecutive failures the circuit opens and
+    calls are rejected straight away, so checks go to the healthy provider
+    instead of waiting for another timeout. Once `cool_down` seconds have
+    passed the circuit is half-open: one probe call is let through, and
+    its outcome closes the circuit again or re-opens it for another cool-down.
+    """
+
+    def __init__(self, name: str, failure_threshold: int = NEWS_BREAKER_FAILURES,
+                 cool_down: float = NEWS_BREAKER_COOLDOWN, clock: Callable[[], float] = time.monotonic):
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.cool_down = cool_down
+        self._state = CLOSED
+        self._failures = 0
+        self.clock = clock
+        self._opened_at = 0.0  # clock() when the circuit last opened
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+        self._stats = {'calls': 0, 'failures': 0, 'rejected': 0, 'trips': 0}
+
+    def _current_state(self, now: float) -> str:
+        if self._state == OPEN and now - self._opened_at >= self.cool_down:
+            return HALF_OPEN
+        return self._state
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state(self.clock())
+
+    def available(self) -> bool:
+        """Whether a call could go through right now (does not take the probe slot)"""
+        with self._lock:
+            state = self._current_state(self.clock())
+            return state == CLOSED or (state == HALF_OPEN and not self._probe_in_flight)
+
+    def allow(self) -> bool:
+        """
+        Ask to make one call. In the half-open state only the first caller
+        gets through (as the probe); everyone else is rejected until the
+        probe reports back
+        """
+        with self._lock:
+            state = self._current_state(self.clock())
+            if state == CLOSED:
+                allowed = True
+            elif state == HALF_OPEN and not self._probe_in_flight:
+                self._state = HALF_OPEN
+                self._probe_in_flight = True
+                allowed = True
+            else:
+                allowed = False
+            self._stats['calls' if allowed else 'rejected'] += 1
+            return allowed
+
+    def record_success(self):
+        with self._lock:
+            if self._state != CLOSED:
+                print(f"✅ {self.name} circuit closed (probe succeeded)")
+            self._state = CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            self._stats['failures'] += 1
+            probe_failed = self._state == HALF_OPEN
+            if probe_failed or (self._state == CLOSED and self._failures >= self.failure_threshold):
+                self._state = OPEN
+                self._opened_at = self.clock()
+                self._stats['trips'] += 1
+                print(f"🔌 {self.name} circuit open for {self.cool_down:g}s after "
+                      f"{'a failed probe' if probe_failed else f'{self._failures} consecutive failures'}")
+            if probe_failed:
+                self._probe_in_flight = False
+
+    def reset(self):
+        """Close the circuit and forget the failure count"""
+        with self._lock:
+            self._state = CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            now = self.clock()
+            state = self._current_state(now)
+            retry_in = max(0.0, self._opened_at + self.cool_down - now) if state == OPEN else 0.0
+            return dict(
+                self._stats,
+                state=state,
+                consecutive_failures=self._failures,
+                retry_in=round(retry_in, 1)
+            )
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(name: str) -> CircuitBreaker:
+    """Process-wide circuit breaker for one provider (shared by every NewsAgent)"""
+    with _breakers_lock:
+        breaker = _breakers.get(name)
+        if breaker is None:
+            breaker = _breakers[name] = CircuitBreaker(name)
+        return breaker
+
+
+def get_breaker_states() -> Dict[str, Dict]:
+    """Stats of every breaker created so far, by provider name"""
+    with _breakers_lock:
+        breakers = dict(_breakers)
+    return {name: breaker.get_stats() for name, breaker in breakers.items()}
@@ -0,0 +1,121 @@
+import random
+import re
+import zlib
+from typing import Dict, List, Set, Tuple
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_NON_WORD = re.compile(r"[^a-z0-9 ]+")
+
+
+class NearDuplicateDetector:
+    """
+    NEAR-DUPLICATE DETECTOR: MinHash + LSH over article title and snippet
+    Syndicated copies of a story rarely share an exact title, so articles are
+    compared by the Jaccard similarity of their word shingles (consecutive
+    word pairs), and articles that mention different numbers are never
+    merged. Reports of separate events from one template ("Tokyo weather:
+    heavy rain expected" / "Osaka weather: ...") stay below the threshold
+    because every shingle with the differing word differs. The LSH index
+    only compares articles that share a band, keeping dedup close to linear
+    in the number of articles.
+    """
+
+    def __init__(self, threshold: float = 0.65, num_perm: int = 32, shingle_size: int = 2, seed: int = 1):
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.bands, self.rows = self._choose_bands(threshold, num_perm)
+
+        rng = random.Random(seed)
+        self._perms = [
+            (rng.randint(1, _MERSENNE_PRIME - 1), rng.randint(0, _MERSENNE_PRIME - 1))
+            for _ in range(num_perm)
+        ]
+
+    @staticmethod
+    def _choose_bands(threshold: float, num_perm: int) -> Tuple[int, int]:
+        """Pick bands × rows whose LSH threshold (1/b)^(1/r) is closest to ours"""
+        options = [(b, num_perm // b) for b in range(1, num_perm + 1) if num_perm % b == 0]
+        return min(options, key=lambda option: abs((1 / option[0]) ** (1 / option[1]) - threshold))
+
+    def _normalize(self, text: str) -> str:
+        return " ".join(_NON_WORD.sub(" ", text.lower()).split())
+
+    def _words(self, article: Dict) -> List[str]:
+        return self._normalize(f"{article.get('title', '')} {article.get('snippet', '')}").split()
+
+    def shingles(self, article: Dict) -> Set[int]:
+        """Hashed word shingles (shingle_size consecutive words) of the article's title + snippet"""
+        words = self._words(article)
+        k = self.shingle_size
+        if len(words) <= k:
+            return {zlib.crc32(" ".join(words).encode("utf-8"))} if words else set()
+        return {zlib.crc32(" ".join(words[i:i + k]).encode("utf-8")) for i in range(len(words) - k + 1)}
+
+    def numbers(self, article: Dict) -> Set[str]:
+        """Numbers in the title + snippet (magnitudes, counts, dates)"""
+        return {word for word in self._words(article) if word.isdigit()}
+
+    def signature(self, shingles: Set[int]) -> List[int]:
+        """MinHash signature: the minimum of each permutation over the shingles"""
+        if not shingles:
+            return [_MERSENNE_PRIME] * self.num_perm
+        return [
+            min([(a * s + b) % _MERSENNE_PRIME for s in shingles])
+            for a, b in self._perms
+        ]
+
+    @staticmethod
+    def jaccard(first: Set[int], second: Set[int]) -> float:
+        if not first or not second:
+            return 0.0
+        return len(first & second) / len(first | second)
+
+    def deduplicate(self, articles: List[Dict]) -> Tuple[List[Dict], int]:
+        """
+        Keep the first article of every group of near-duplicates
+
+        Returns:
+            (unique articles in original order, number of duplicates merged)
+        """
+        unique_articles = []
+        kept_shingles: List[Set[int]] = []
+        kept_numbers: List[Set[str]] = []
+        seen_titles = set()
+        buckets: Dict[Tuple[int, int], List[int]] = {}
+        merged = 0
+
+        for article in articles:
+            # Exact title match (first 50 chars) is the cheap first pass
+            title_key = self._normalize(article.get('title', ''))[:50]
+            if title_key and title_key in seen_titles:
+                merged += 1
+                continue
+
+            shingles = self.shingles(article)
+            numbers = self.numbers(article)
+            signature = self.signature(shingles)
+            band_keys = [
+                (band, hash(tuple(signature[band * self.rows:(band + 1) * self.rows])))
+                for band in range(self.bands)
+            ]
+
+            # Verify LSH candidates with the exact shingle similarity
+            candidates = {index for key in band_keys for index in buckets.get(key, ())}
+            if any(
+                numbers == kept_numbers[index] and self.jaccard(shingles, kept_shingles[index]) >= self.threshold
+                for index in candidates
+            ):
+                merged += 1
+                continue
+
+            index = len(unique_articles)
+            unique_articles.append(article)
+            kept_shingles.append(shingles)
+            kept_numbers.append(numbers)
+            if title_key:
+                seen_titles.add(title_key)
+            for key in band_keys:
+                buckets.setdefault(key, []).append(index)
+
+        return unique_articles, merged
@@ -0,0 +1,158 @@
+import threading
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.retry import Retry
+
+from config import HTTP_POOL_SIZE, HTTP_MAX_RETRIES, HTTP_RETRY_BACKOFF, HTTP_KEEP_ALIVE
+
+
+class _CountingAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that counts how many TCP/TLS connections it really opens,
+    so we can tell reused keep-alive connections from fresh handshakes
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.new_connections = 0
+        self._lock = threading.Lock()
+        super().__init__(*args, **kwargs)
+
+    def _record_new_connection(self):
+        with self._lock:
+            self.new_connections += 1
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        adapter = self
+
+        class _CountingHTTPPool(HTTPConnectionPool):
+            def _new_conn(self):
+                adapter._record_new_connection()
+                return super()._new_conn()
+
+        class _CountingHTTPSPool(HTTPSConnectionPool):
+            def _new_conn(self):
+                adapter._record_new_connection()
+                return super()._new_conn()
+
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': _CountingHTTPPool,
+            'https': _CountingHTTPSPool
+        }
+
+
+class HTTPSessionPool:
+    """
+    HTTP SESSION POOL: One keep-alive requests.Session per host
+    Shared by every agent in the process so repeated calls to Serper,
+    Discord, etc. skip the TCP+TLS handshake
+    """
+
+    def __init__(self, pool_size: int = HTTP_POOL_SIZE, max_retries: int = HTTP_MAX_RETRIES,
+                 keep_alive: bool = HTTP_KEEP_ALIVE, backoff_factor: float = HTTP_RETRY_BACKOFF):
+        self.pool_size = pool_size
+        self.max_retries = max_retries
+        self.keep_alive = keep_alive
+        self.backoff_factor = backoff_factor
+
+        self._sessions: Dict[str, requests.Session] = {}
+        self._adapters: Dict[str, _CountingAdapter] = {}
+        self._requests: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def _host_key(self, url: str) -> str:
+        parts = urlsplit(url)
+        return f"{parts.scheme}://{parts.netloc}".lower()
+
+    def _build_session(self) -> tuple:
+        """Create a pooled session with connection-level retries"""
+        # Only connection errors are retried for POST; status retries are
+        # limited to idempotent methods so a webhook is never posted twice
+        retry = Retry(
+            total=self.max_retries,
+            backoff_factor=self.backoff_factor,
+            status_forcelist=(500, 502, 503, 504),
+            respect_retry_after_header=False,
+            raise_on_status=False
+        )
+        adapter = _CountingAdapter(
+            pool_connections=1,
+            pool_maxsize=self.pool_size,
+            max_retries=retry
+        )
+
+        session = requests.Session()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        if not self.keep_alive:
+            session.headers['Connection'] = 'close'
+        return session, adapter
+
+    def get_session(self, url: str) -> requests.Session:
+        """Return the shared session for the host of this URL"""
+        key = self._host_key(url)
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is None:
+                session, adapter = self._build_session()
+                self._sessions[key] = session
+                self._adapters[key] = adapter
+                self._requests[key] = 0
+            self._requests[key] += 1
+        return session
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request through the pooled session for the URL's host"""
+        return self.get_session(url).request(method, url, **kwargs)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request('POST', url, **kwargs)
+
+    def get_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Connection reuse counters per host
+
+        Returns:
+            {host: {"requests": n, "new_connections": n, "reused_connections": n}}
+        """
+        stats = {}
+        with self._lock:
+            for key, adapter in self._adapters.items():
+                total = self._requests[key]
+                opened = adapter.new_connections
+                stats[key] = {
+                    'requests': total,
+                    'new_connections': opened,
+                    'reused_connections': max(total - opened, 0)
+                }
+        return stats
+
+    def close(self):
+        """Close every pooled connection"""
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+            self._adapters.clear()
+            self._requests.clear()
+
+
+_pool: Optional[HTTPSessionPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_http_pool() -> HTTPSessionPool:
+    """Process-wide HTTP session pool"""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = HTTPSessionPool()
+    return _pool
@@ -0,0 +1,253 @@
+import json
+import math
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Histogram buckets in seconds (upper bounds, Prometheus style)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+# Recent observations kept per series for percentiles
+RECENT_SAMPLES = 512
+
+METRIC_PREFIX = "redac_"
+
+_Labels = Tuple[Tuple[str, str], ...]
+
+
+def _labels_key(labels: Dict) -> _Labels:
+    return tuple(sorted((str(name), str(value)) for name, value in labels.items()))
+
+
+def _format_labels(labels: _Labels, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(labels) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    escaped = (value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, value in pairs)
+    return "{" + ",".join(f'{name}="{value}"' for (name, _), value in zip(pairs, escaped)) + "}"
+
+
+class _Histogram:
+    """Cumulative bucket counts plus a window of recent samples for percentiles"""
+
+    def __init__(self):
+        self.bucket_counts = [0] * len(LATENCY_BUCKETS)
+        self.count = 0
+        self.total = 0.0
+        self.recent = deque(maxlen=RECENT_SAMPLES)
+
+    def observe(self, seconds: float):
+        self.count += 1
+        self.total += seconds
+        self.recent.append(seconds)
+        for index, bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= bound:
+                self.bucket_counts[index] += 1
+                break
+
+    def percentile(self, pct: float) -> Optional[float]:
+        if not self.recent:
+            return None
+        ordered = sorted(self.recent)
+        return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+class MetricsRegistry:
+    """
+    METRICS: Timing spans and counters for every stage of the pipeline
+    Latencies go into histograms (search per provider, formatting, each LLM
+    chain, parsing, webhook delivery), events into counters. Everything can
+    be exported as Prometheus text or as a JSON snapshot.
+    """
+
+    def __init__(self):
+        self._histograms: Dict[str, Dict[_Labels, _Histogram]] = {}
+        self._counters: Dict[str, Dict[_Labels, float]] = {}
+        self._help: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def describe(self, name: str, help_text: str):
+        self._help[name] = help_text
+
+    def observe(self, name: str, seconds: float, **labels):
+        """Record one duration (seconds)"""
+        key = _labels_key(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = _Histogram()
+            histogram.observe(seconds)
+
+    def inc(self, name: str, value: float = 1, **labels):
+        """Add to a counter"""
+        key = _labels_key(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+
+    @contextmanager
+    def span(self, name: str, **labels) -> Iterator[None]:
+        """
+        Time a block into the `name` histogram. Exceptions are counted in
+        `<name>_errors` and re-raised
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        except BaseException:
+            self.inc(f"{name}_errors", **labels)
+            raise
+        finally:
+            self.observe(name, time.perf_counter() - started, **labels)
+
+    def percentile(self, name: str, pct: float, **labels) -> Optional[float]:
+        """Percentile of the recent samples of one series (None if no data)"""
+        with self._lock:
+            histogram = self._histograms.get(name, {}).get(_labels_key(labels))
+            return histogram.percentile(pct) if histogram else None
+
+    def count(self, name: str, **labels) -> float:
+        """Current value of a counter, or the number of observations of a histogram"""
+        key = _labels_key(labels)
+        with self._lock:
+            if name in self._counters:
+                return self._counters[name].get(key, 0)
+            histogram = self._histograms.get(name, {}).get(key)
+            return histogram.count if histogram else 0
+
+    def summary(self) -> List[Dict]:
+        """One row per timed series: count, mean and p50/p95/p99 (seconds)"""
+        rows = []
+        with self._lock:
+            for name, series in sorted(self._histograms.items()):
+                for labels, histogram in sorted(series.items()):
+                    rows.append({
+                        "name": name,
+                        "labels": dict(labels),
+                        "count": histogram.count,
+                        "mean": histogram.total / histogram.count if histogram.count else 0.0,
+                        "p50": histogram.percentile(50),
+                        "p95": histogram.percentile(95),
+                        "p99": histogram.percentile(99)
+                    })
+        return rows
+
+    def snapshot(self) -> Dict:
+        """JSON-serializable snapshot of every counter and histogram"""
+        with self._lock:
+            counters = [
+                {"name": name, "labels": dict(labels), "value": value}
+                for name, series in sorted(self._counters.items())
+                for labels, value in sorted(series.items())
+            ]
+        return {"timestamp": time.time(), "histograms": self.summary(), "counters": counters}
+
+    def to_json(self) -> str:
+        return json.dumps(self.snapshot(), indent=2)
+
+    def to_prometheus(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)"""
+        lines = []
+        with self._lock:
+            for name, series in sorted(self._histograms.items()):
+                metric = f"{METRIC_PREFIX}{name}_seconds"
+                if name in self._help:
+                    lines.append(f"# HELP {metric} {self._help[name]}")
+                lines.append(f"# TYPE {metric} histogram")
+                for labels, histogram in sorted(series.items()):
+                    cumulative = 0
+                    for bound, bucket_count in zip(LATENCY_BUCKETS, histogram.bucket_counts):
+                        cumulative += bucket_count
+                        lines.append(f"{metric}_bucket{_format_labels(labels, ('le', f'{bound:g}'))} {cumulative}")
+                    lines.append(f"{metric}_bucket{_format_labels(labels, ('le', '+Inf'))} {histogram.count}")
+                    lines.append(f"{metric}_sum{_format_labels(labels)} {histogram.total:.6f}")
+                    lines.append(f"{metric}_count{_format_labels(labels)} {histogram.count}")
+
+            for name, series in sorted(self._counters.items()):
+                metric = f"{METRIC_PREFIX}{name}_total"
+                if name in self._help:
+                    lines.append(f"# HELP {metric} {self._help[name]}")
+                lines.append(f"# TYPE {metric} counter")
+                for labels, value in sorted(series.items()):
+                    lines.append(f"{metric}{_format_labels(labels)} {value:g}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+
+
+_metrics: Optional[MetricsRegistry] = None
+_metrics_lock = threading.Lock()
+
+
+def get_metrics() -> MetricsRegistry:
+    """Process-wide metrics registry"""
+    global _metrics
+    if _metrics is None:
+        with _metrics_lock:
+            if _metrics is None:
+                _metrics = MetricsRegistry()
+                for name, help_text in _DESCRIPTIONS.items():
+                    _metrics.describe(name, help_text)
+    return _metrics
+
+
+_DESCRIPTIONS = {
+    "search": "News provider request latency (cache misses only)",
+    "format": "Formatting articles for the analysis prompt",
+    "llm": "LLM chain invoke latency by chain",
+    "llm_first_chunk": "Time to the first streamed chunk",
+    "parse": "Parsing the analysis into DisasterAnalysis",
+    "webhook": "One webhook delivery attempt",
+    "search_errors": "News provider requests that raised",
+    "llm_errors": "LLM chain invokes that raised",
+    "parse_errors": "Analyses that failed DisasterAnalysis validation",
+    "webhook_errors": "Webhook attempts that raised",
+    "webhook_outcomes": "Webhook attempts by outcome",
+    "parse_outcomes": "Analyses by parse outcome",
+    "llm_calls_avoided": "Analyses answered without an LLM call, by reason",
+    "batch_fallbacks": "Locations of a batched analysis re-analyzed on their own (verdict missing)",
+    "breaker_rejections": "News provider calls skipped because the circuit was open",
+    "hedge_requests": "News queries also sent to the backup provider",
+    "hedge_wins": "Hedged news queries answered by the backup provider",
+    "prompt_tokens": "Estimated tokens of the formatted news sent for analysis",
+    "prompt_articles": "Articles packed into or dropped from analysis prompts"
+}
+
+
+def start_metrics_server(port: int, host: str = "0.0.0.0"):
+    """
+    Serve /metrics (Prometheus text) and /metrics.json from a daemon thread
+
+    Returns:
+        The running ThreadingHTTPServer (call shutdown() to stop it)
+    """
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] == "/metrics":
+                body, content_type = get_metrics().to_prometheus(), "text/plain; version=0.0.4"
+            elif self.path.split("?")[0] == "/metrics.json":
+                body, content_type = get_metrics().to_json(), "application/json"
+            else:
+                self.send_error(404)
+                return
+            data = body.encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True).start()
+    return server
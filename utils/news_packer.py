@@ -0,0 +1,99 @@
+import re
+from typing import Callable, Dict, List, Optional, Tuple
+
+from utils.tokens import estimate_tokens, truncate_to_tokens
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+_EMPTY_FIELDS = {"", "unknown", "recent"}
+
+HEADER = "Recent News Articles"
+
+
+def trim_snippet(snippet: str, max_tokens: int) -> str:
+    """
+    Keep whole sentences while they fit in max_tokens; a first sentence
+    that is already too long is cut mid-sentence
+    """
+    snippet = " ".join((snippet or "").split())
+    if estimate_tokens(snippet) <= max_tokens:
+        return snippet
+    kept, used = [], 0
+    for sentence in _SENTENCE_END.split(snippet):
+        cost = estimate_tokens(sentence)
+        if used + cost > max_tokens:
+            break
+        kept.append(sentence)
+        used += cost
+    return " ".join(kept) if kept else truncate_to_tokens(snippet, max_tokens)
+
+
+class NewsPacker:
+    """
+    NEWS PACKER: Builds the analysis prompt's news block under a token budget
+    Articles are ranked by relevance (hazard mentions, then whether they
+    name the location), snippets are cut at sentence boundaries, and
+    metadata shared by every article (the search engine) is written once
+    in the header instead of on every article. Articles are added best
+    first until the budget is spent
+    """
+
+    def __init__(self, token_budget: int, snippet_tokens: int,
+                 relevance: Optional[Callable[[str], float]] = None):
+        self.token_budget = token_budget
+        self.snippet_tokens = snippet_tokens
+        self.relevance = relevance
+
+    def rank(self, articles: List[Dict], location: Optional[str] = None) -> List[Dict]:
+        """Most relevant first; ties keep the search order"""
+        place = " ".join((location or "").lower().split())
+
+        def score(item):
+            index, article = item
+            text = f"{article.get('title', '')}. {article.get('snippet', '')}"
+            hazard = self.relevance(text) if self.relevance else 0.0
+            local = 1.0 if place and place in " ".join(text.lower().split()) else 0.0
+            return (-(hazard + local), index)
+
+        return [article for _, article in sorted(enumerate(articles), key=score)]
+
+    def pack(self, articles: List[Dict], location: Optional[str] = None) -> Tuple[str, Dict]:
+        """
+        Returns:
+            (news block, {"articles", "packed", "dropped", "tokens", "budget"})
+        """
+        engines = {article.get('search_engine') or 'Unknown' for article in articles}
+        shared_engine = engines.pop() if len(engines) == 1 else None
+        header = f"{HEADER} (via {shared_engine}):\n\n" if shared_engine else f"{HEADER}:\n\n"
+
+        blocks, used = [], estimate_tokens(header)
+        for article in self.rank(articles, location):
+            block = self._format_article(len(blocks) + 1, article, show_engine=shared_engine is None)
+            cost = estimate_tokens(block)
+            # The best article always goes in, even on its own it is over budget
+            if blocks and used + cost > self.token_budget:
+                continue
+            blocks.append(block)
+            used += cost
+
+        text = header + "".join(blocks)
+        return text, {
+            "articles": len(articles),
+            "packed": len(blocks),
+            "dropped": len(articles) - len(blocks),
+            "tokens": estimate_tokens(text),
+            "budget": self.token_budget
+        }
+
+    def _format_article(self, number: int, article: Dict, show_engine: bool) -> str:
+        lines = [f"{number}. {' '.join(article.get('title', '').split())}"]
+        snippet = trim_snippet(article.get('snippet', ''), self.snippet_tokens)
+        if snippet:
+            lines.append(f"   {snippet}")
+        metadata = [article.get('source'), article.get('date')]
+        if show_engine:
+            metadata.append(article.get('search_engine'))
+        metadata = [str(field).strip() for field in metadata
+                    if field and str(field).strip().lower() not in _EMPTY_FIELDS]
+        if metadata:
+            lines.append(f"   Source: {' | '.join(metadata)}")
+        return "\n".join(lines) + "\n\n"
@@ -1,6 +1,5 @@
 from pydantic import BaseModel, Field
-from langchain_core.output_parsers import PydanticOutputParser
-from typing import Optional
+from typing import List, Optional
 
 # PARSER: Structures the AI's response into organized data
 # Think of this as a form that the AI must fill out correctly
@@ -8,19 +7,75 @@ from typing import Optional
 class DisasterAnalysis(BaseModel):
     """Structure for disaster analysis results"""
     disaster_found: bool = Field(description="Whether a disaster was found")
-    disaster_type: Optional[str] = Field(description="Type of disaster")
-    severity: Optional[str] = Field(description="Severity level (Low/Medium/High)")
-    description: Optional[str] = Field(description="Brief description of the disaster")
-    actions: Optional[str] = Field(description="Recommended actions")
+    disaster_type: Optional[str] = Field(default=None, description="Type of disaster")
+    severity: Optional[str] = Field(default=None, description="Severity level (Low/Medium/High)")
+    description: Optional[str] = Field(default=None, description="Brief description of the disaster")
+    actions: Optional[str] = Field(default=None, description="Recommended actions")
+
+class LocationVerdict(DisasterAnalysis):
+    """One location's verdict inside a batched analysis"""
+    location: str = Field(description="The location the verdict is for")
+
+class BatchDisasterAnalysis(BaseModel):
+    """Structure for a batched (several locations) disaster analysis"""
+    verdicts: List[LocationVerdict] = Field(description="One verdict per location")
 
 class ChatResponse(BaseModel):
     """Structure for chatbot responses"""
     response: str = Field(description="The chatbot's response")
     helpful: bool = Field(description="Whether the response is helpful")
 
-# Create parser instances
-disaster_parser = PydanticOutputParser(pydantic_object=DisasterAnalysis)
-chat_parser = PydanticOutputParser(pydantic_object=ChatResponse)
+# Parser instances (disaster_parser, chat_parser) are created on first
+# access so importing this module does not pull in LangChain
+_PARSER_MODELS = {
+    "disaster_parser": DisasterAnalysis,
+    "batch_disaster_parser": BatchDisasterAnalysis,
+    "chat_parser": ChatResponse
+}
+
+def _get_parser(name: str):
+    if name not in globals():
+        from langchain_core.output_parsers import PydanticOutputParser
+        globals()[name] = PydanticOutputParser(pydantic_object=_PARSER_MODELS[name])
+    return globals()[name]
+
+def __getattr__(name):
+    if name in _PARSER_MODELS:
+        return _get_parser(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Function to parse the JSON disaster analysis
+def parse_disaster_json(text: str) -> dict:
+    """
+    Validate a JSON analysis against DisasterAnalysis (code fences allowed)
+    Raises OutputParserException when the text is not valid JSON or does not
+    match the model, so the caller can ask the AI to repair it
+    """
+    analysis = _get_parser("disaster_parser").parse(text)
+    return {
+        "disaster_found": analysis.disaster_found,
+        "disaster_type": analysis.disaster_type or "Unknown",
+        "severity": analysis.severity or "Low",
+        "description": analysis.description or "No specific information available",
+        "actions": analysis.actions or "Stay alert and follow local news"
+    }
+
+# Function to parse a batched JSON disaster analysis
+def parse_batch_disaster_json(text: str) -> list:
+    """
+    Validate a batched JSON analysis against BatchDisasterAnalysis
+    Returns one dict per verdict (same keys as parse_disaster_json plus
+    "location"). Raises OutputParserException like parse_disaster_json
+    """
+    analysis = _get_parser("batch_disaster_parser").parse(text)
+    return [{
+        "location": verdict.location,
+        "disaster_found": verdict.disaster_found,
+        "disaster_type": verdict.disaster_type or "Unknown",
+        "severity": verdict.severity or "Low",
+        "description": verdict.description or "No specific information available",
+        "actions": verdict.actions or "Stay alert and follow local news"
+    } for verdict in analysis.verdicts]
 
 # Function to parse disaster analysis text
 def parse_disaster_text(text: str) -> dict:
@@ -0,0 +1,131 @@
+import threading
+import time
+from typing import Dict, Mapping, Optional, Tuple
+
+
+class _Bucket:
+    """Rate-limit state for one Discord bucket"""
+
+    def __init__(self):
+        self.limit: Optional[int] = None
+        self.remaining: Optional[int] = None
+        self.reset_at = 0.0  # time.monotonic() when the bucket refills
+        self.window = 0.0  # length of the last reset window (seconds)
+
+
+class DiscordRateLimiter:
+    """
+    DISCORD RATE LIMITER: Token bucket fed by Discord's rate-limit headers
+    Shared by every AlertSender in the process. Before each post we take a
+    token from the webhook's bucket (waiting for the reset if it is empty);
+    after each response we resync from X-RateLimit-* headers, so bursts go
+    out as fast as Discord allows without tripping a 429.
+    Bucket state is keyed by (X-RateLimit-Bucket, webhook URL): Discord's
+    bucket hash leaves out the webhook id, so two webhooks reporting the
+    same hash still have separate limits.
+    """
+
+    def __init__(self):
+        self._buckets: Dict[Tuple[str, str], _Bucket] = {}
+        self._bucket_ids: Dict[str, str] = {}  # webhook URL → X-RateLimit-Bucket
+        self._global_reset_at = 0.0
+        self._lock = threading.Lock()
+        self._stats = {'acquired': 0, 'waits': 0, 'seconds_waited': 0.0, 'rate_limited': 0}
+
+    def _bucket_for(self, key: str) -> _Bucket:
+        state_key = (self._bucket_ids.get(key, ""), key)
+        bucket = self._buckets.get(state_key)
+        if bucket is None:
+            bucket = self._buckets[state_key] = _Bucket()
+        return bucket
+
+    def acquire(self, key: str) -> float:
+        """
+        Take one request slot for this webhook, sleeping until the bucket
+        resets if needed
+
+        Returns:
+            Seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                bucket = self._bucket_for(key)
+                if bucket.reset_at <= now and bucket.limit is not None:
+                    # Window passed: assume a full bucket until headers say otherwise
+                    bucket.remaining = bucket.limit
+                    bucket.reset_at = now + bucket.window
+
+                wait_until = self._global_reset_at
+                if bucket.remaining is not None and bucket.remaining <= 0:
+                    wait_until = max(wait_until, bucket.reset_at)
+
+                if wait_until <= now:
+                    if bucket.remaining is not None:
+                        bucket.remaining -= 1
+                    self._stats['acquired'] += 1
+                    if waited:
+                        self._stats['waits'] += 1
+                        self._stats['seconds_waited'] += waited
+                    return waited
+                delay = wait_until - now
+
+            time.sleep(delay)
+            waited += delay
+
+    def update(self, key: str, headers: Mapping[str, str], status_code: int):
+        """Resync a bucket from a Discord response"""
+        now = time.monotonic()
+        with self._lock:
+            bucket_id = headers.get('X-RateLimit-Bucket')
+            previous_id = self._bucket_ids.get(key, "")
+            if bucket_id and bucket_id != previous_id:
+                # Keep what we know about this webhook under its new bucket id
+                self._bucket_ids[key] = bucket_id
+                known = self._buckets.pop((previous_id, key), None)
+                if known is not None:
+                    self._buckets[(bucket_id, key)] = known
+            bucket = self._bucket_for(key)
+
+            limit = headers.get('X-RateLimit-Limit')
+            remaining = headers.get('X-RateLimit-Remaining')
+            reset_after = headers.get('X-RateLimit-Reset-After')
+            if limit is not None:
+                bucket.limit = int(limit)
+            if remaining is not None:
+                bucket.remaining = int(remaining)
+            if reset_after is not None:
+                bucket.window = float(reset_after)
+                bucket.reset_at = now + bucket.window
+
+            if status_code == 429:
+                self._stats['rate_limited'] += 1
+                retry_after = float(headers.get('Retry-After', reset_after or 1))
+                if headers.get('X-RateLimit-Global', '').lower() == 'true' \
+                        or headers.get('X-RateLimit-Scope') == 'global':
+                    self._global_reset_at = now + retry_after
+                else:
+                    bucket.remaining = 0
+                    bucket.reset_at = max(bucket.reset_at, now + retry_after)
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            stats = dict(self._stats)
+            stats['seconds_waited'] = round(stats['seconds_waited'], 3)
+            stats['buckets'] = len(self._buckets)
+        return stats
+
+
+_limiter: Optional[DiscordRateLimiter] = None
+_limiter_lock = threading.Lock()
+
+
+def get_discord_rate_limiter() -> DiscordRateLimiter:
+    """Process-wide Discord rate limiter"""
+    global _limiter
+    if _limiter is None:
+        with _limiter_lock:
+            if _limiter is None:
+                _limiter = DiscordRateLimiter()
+    return _limiter
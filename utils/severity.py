@@ -0,0 +1,3 @@
+# Severity levels in increasing order, shared by alert message generation
+# and Discord delivery (digest bypass, embed colors)
+SEVERITY_RANK = {"low": 1, "medium": 2, "high": 3, "critical": 4}
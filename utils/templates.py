@@ -1,36 +1,81 @@
-from langchain_core.prompts import PromptTemplate
-
 # TEMPLATE: Instructions for the AI (like a fill-in-the-blank form)
 # This template tells the AI how to analyze news for disasters
+# Bump the version whenever the wording changes so cached analyses are dropped
+NEWS_ANALYSIS_PROMPT_VERSION = "2"
 
-NEWS_ANALYSIS_TEMPLATE = PromptTemplate(
-    input_variables=["news_data", "user_location"],
-    template="""
+NEWS_ANALYSIS_PROMPT = """
     You are a disaster monitoring AI assistant. Analyze the following news data and determine if there are any disasters or emergencies relevant to the user's location.
 
     User Location: {user_location}
     News Data: {news_data}
 
     Please analyze and respond with:
-    1. Is there any disaster/emergency near the user's location? (Yes/No)
+    1. Is there any disaster/emergency near the user's location? (true/false)
+    2. Type of disaster (if any)
+    3. Severity level (Low/Medium/High)
+    4. Brief description
+    5. Recommended actions
+
+    Respond with a single JSON object and nothing else, using exactly these keys:
+    {{
+        "disaster_found": true or false,
+        "disaster_type": "type of disaster, or null",
+        "severity": "Low, Medium or High, or null",
+        "description": "brief description, or null",
+        "actions": "recommended actions, or null"
+    }}
+    """
+
+# TEMPLATE: Asks the AI to fix an analysis that did not match the JSON format
+NEWS_ANALYSIS_REPAIR_PROMPT = """
+    Your previous answer could not be read as the required JSON object.
+
+    Previous answer:
+    {analysis}
+
+    Problem: {error}
+
+    Rewrite it as a single JSON object and nothing else, using exactly these keys:
+    {{
+        "disaster_found": true or false,
+        "disaster_type": "type of disaster, or null",
+        "severity": "Low, Medium or High, or null",
+        "description": "brief description, or null",
+        "actions": "recommended actions, or null"
+    }}
+    """
+
+# TEMPLATE: Analyzes the news of several locations in one request
+# (one verdict per location, same fields as NEWS_ANALYSIS_PROMPT)
+NEWS_BATCH_ANALYSIS_PROMPT = """
+    You are a disaster monitoring AI assistant. Below is recent news for several locations. For each location, analyze only its own news and determine if there are any disasters or emergencies relevant to that location.
+
+    {locations_news}
+
+    For every location listed above, give:
+    1. Is there any disaster/emergency near the location? (true/false)
     2. Type of disaster (if any)
     3. Severity level (Low/Medium/High)
     4. Brief description
     5. Recommended actions
 
-    Format your response as:
-    DISASTER_FOUND: [Yes/No]
-    DISASTER_TYPE: [type]
-    SEVERITY: [level]
-    DESCRIPTION: [brief description]
-    ACTIONS: [recommended actions]
+    Respond with a single JSON object and nothing else, with one verdict per location, in the same order, using exactly these keys:
+    {{
+        "verdicts": [
+            {{
+                "location": "the location exactly as written above",
+                "disaster_found": true or false,
+                "disaster_type": "type of disaster, or null",
+                "severity": "Low, Medium or High, or null",
+                "description": "brief description, or null",
+                "actions": "recommended actions, or null"
+            }}
+        ]
+    }}
     """
-)
 
 # TEMPLATE: For generating alert messages
-ALERT_TEMPLATE = PromptTemplate(
-    input_variables=["disaster_type", "location", "severity", "description"],
-    template="""
+ALERT_PROMPT = """
     🚨 DISASTER ALERT 🚨
     
     Type: {disaster_type}
@@ -41,12 +86,9 @@ ALERT_TEMPLATE = PromptTemplate(
     
     Stay safe and follow local authorities' guidance!
     """
-)
 
 # TEMPLATE: For chatbot responses
-CHAT_TEMPLATE = PromptTemplate(
-    input_variables=["user_question", "context"],
-    template="""
+CHAT_PROMPT = """
     You are a helpful disaster response assistant. Answer the user's question based on the context provided.
     
     Context: {context}
@@ -56,4 +98,26 @@ CHAT_TEMPLATE = PromptTemplate(
     
     Response:
     """
-)
+
+# PromptTemplate objects (NEWS_ANALYSIS_TEMPLATE, ...) are built on first
+# access so importing this module does not pull in LangChain
+_TEMPLATE_VARIABLES = {
+    "NEWS_ANALYSIS": ["news_data", "user_location"],
+    "NEWS_ANALYSIS_REPAIR": ["analysis", "error"],
+    "NEWS_BATCH_ANALYSIS": ["locations_news"],
+    "ALERT": ["disaster_type", "location", "severity", "description"],
+    "CHAT": ["user_question", "context"],
+}
+
+
+def __getattr__(name):
+    prefix = name[:-len("_TEMPLATE")] if name.endswith("_TEMPLATE") else None
+    if prefix in _TEMPLATE_VARIABLES:
+        from langchain_core.prompts import PromptTemplate
+        template = PromptTemplate(
+            input_variables=_TEMPLATE_VARIABLES[prefix],
+            template=globals()[f"{prefix}_PROMPT"]
+        )
+        globals()[name] = template
+        return template
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,24 @@
+import re
+
+_WORDS = re.compile(r"\w+|[^\w\s]")
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Cheap token estimate for Llama-style tokenizers (no tokenizer download)
+    Counts words and punctuation, with long words costing extra pieces;
+    close enough for budgeting prompts
+    """
+    if not text:
+        return 0
+    return sum(1 + len(piece) // 6 for piece in _WORDS.findall(text))
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Cut text after roughly max_tokens tokens (by estimate_tokens)"""
+    used = 0
+    for match in _WORDS.finditer(text):
+        used += 1 + len(match.group()) // 6
+        if used > max_tokens:
+            return text[:match.start()].rstrip() + "…"
+    return text
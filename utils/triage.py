@@ -0,0 +1,139 @@
+import re
+from typing import Dict, Iterable, List, Optional
+
+# Extra ways the news names each hazard (matched as word prefixes)
+HAZARD_SYNONYMS = {
+    "earthquake": ["quake", "tremor", "aftershock", "seismic", "magnitude"],
+    "flood": ["flooding", "flash flood", "inundat", "deluge", "storm surge", "overflow",
+              "burst its banks", "bursts its banks", "burst banks", "bursts banks"],
+    "hurricane": ["typhoon", "tropical storm", "storm"],
+    "tornado": ["twister", "funnel cloud"],
+    "wildfire": ["bushfire", "forest fire", "brush fire", "blaze", "fire"],
+    "tsunami": ["tidal wave"],
+    "cyclone": ["cyclonic"],
+    "landslide": ["mudslide", "rockslide", "avalanche"],
+    "severe weather": ["weather warning", "weather alert", "extreme weather"],
+    "volcano": ["volcanic", "erupt", "lava", "ash cloud"],
+    "heat wave": ["heatwave", "extreme heat"],
+    "blizzard": ["snowstorm", "winter storm", "ice storm"],
+    "explosion": ["explod", "blast"],
+    "collapse": ["collaps"],
+    "outbreak": ["epidemic", "pandemic", "cholera"],
+    "disaster": ["catastroph"],
+    "evacuation": ["evacuat", "shelter in place"],
+    "rescue": ["rescuer", "search and rescue"],
+    "relief": ["humanitarian"]
+}
+
+# Hazards the news search does not query for that triage must still pass
+# on to the LLM
+EXTRA_HAZARD_KEYWORDS = [
+    "state of emergency", "severe weather", "warning", "volcano", "heat wave",
+    "blizzard", "explosion", "collapse", "outbreak", "drought"
+]
+
+# Keywords that on their own rarely mean an active hazard count for less
+GENERIC_KEYWORDS = {"emergency", "disaster", "evacuation", "rescue", "relief", "aid", "warning"}
+GENERIC_WEIGHT = 0.5
+
+# A hazard mention is ignored only when one of these comes directly before
+# it in the same clause ("no tsunami threat", "ruled out an earthquake")
+NEGATION_CUES = ["no", "not", "without", "false", "unfounded", "denied", "rules out", "ruled out"]
+# Words skipped between the cue and the hazard ("not an earthquake")
+DETERMINERS = {"a", "an", "the", "any"}
+# These in the same clause only lower a mention's weight ("earthquake drill",
+# "flood warning lifted"): triage must err toward asking the LLM
+DAMPENING_CONTEXT = [
+    "drill", "exercise", "simulation", "anniversary", "years ago", "false alarm",
+    "hoax", "lifted", "cancelled", "canceled", "all clear", "preparedness"
+]
+DAMPENED_WEIGHT = 0.5
+
+_METADATA_LINE = re.compile(r"^\s*(Source|Search Engine):.*$", re.MULTILINE | re.IGNORECASE)
+# Clauses end at punctuation or a contrasting conjunction ("..., but ...")
+_CLAUSE_BREAK = re.compile(r"[.!?;:,\n]+|\s+(?:but|while|although|however|yet)\s+", re.IGNORECASE)
+_WORD = re.compile(r"\w+")
+
+
+def _alternation(terms: Iterable[str]) -> str:
+    # Longest first so "flash flood" wins over "flood"
+    return "|".join(re.escape(term) for term in sorted(set(terms), key=len, reverse=True))
+
+
+class KeywordTriage:
+    """
+    KEYWORD TRIAGE: Cheap hazard check before the analysis LLM call
+    One compiled regex matches DISASTER_KEYWORDS, the extra hazards and
+    their synonyms in the article titles and snippets. Each mention adds its keyword's weight,
+    unless a cue directly before it negates it ("no tsunami"); words like
+    "drill" or "lifted" in the same clause only halve the weight. News that
+    stays below the threshold cannot be about an active disaster, so the
+    70B model is not asked
+    """
+
+    def __init__(self, keywords: Iterable[str], threshold: float = 1.0,
+                 synonyms: Optional[Dict[str, List[str]]] = None):
+        self.threshold = threshold
+        synonyms = HAZARD_SYNONYMS if synonyms is None else synonyms
+
+        # Every matchable term → the keyword it counts as
+        self._term_keyword: Dict[str, str] = {}
+        for keyword in list(keywords) + EXTRA_HAZARD_KEYWORDS:
+            keyword = keyword.lower()
+            self._term_keyword[keyword] = keyword
+            for synonym in synonyms.get(keyword, []):
+                self._term_keyword.setdefault(synonym.lower(), keyword)
+
+        self._pattern = re.compile(rf"\b({_alternation(self._term_keyword)})\w*", re.IGNORECASE)
+        self._negation_cues = [tuple(cue.split()) for cue in NEGATION_CUES]
+        self._dampening_context = re.compile(rf"\b({_alternation(DAMPENING_CONTEXT)})\b", re.IGNORECASE)
+
+    def _keyword_for(self, matched: str) -> str:
+        term = matched.lower()
+        while term and term not in self._term_keyword:
+            term = term[:-1]
+        return self._term_keyword.get(term, matched.lower())
+
+    def _negated(self, clause: str, start: int) -> bool:
+        """Whether a negation cue comes directly before the hazard (determiners skipped)"""
+        before = [word.lower() for word in _WORD.findall(clause[:start])]
+        while before and before[-1] in DETERMINERS:
+            before.pop()
+        return any(tuple(before[-len(cue):]) == cue for cue in self._negation_cues)
+
+    def score(self, news_data: str) -> Dict:
+        """
+        Score formatted news (or any article text)
+
+        Returns:
+            {"score", "passed", "matches": {keyword: count}, "negated": count,
+             "dampened": count}
+        """
+        text = _METADATA_LINE.sub("", news_data or "")
+        score = 0.0
+        matches: Dict[str, int] = {}
+        negated = dampened = 0
+
+        for clause in _CLAUSE_BREAK.split(text):
+            if not clause or not clause.strip():
+                continue
+            dampen = bool(self._dampening_context.search(clause))
+            for match in self._pattern.finditer(clause):
+                if self._negated(clause, match.start()):
+                    negated += 1
+                    continue
+                keyword = self._keyword_for(match.group(1))
+                matches[keyword] = matches.get(keyword, 0) + 1
+                weight = GENERIC_WEIGHT if keyword in GENERIC_KEYWORDS else 1.0
+                if dampen:
+                    weight *= DAMPENED_WEIGHT
+                    dampened += 1
+                score += weight
+
+        return {
+            "score": score,
+            "passed": score >= self.threshold,
+            "matches": matches,
+            "negated": negated,
+            "dampened": dampened
+        }